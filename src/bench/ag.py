@@ -0,0 +1,70 @@
+'''
+Benchmark de generaciones por segundo del algoritmo genético de Approx.py.
+
+Además de las generaciones completas, mide la evaluación de fitness de la población vectorizada
+(una sola operación sobre la matriz de la población) frente a un ciclo de Python por individuo y arista.
+
+Language: Python 3
+### Running: python3 bench/ag.py -inst data/as-22july06.graph -time 10 -tp 50 100 200
+'''
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+import time
+
+import numpy
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'code'))
+
+import Approx  # noqa: E402
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data')
+
+
+def aptitud_por_individuo(poblacion, u, v, penalizacion=2):
+    '''
+    Fitness calculado individuo por individuo con un ciclo de Python sobre las aristas (referencia)
+    '''
+    aptitud = []
+    for individuo in poblacion.tolist():
+        descubiertas = 0
+        for a, b in zip(u.tolist(), v.tolist()):
+            if not individuo[a] and not individuo[b]:
+                descubiertas += 1
+        aptitud.append(sum(individuo) + penalizacion * descubiertas)
+    return aptitud
+
+
+def main(inst, cutoff, tamanos, seed):
+    num_vertices, u, v = Approx.leer_grafo(inst)
+    print('%s: %i vertices, %i aristas' % (os.path.basename(inst), num_vertices, len(u)))
+    print('%6s %12s %12s %14s %14s' % ('tp', 'generaciones', 'gen/s', 'fitness vect.', 'fitness ciclo'))
+    for tamano in tamanos:
+        rng = numpy.random.default_rng(seed)
+        with contextlib.redirect_stdout(io.StringIO()):
+            inicio = time.time()
+            poblacion, aptitud, cobertura, times, generaciones = Approx.algoritmo_genetico(
+                num_vertices, u, v, tamano, None, 0.5, 0.8, rng, cutoff=cutoff)
+            duracion = time.time() - inicio
+
+        inicio = time.time()
+        Approx.evaluar_aptitud(poblacion, u, v)
+        vectorizada = time.time() - inicio
+        inicio = time.time()
+        aptitud_por_individuo(poblacion[:2], u, v)
+        ciclo = (time.time() - inicio) * tamano / 2
+
+        print('%6i %12i %12.2f %13.4fs %13.4fs' % (tamano, generaciones, generaciones / duracion, vectorizada, ciclo))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark de generaciones por segundo del algoritmo genético')
+    parser.add_argument('-inst', default=os.path.join(DATA_DIR, 'as-22july06.graph'), help='Archivo de Grafo')
+    parser.add_argument('-time', type=float, default=10, help='Tiempo por corrida (segundos)')
+    parser.add_argument('-tp', nargs='+', type=int, default=[50, 100, 200], help='Tamaños de población')
+    parser.add_argument('-seed', type=int, default=1045, help='Semilla')
+    args = parser.parse_args()
+    main(args.inst, args.time, args.tp, args.seed)
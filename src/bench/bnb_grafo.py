@@ -0,0 +1,55 @@
+'''
+Benchmark de nodos explorados por segundo: BnB sobre el Grafo CSR frente al BnB original sobre networkx
+y al modo de conjuntos de bits (bitset.BnB_bits).
+
+Language: Python 3
+### Running: python3 bench/bnb_grafo.py -time 10 -inst data/karate.graph data/hep-th.graph
+'''
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'code'))
+
+import BnB  # noqa: E402
+import bitset  # noqa: E402
+import legacy  # noqa: E402
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data')
+INSTANCIAS = ['karate', 'football', 'jazz', 'email', 'hep-th', 'as-22july06']
+
+
+def medir(solver, G, cutoff):
+    '''
+    Ejecuta un solver durante cutoff segundos y devuelve (nodos, tiempo, tamaño de la mejor cobertura)
+    '''
+    stats = {}
+    with contextlib.redirect_stdout(io.StringIO()):
+        OptVC, times = solver(G, cutoff, stats)
+    mejor = times[-1][0] if times else None
+    return stats['nodos'], stats['tiempo'], mejor
+
+
+def main(instancias, cutoff):
+    print('%-14s %-8s %10s %8s %12s %8s' % ('instancia', 'grafo', 'nodos', 'tiempo', 'nodos/s', 'VC'))
+    for inst in instancias:
+        with contextlib.redirect_stdout(io.StringIO()):
+            G_csr = BnB.create_graph(BnB.parse(inst))
+        G_nx = legacy.create_graph(legacy.parse(inst))
+        nombre = os.path.basename(inst).split('.')[0]
+        for etiqueta, solver, G in (('networkx', legacy.BnB, G_nx), ('csr', BnB.BnB, G_csr),
+                                    ('bits', bitset.BnB_bits, G_csr)):
+            nodos, tiempo, mejor = medir(solver, G, cutoff)
+            print('%-14s %-8s %10i %8.2f %12.1f %8s' % (nombre, etiqueta, nodos, tiempo, nodos / max(tiempo, 1e-9), mejor))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark de nodos por segundo del BnB')
+    parser.add_argument('-inst', nargs='+', default=[os.path.join(DATA_DIR, i + '.graph') for i in INSTANCIAS],
+                        help='Archivos de Grafo a medir')
+    parser.add_argument('-time', type=float, default=10, help='Tiempo por corrida (segundos)')
+    args = parser.parse_args()
+    main(args.inst, args.time)
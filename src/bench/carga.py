@@ -0,0 +1,87 @@
+'''
+Benchmark de lectura de instancias: tiempo de carga y pico de memoria (RSS) de cada lector.
+
+Cada medición corre en un proceso nuevo, de modo que el pico de memoria no arrastra lecturas anteriores;
+se informa el aumento del pico de RSS durante la carga (las importaciones ya están hechas antes de medir).
+
+Lectores comparados:
+- BnB original: parse() + create_graph() sobre networkx.
+- Approx original: crear_poblacion() con listas de enteros por fila.
+- Approx previo: leer_grafo() con ciclo por fila hacia arreglos de aristas.
+- cargador: cargador.cargar() analizando el texto (CSR con numpy), sin cache.
+- cargador + Grafo: además construye el grafo.Grafo que usa BnB.
+- cache mmap: cargador.cargar() desde la cache binaria .graph.csr (se genera antes de medir).
+
+Language: Python 3
+### Running: python3 bench/carga.py -inst data/as-22july06.graph data/hep-th.graph
+'''
+
+import argparse
+import multiprocessing
+import os
+import resource
+import sys
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCH_DIR, '..', 'code'))
+
+import cargador  # noqa: E402
+import legacy  # noqa: E402
+from grafo import Grafo  # noqa: E402
+
+DATA_DIR = os.path.join(BENCH_DIR, '..', 'data')
+INSTANCIAS = ['as-22july06', 'hep-th']
+
+LECTORES = {
+    'BnB original': lambda archivo: legacy.create_graph(legacy.parse(archivo)),
+    'Approx original': legacy.crear_poblacion,
+    'Approx previo': legacy.leer_grafo,
+    'cargador': lambda archivo: cargador.cargar(archivo, cache=False),
+    'cargador + Grafo': lambda archivo: Grafo.desde_csr(cargador.cargar(archivo, cache=False)),
+    'cache mmap': cargador.cargar,
+}
+
+
+def _medir(nombre, archivo, conexion):
+    antes = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    inicio = time.perf_counter()
+    resultado = LECTORES[nombre](archivo)
+    duracion = time.perf_counter() - inicio
+    despues = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    del resultado
+    # ru_maxrss está en KiB en Linux
+    conexion.send((duracion, (despues - antes) / 1024, despues / 1024))
+    conexion.close()
+
+
+def medir(nombre, archivo):
+    '''
+    Devuelve (segundos, aumento del pico de RSS en MiB, pico total en MiB) de un lector en un proceso nuevo
+    '''
+    recibir, enviar = multiprocessing.Pipe(duplex=False)
+    proceso = multiprocessing.Process(target=_medir, args=(nombre, archivo, enviar))
+    proceso.start()
+    resultado = recibir.recv()
+    proceso.join()
+    return resultado
+
+
+def main(instancias, repeticiones):
+    print('%-14s %-18s %10s %12s %12s' % ('instancia', 'lector', 'tiempo(s)', 'dRSS(MiB)', 'RSS(MiB)'))
+    for archivo in instancias:
+        nombre_inst = os.path.basename(archivo).split('.')[0]
+        cargador.cargar(archivo)
+        for nombre in LECTORES:
+            mediciones = [medir(nombre, archivo) for i in range(repeticiones)]
+            duracion = min(m[0] for m in mediciones)
+            print('%-14s %-18s %10.4f %12.1f %12.1f' % (nombre_inst, nombre, duracion, mediciones[0][1], mediciones[0][2]))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark de lectura de instancias')
+    parser.add_argument('-inst', nargs='+', default=[os.path.join(DATA_DIR, i + '.graph') for i in INSTANCIAS],
+                        help='Archivos de Grafo a medir')
+    parser.add_argument('-r', type=int, default=3, help='Repeticiones (se informa el menor tiempo)')
+    args = parser.parse_args()
+    main(args.inst, args.r)
@@ -0,0 +1,60 @@
+'''
+Benchmark de las estrategias de búsqueda de BnB (ver code/estrategias.py): tamaño de la mejor cobertura
+encontrada a distintos tiempos del cutoff, para ver cuán rápido mejora el seguimiento en los primeros segundos.
+
+Language: Python 3
+### Running: python3 bench/estrategias.py -time 10 -inst data/jazz.graph data/as-22july06.graph
+'''
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'code'))
+
+import BnB  # noqa: E402
+import estrategias  # noqa: E402
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data')
+INSTANCIAS = ['jazz', 'email', 'netscience', 'power', 'star2', 'as-22july06']
+# (etiqueta, estrategia, cobertura inicial)
+VARIANTES = [('dfs', 'dfs', None), ('dfs+greedy', 'dfs', 'greedy'), ('dfs+ls', 'dfs', 'ls'),
+             ('lds', 'lds', None), ('mejor', 'mejor', None), ('mejor+greedy', 'mejor', 'greedy')]
+# instantes (fracciones del cutoff) en los que se informa la mejor cobertura
+FRACCIONES = [0.01, 0.1, 0.5, 1.0]
+
+
+def mejor_a(times, t):
+    '''
+    Tamaño de la mejor cobertura encontrada hasta el tiempo t (None si todavía no hay ninguna)
+    '''
+    tamanos = [size for size, instante in times if instante <= t]
+    return min(tamanos) if tamanos else None
+
+
+def main(instancias, cutoff, seed):
+    print('%-14s %-13s %9s ' % ('instancia', 'estrategia', 'nodos') +
+          ' '.join('%8s' % ('t=%gs' % (f * cutoff)) for f in FRACCIONES))
+    for inst in instancias:
+        with contextlib.redirect_stdout(io.StringIO()):
+            G = BnB.create_graph(BnB.parse(inst))
+        nombre = os.path.basename(inst).split('.')[0]
+        for etiqueta, estrategia, inicial in VARIANTES:
+            stats = {}
+            with contextlib.redirect_stdout(io.StringIO()):
+                OptVC, times = estrategias.buscar(G, cutoff, estrategia, inicial, stats, seed=seed)
+            columnas = [mejor_a(times, f * cutoff) for f in FRACCIONES]
+            print('%-14s %-13s %9i ' % (nombre, etiqueta, stats['nodos']) +
+                  ' '.join('%8s' % ('-' if c is None else c) for c in columnas))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark de las estrategias de búsqueda de BnB')
+    parser.add_argument('-inst', nargs='+', default=[os.path.join(DATA_DIR, i + '.graph') for i in INSTANCIAS],
+                        help='Archivos de Grafo a medir')
+    parser.add_argument('-time', type=float, default=10, help='Tiempo por corrida (segundos)')
+    parser.add_argument('-seed', type=int, default=0, help='Semilla de la búsqueda local de la cobertura inicial')
+    args = parser.parse_args()
+    main(args.inst, args.time, args.seed)
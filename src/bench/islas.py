@@ -0,0 +1,50 @@
+'''
+Benchmark del modelo de islas del algoritmo genético (ver code/islas.py): generaciones totales, generaciones por
+segundo y tamaño de la mejor cobertura con distinta cantidad de islas (procesos) en el mismo tiempo.
+Con un solo proceso el intervalo de migración no tiene efecto; la escala depende de los núcleos disponibles.
+
+Language: Python 3
+### Running: python3 bench/islas.py -time 10 -islas 1 2 4 -inst data/email.graph data/as-22july06.graph
+'''
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'code'))
+
+import Approx  # noqa: E402
+from islas import ag_islas  # noqa: E402
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data')
+INSTANCIAS = ['email', 'as-22july06']
+
+
+def main(instancias, cutoff, cantidades, seed, tamano, heuristicas):
+    print('%d núcleos disponibles' % os.cpu_count())
+    print('%-14s %6s %12s %10s %8s' % ('instancia', 'islas', 'generaciones', 'gen/s', 'mejor'))
+    for inst in instancias:
+        num_vertices, u, v = Approx.leer_grafo(inst)
+        semillas = Approx.coberturas_heuristicas(num_vertices, u, v) if heuristicas else None
+        nombre = os.path.basename(inst).split('.')[0]
+        for islas in cantidades:
+            inicio = time.time()
+            cobertura, times, generaciones = ag_islas(num_vertices, u, v, tamano, None, 0.5, 0.8, seed, islas,
+                                                      cutoff=cutoff, start_time=inicio, semillas=semillas)
+            total = sum(generaciones)
+            print('%-14s %6i %12i %10.1f %8i' % (nombre, islas, total, total / (time.time() - inicio),
+                                                 cobertura.sum()))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark del modelo de islas del algoritmo genético')
+    parser.add_argument('-inst', nargs='+', default=[os.path.join(DATA_DIR, i + '.graph') for i in INSTANCIAS],
+                        help='Archivos de Grafo a medir')
+    parser.add_argument('-time', type=float, default=10, help='Tiempo por corrida (segundos)')
+    parser.add_argument('-islas', type=int, nargs='+', default=[1, 2, 4], help='Cantidades de islas a medir')
+    parser.add_argument('-seed', type=int, default=0, help='Semilla del generador aleatorio')
+    parser.add_argument('-tp', type=int, default=100, help='Tamaño de la población de cada isla')
+    parser.add_argument('-heuristicas', action='store_true', help='Sembrar las poblaciones con heuristicas.py')
+    args = parser.parse_args()
+    main(args.inst, args.time, args.islas, args.seed, args.tp, args.heuristicas)
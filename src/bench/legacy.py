@@ -0,0 +1,144 @@
+'''
+Implementaciones originales (basadas en networkx) conservadas como referencia para los benchmarks.
+
+No se utilizan en los solvers; sólo sirven para comparar el rendimiento de las versiones actuales
+contra el código tal como estaba antes de cada optimización.
+
+Language: Python 3
+'''
+
+import operator
+import time
+
+import networkx as nx
+
+
+def parse(datafile):
+    '''
+    Lectura original del archivo de entrada: lista de objetos map perezosos
+    '''
+    adj_list = []
+    with open(datafile) as f:
+        num_vertices, num_edges, weighted = map(int, f.readline().split())
+        for i in range(num_vertices):
+            adj_list.append(map(int, f.readline().split()))
+    return adj_list
+
+
+def create_graph(adj_list):
+    '''
+    Creación original del Grafo networkx a partir de la lista de adyacencia
+    '''
+    G = nx.Graph()
+    for i in range(len(adj_list)):
+        for j in adj_list[i]:
+            G.add_edge(i + 1, j)
+    return G
+
+
+def find_maxdeg(g):
+    deglist = g.degree()
+    deglist_sorted = sorted(deglist, reverse=True, key=operator.itemgetter(1))
+    return deglist_sorted[0]
+
+
+def Lowerbound(graph):
+    lb = graph.number_of_edges() / find_maxdeg(graph)[1]
+    return int(lb) + 1 if lb > int(lb) else int(lb)
+
+
+def BnB(G, T, estadisticas=None):
+    '''
+    Branch and Bound original sobre networkx (sin impresiones), con contador de nodos explorados
+    '''
+    start_time = time.time()
+    delta_time = 0
+    times = []
+    OptVC = []
+    CurVC = []
+    Frontier = []
+    nodos = 0
+    UpperBound = G.number_of_nodes()
+    CurG = G.copy()
+    v = find_maxdeg(CurG)
+    Frontier.append((v[0], 0, (-1, -1)))
+    Frontier.append((v[0], 1, (-1, -1)))
+
+    while Frontier != [] and delta_time < T:
+        (vi, state, parent) = Frontier.pop()
+        nodos += 1
+        backtrack = False
+        if state == 0:
+            for node in list(CurG.neighbors(vi)):
+                CurVC.append((node, 1))
+                CurG.remove_node(node)
+        elif state == 1:
+            CurG.remove_node(vi)
+        CurVC.append((vi, state))
+        CurVC_size = sum(element[1] for element in CurVC)
+
+        if CurG.number_of_edges() == 0:
+            if CurVC_size < UpperBound:
+                OptVC = CurVC.copy()
+                UpperBound = CurVC_size
+                times.append((CurVC_size, time.time() - start_time))
+            backtrack = True
+        else:
+            CurLB = Lowerbound(CurG) + CurVC_size
+            if CurLB < UpperBound:
+                vj = find_maxdeg(CurG)
+                Frontier.append((vj[0], 0, (vi, state)))
+                Frontier.append((vj[0], 1, (vi, state)))
+            else:
+                backtrack = True
+
+        if backtrack and Frontier != []:
+            nextnode_parent = Frontier[-1][2]
+            if nextnode_parent in CurVC:
+                id = CurVC.index(nextnode_parent) + 1
+                while id < len(CurVC):
+                    mynode, mystate = CurVC.pop()
+                    CurG.add_node(mynode)
+                    curVC_nodes = list(map(lambda t: t[0], CurVC))
+                    for nd in G.neighbors(mynode):
+                        if (nd in CurG.nodes()) and (nd not in curVC_nodes):
+                            CurG.add_edge(nd, mynode)
+            elif nextnode_parent == (-1, -1):
+                CurVC.clear()
+                CurG = G.copy()
+
+        delta_time = time.time() - start_time
+
+    if estadisticas is not None:
+        estadisticas['nodos'] = nodos
+        estadisticas['tiempo'] = delta_time
+    return OptVC, times
+
+
+def crear_poblacion(archivo):
+    '''
+    Lectura original de Approx.py: listas de enteros por fila
+    '''
+    adj_list = []
+    with open(archivo) as f:
+        num_vertices, num_edges, weighted = map(int, f.readline().split())
+        for i in range(num_vertices):
+            adj_list.append(list(map(int, f.readline().split())))
+    return adj_list
+
+
+def leer_grafo(archivo):
+    '''
+    Lectura de Approx.py previa al cargador compartido: ciclo por fila armando los extremos de aristas
+    '''
+    import numpy
+    u = []
+    v = []
+    with open(archivo) as f:
+        num_vertices, num_edges, weighted = map(int, f.readline().split())
+        for i in range(num_vertices):
+            for j in map(int, f.readline().split()):
+                if i + 1 < j:
+                    u.append(i)
+                    v.append(j - 1)
+    return num_vertices, numpy.array(u, dtype=numpy.int64), numpy.array(v, dtype=numpy.int64)
@@ -0,0 +1,52 @@
+'''
+Benchmark de escalabilidad del BnB en paralelo con 1, 2, 4 y 8 procesos.
+
+Para cada instancia y cantidad de procesos se informa el mejor tamaño de cobertura, el tiempo en que se encontró,
+los nodos explorados y los nodos por segundo agregados de todos los procesos.
+
+Language: Python 3
+### Running: python3 bench/paralelo.py -time 60 -workers 1 2 4 8
+'''
+
+import argparse
+import contextlib
+import io
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'code'))
+
+import BnB  # noqa: E402
+from paralelo import BnB_paralelo  # noqa: E402
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data')
+INSTANCIAS = ['jazz', 'email', 'delaunay_n10']
+
+
+def main(instancias, cutoff, lista_workers, cotas):
+    print('%-14s %8s %8s %10s %12s %12s' % ('instancia', 'workers', 'VC', 't_mejor', 'nodos', 'nodos/s'))
+    for inst in instancias:
+        with contextlib.redirect_stdout(io.StringIO()):
+            G = BnB.create_graph(BnB.parse(inst))
+        nombre = os.path.basename(inst).split('.')[0]
+        for workers in lista_workers:
+            estadisticas = {}
+            with contextlib.redirect_stdout(io.StringIO()):
+                if workers == 1:
+                    OptVC, times = BnB.BnB(G, cutoff, estadisticas, cotas=cotas)
+                else:
+                    OptVC, times = BnB_paralelo(G, cutoff, workers, estadisticas, cotas=cotas)
+            size, t_mejor = times[-1] if times else (None, float('nan'))
+            print('%-14s %8i %8s %10.2f %12i %12.1f' % (nombre, workers, size, t_mejor, estadisticas['nodos'],
+                                                       estadisticas['nodos'] / max(estadisticas['tiempo'], 1e-9)))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Benchmark de escalabilidad del BnB en paralelo')
+    parser.add_argument('-inst', nargs='+', default=[os.path.join(DATA_DIR, i + '.graph') for i in INSTANCIAS],
+                        help='Archivos de Grafo a medir')
+    parser.add_argument('-time', type=float, default=60, help='Tiempo por corrida (segundos)')
+    parser.add_argument('-workers', nargs='+', type=int, default=[1, 2, 4, 8], help='Cantidades de procesos')
+    parser.add_argument('-lb', default='maxdeg', help='Cotas inferiores (ver BnB.py -lb)')
+    args = parser.parse_args()
+    main(args.inst, args.time, args.workers, args.lb)
@@ -0,0 +1,287 @@
+'''
+Suite de benchmarks y control de regresiones de los solvers sobre las instancias de src/data.
+
+Cada combinación instancia x algoritmo x semilla se ejecuta en un proceso nuevo (con el mismo comando que arma
+code/ejecutar.py) y de su salida se obtienen:
+- tiempo_primera: momento de la primera cobertura (primera fila del .trace).
+- tiempo_mejor: momento de la mejor cobertura (última fila del .trace).
+- tamano: tamaño de la cobertura final (.sol).
+- trabajo: nodos explorados (BnB), generaciones (Approx), pasos (LS1, LS2) o heurísticas ejecutadas (Greedy),
+  leídos de la salida estándar.
+- rendimiento: trabajo por segundo de pared. Sólo se calcula en ejecuciones de al menos DURACION_RENDIMIENTO
+  segundos: en las más cortas (Greedy, BnB sobre grafos chicos) el tiempo de pared es casi todo arranque del
+  intérprete y carga del grafo, y el cociente mide ruido.
+- rss_mib: pico de memoria residente del proceso (os.wait4).
+Cada combinación se ejecuta -repeticiones veces y se guarda la mediana de cada métrica (el estado es el peor),
+para que una ejecución lenta aislada no parezca una regresión.
+
+Los resultados se guardan como línea base en JSON (-guardar) y, si se indica, en CSV (-csv). Con -comparar se
+contrastan contra una línea base y se marca regresión toda métrica que empeore más que la tolerancia relativa
+(-tolerancia; -tolerancia_rendimiento para el rendimiento, que varía más entre corridas) o que la línea base
+tenga y la ejecución actual no. Los tiempos además deben empeorar más de -minimo segundos, para no marcar ruido
+en tiempos ínfimos. La comparación se rechaza si la línea base se generó con otro cutoff, otras opciones u otra
+cantidad de repeticiones.
+Una combinación que no está en la línea base (p. ej. un algoritmo nuevo) también se informa como regresión, para
+que no quede fuera del control sin aviso. El proceso termina con código 1 si hubo alguna regresión.
+
+Language: Python 3
+### Running: python3 bench/suite.py -time 10 -guardar bench/linea_base.json
+### Running: python3 bench/suite.py -time 10 -comparar bench/linea_base.json -tolerancia 0.1
+'''
+
+import argparse
+import csv
+import glob
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCH_DIR, '..', 'code'))
+
+import ejecutar  # noqa: E402
+from salida import leer_sol, leer_trace  # noqa: E402
+
+DATA_DIR = os.path.join(BENCH_DIR, '..', 'data')
+SEMILLAS = [1045]
+# segundos de pared mínimos de una ejecución para calcular su rendimiento
+DURACION_RENDIMIENTO = 3.0
+
+# métrica -> True si un valor menor es mejor
+METRICAS = {
+    'tiempo_primera': True,
+    'tiempo_mejor': True,
+    'tamano': True,
+    'rss_mib': True,
+    'rendimiento': False,
+}
+TIEMPOS = ('tiempo_primera', 'tiempo_mejor')
+CAMPOS = ['inst', 'alg', 'seed', 'cutoff', 'estado', 'segundos', 'tiempo_primera', 'tiempo_mejor', 'tamano',
+          'trabajo', 'rendimiento', 'rss_mib']
+
+PATRONES_TRABAJO = {
+    'BnB': re.compile(r'^Nodos explorados: (\d+)', re.M),
+    'Approx': re.compile(r'^GENERACIONES: (\d+)', re.M),
+    'LS1': re.compile(r'^Pasos: (\d+)', re.M),
+    'LS2': re.compile(r'^Pasos: (\d+)', re.M),
+    'Greedy': re.compile(r'^Heuristicas: (\d+)', re.M),
+}
+# Approx con -islas informa las generaciones de todas las islas en una línea
+PATRON_ISLAS = re.compile(r'^GENERACIONES POR ISLA: \[([\d, ]*)\]', re.M)
+
+
+def clave(r):
+    return '%s/%s/%s' % (r['inst'], r['alg'], r['seed'])
+
+
+def trabajo_realizado(alg, texto):
+    '''
+    Suma las unidades de trabajo informadas por el solver (Approx informa una línea por corrida,
+    después del encabezado 'EJECUCION N°', o una sola línea con las generaciones de cada isla)
+    '''
+    if alg == 'Approx':
+        islas = PATRON_ISLAS.search(texto)
+        if islas:
+            return sum(int(x) for x in islas.group(1).replace(',', ' ').split())
+        texto = texto.partition('EJECUCION N°')[2]
+    valores = PATRONES_TRABAJO[alg].findall(texto)
+    return sum(int(x) for x in valores) if valores else None
+
+
+def correr(trabajo, salida, margen):
+    '''
+    Ejecuta un trabajo en un proceso nuevo y devuelve sus métricas
+    '''
+    inicio = time.time()
+    proc = subprocess.Popen(ejecutar.comando(trabajo, salida), stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                            start_new_session=True)
+    limite = trabajo.cutoff + margen
+    texto = []
+    estado = 'ok'
+    rss = None
+    # se espera con os.wait4 para obtener el uso de recursos del hijo; la salida se lee en bloques para no
+    # llenar el pipe y el límite se controla por el tiempo de pared
+    os.set_blocking(proc.stdout.fileno(), False)
+    while True:
+        pid, status, uso = os.wait4(proc.pid, os.WNOHANG)
+        bloque = proc.stdout.read()
+        if bloque:
+            texto.append(bloque)
+        if pid:
+            proc.returncode = os.waitstatus_to_exitcode(status)
+            # ru_maxrss está en KiB en Linux
+            rss = uso.ru_maxrss / 1024
+            break
+        if time.time() - inicio > limite:
+            ejecutar.detener(proc)
+            estado = 'timeout'
+            break
+        time.sleep(0.01)
+    segundos = time.time() - inicio
+    if estado == 'ok' and proc.returncode != 0:
+        estado = 'error'
+    texto = b''.join(texto).decode(errors='replace')
+
+    r = {'inst': os.path.basename(trabajo.inst).split('.')[0], 'alg': trabajo.alg, 'seed': trabajo.seed,
+         'cutoff': trabajo.cutoff, 'estado': estado, 'segundos': round(segundos, 2), 'tiempo_primera': None,
+         'tiempo_mejor': None, 'tamano': None, 'trabajo': trabajo_realizado(trabajo.alg, texto),
+         'rendimiento': None, 'rss_mib': None if rss is None else round(rss, 1)}
+    base = ejecutar.nombre(trabajo, salida)
+    if estado == 'ok':
+        trace = leer_trace(base + '.trace')
+        if trace:
+            r['tiempo_primera'] = trace[0][0]
+            r['tiempo_mejor'] = trace[-1][0]
+        r['tamano'] = leer_sol(base + '.sol')[0]
+        if r['trabajo'] is None:
+            print('AVISO: %s no informó su trabajo realizado' % clave(r), file=sys.stderr)
+    if r['trabajo'] is not None and segundos >= DURACION_RENDIMIENTO:
+        r['rendimiento'] = round(r['trabajo'] / segundos, 1)
+    return r
+
+
+def mediana(valores):
+    valores = sorted(valores)
+    medio = len(valores) // 2
+    return valores[medio] if len(valores) % 2 else (valores[medio - 1] + valores[medio]) / 2
+
+
+def combinar(repeticiones):
+    '''
+    Resultado de varias ejecuciones del mismo trabajo: el peor estado y la mediana de cada métrica numérica
+    (entre las ejecuciones que la informaron)
+    '''
+    r = dict(repeticiones[0])
+    fallidas = [x['estado'] for x in repeticiones if x['estado'] != 'ok']
+    r['estado'] = fallidas[0] if fallidas else 'ok'
+    for campo in ('segundos', 'tiempo_primera', 'tiempo_mejor', 'tamano', 'trabajo', 'rendimiento', 'rss_mib'):
+        valores = [x[campo] for x in repeticiones if x[campo] is not None]
+        r[campo] = round(mediana(valores), 2) if valores else None
+    return r
+
+
+def diferencias_configuracion(linea_base, cutoff, opciones, repeticiones):
+    '''
+    Lista de (parámetro, valor de la línea base, valor actual) que impiden comparar con la línea base
+    '''
+    actual = {'cutoff': cutoff, 'opciones': opciones, 'repeticiones': repeticiones}
+    return [(nombre, linea_base.get(nombre), valor) for nombre, valor in actual.items()
+            if linea_base.get(nombre) != valor]
+
+
+def comparar(resultados, linea_base, tolerancia, minimo, tolerancia_rendimiento=None):
+    '''
+    Devuelve la lista de regresiones (clave, métrica, valor base, valor actual)
+    '''
+    if tolerancia_rendimiento is None:
+        tolerancia_rendimiento = tolerancia
+    base = {clave(r): r for r in linea_base['resultados']}
+    regresiones = []
+    for r in resultados:
+        anterior = base.get(clave(r))
+        if anterior is None:  # sin fila en la línea base no hay control: se informa para regenerarla
+            regresiones.append((clave(r), 'línea base', 'sin fila', r['estado']))
+            continue
+        if anterior['estado'] == 'ok' and r['estado'] != 'ok':
+            regresiones.append((clave(r), 'estado', anterior['estado'], r['estado']))
+            continue
+        for metrica, menor_mejor in METRICAS.items():
+            a, b = anterior.get(metrica), r.get(metrica)
+            if a is None:
+                continue
+            if b is None:  # la línea base la tiene: no poder medirla es una regresión del control
+                regresiones.append((clave(r), metrica, a, 'sin dato'))
+                continue
+            peor = b - a if menor_mejor else a - b
+            if peor <= (tolerancia_rendimiento if metrica == 'rendimiento' else tolerancia) * abs(a):
+                continue
+            if metrica in TIEMPOS and peor <= minimo:
+                continue
+            regresiones.append((clave(r), metrica, a, b))
+    return regresiones
+
+
+def main(instancias, algoritmos, semillas, cutoff, opciones, margen, guardar, archivo_csv, archivo_base, tolerancia,
+         minimo, tolerancia_rendimiento=None, repeticiones=1):
+    linea_base = None
+    if archivo_base:
+        with open(archivo_base) as f:
+            linea_base = json.load(f)
+        diferencias = diferencias_configuracion(linea_base, cutoff, opciones, repeticiones)
+        if diferencias:
+            print('No se puede comparar con %s, que se generó con otra configuración:' % archivo_base)
+            for nombre, anterior, actual in diferencias:
+                print('  %-12s línea base %s, actual %s' % (nombre, anterior, actual))
+            return 2
+    trabajos = ejecutar.armar_trabajos(instancias, algoritmos, semillas, [cutoff], opciones)
+    resultados = []
+    formato = '%-14s %-7s %-6s %-8s %9s %9s %8s %12s %10s %9s'
+    print(formato % ('instancia', 'alg', 'seed', 'estado', 't.prim(s)', 't.mejor(s)', 'tamaño', 'trabajo',
+                     'trabajo/s', 'RSS(MiB)'))
+    with tempfile.TemporaryDirectory() as salida:
+        for trabajo in trabajos:
+            r = combinar([correr(trabajo, salida, margen) for _ in range(repeticiones)])
+            resultados.append(r)
+            print(formato % tuple('-' if r[c] is None else r[c] for c in
+                                  ('inst', 'alg', 'seed', 'estado', 'tiempo_primera', 'tiempo_mejor', 'tamano',
+                                   'trabajo', 'rendimiento', 'rss_mib')))
+
+    datos = {'fecha': time.strftime('%Y-%m-%d %H:%M:%S'), 'cutoff': cutoff, 'opciones': opciones,
+             'repeticiones': repeticiones, 'resultados': resultados}
+    if guardar:
+        with open(guardar, 'w') as f:
+            json.dump(datos, f, indent=1)
+    if archivo_csv:
+        with open(archivo_csv, 'w', newline='') as f:
+            escritor = csv.DictWriter(f, fieldnames=CAMPOS)
+            escritor.writeheader()
+            escritor.writerows(resultados)
+
+    if linea_base is not None:
+        regresiones = comparar(resultados, linea_base, tolerancia, minimo, tolerancia_rendimiento)
+        tolerancias = 'tolerancia %.0f%%, %.0f%% en el rendimiento' % (100 * tolerancia, 100 * tolerancia_rendimiento)
+        if not regresiones:
+            print('\nSin regresiones respecto de %s (%s)' % (archivo_base, tolerancias))
+            return 0
+        print('\nREGRESIONES respecto de %s (%s):' % (archivo_base, tolerancias))
+        for k, metrica, a, b in regresiones:
+            print('  %-30s %-15s %s -> %s' % (k, metrica, a, b))
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Suite de benchmarks y control de regresiones')
+    parser.add_argument('-inst', nargs='+', default=sorted(glob.glob(os.path.join(DATA_DIR, '*.graph'))),
+                        help='Archivos de Grafo (por defecto todos los de src/data)')
+    parser.add_argument('-alg', nargs='+', default=list(ejecutar.ALGORITMOS), choices=list(ejecutar.ALGORITMOS),
+                        help='Algoritmos a medir')
+    parser.add_argument('-seed', nargs='+', default=SEMILLAS, type=int, help='Semillas fijas')
+    parser.add_argument('-time', default=10, type=int, help='Tiempo límite de cada ejecución')
+    parser.add_argument('-opciones', action='append', default=[],
+                        help='Opciones extra de un algoritmo, por ejemplo: -opciones "BnB=-kernel grado1,lp"')
+    parser.add_argument('-margen', default=60, type=float,
+                        help='Segundos de tolerancia sobre el tiempo límite antes de detener una ejecución')
+    parser.add_argument('-guardar', default=None, help='Archivo JSON donde guardar la línea base')
+    parser.add_argument('-csv', default=None, help='Archivo CSV con los resultados')
+    parser.add_argument('-comparar', default=None, help='Línea base JSON contra la cual buscar regresiones')
+    parser.add_argument('-tolerancia', default=0.1, type=float, help='Empeoramiento relativo tolerado')
+    parser.add_argument('-tolerancia_rendimiento', default=0.3, type=float,
+                        help='Empeoramiento relativo tolerado en el rendimiento (trabajo por segundo)')
+    parser.add_argument('-repeticiones', default=3, type=int,
+                        help='Ejecuciones de cada combinación; se usa la mediana de cada métrica')
+    parser.add_argument('-minimo', default=0.05, type=float,
+                        help='Empeoramiento absoluto mínimo (segundos) para marcar regresión en los tiempos')
+    args = parser.parse_args()
+    if args.repeticiones < 1:
+        parser.error('-repeticiones debe ser al menos 1')
+    try:
+        opciones = ejecutar.leer_opciones(args.opciones)
+    except ValueError as e:
+        parser.error(str(e))
+    sys.exit(main(args.inst, args.alg, args.seed, args.time, opciones, args.margen, args.guardar, args.csv,
+                  args.comparar, args.tolerancia, args.minimo, args.tolerancia_rendimiento, args.repeticiones))
@@ -29,13 +29,17 @@ La estructura del archivo sería la siguiente:
 
 Language: Python 3
 # Running: python3 code/Approx.py -inst data/karate.graph -alg Approx -time 600 -seed 100
-El valor inicial no se utilizará para la implementación de Approx.
+La semilla inicializa el generador aleatorio (numpy.random.Generator, ver azar.py) del algoritmo genético; con
+-islas cada isla usa una secuencia independiente derivada de ella. Con -g la corrida es reproducible.
 
-La salida serán dos archivos: *.sol y *.trace creados en la carpeta Output del proyecto
+La salida serán dos archivos: *.sol y *.trace creados en la carpeta output del proyecto (o en la indicada con -out)
 *.sol --- registra el tamaño de la cobertura óptima de vértices y los nodos que contiene.
 *.trace --- registrar todas las soluciones óptimas encontradas durante la búsqueda y el momento en que se encontró
 
-# Running: python3 n_reinas_ag.py -ti [tamaño individuo] -tp [tamaño poblacion] -g [generaciones] -p [pressure - opcional - default=3] -pm [porcentaje de mutacion] -pc [porcentaje de cruza]
+# Running: python3 code/Approx.py -inst [archivo] -time [cutoff] -seed [semilla] -tp [tamaño poblacion] -g [generaciones - opcional] -p [pressure - opcional - default=3] -pm [porcentaje de mutacion] -pc [porcentaje de cruza] -c [corridas]
+# Running (modelo de islas): python3 code/Approx.py -inst data/email.graph -time 600 -seed 1 -islas 4 -migracion 10 -migrantes 2
+Con -islas N se evolucionan N poblaciones en procesos separados que intercambian sus mejores individuos cada
+-migracion generaciones en un anillo (ver islas.py).
 
 # Help: python3 Approx.py --help
 
@@ -49,6 +53,8 @@ En los AG:
 
 1.Determinación del genoma:
 - Definiremos como el Grafo que representa al problema np completo Minimum Vertex cover, un Grafo "G".
+- Cada individuo es una máscara de bits sobre los vértices de G: el gen i vale 1 si el vértice i+1 está en la cobertura.
+- La población es una matriz booleana de numpy de (tamaño poblacion x cantidad de vertices).
 
 2.Determinación de la población:
 - Cantidad de individuos de la población.
@@ -60,6 +66,10 @@ En los AG:
 - Recuerde que debe medir la distancia numérica entre cada individuo y la solución buscada
 - Recuerde punificar las soluciones que violan las reglas.
 - Recuerde la condición de terminación.
+- FF = tamaño de la cobertura + penalizacion * aristas sin cubrir (menor es mejor). Se calcula para toda la
+  población a la vez a partir de los arreglos de extremos de aristas (u, v): una arista queda sin cubrir
+  si ~x[u] & ~x[v].
+- La condición de terminación es el tiempo límite (-time) o la cantidad de generaciones (-g).
 
 4.Determine la función de selección:
 - Para simplificar el algoritmo escriba sólo la selección de individuos en base a su fitness.
@@ -70,263 +80,375 @@ En los AG:
   si han sido usados para cruzarse durante esa generación.
 
 6.Determine la función de mutación:
-- Para simplificar el algoritmo, consiste sólo en el cambio a otra casilla disponible,
-  siempre que supere un umbral de XX %. Es decir, una vez determinado que un par de individuos se cruzarán,
-  se obtiene un número al azar  ntre 0 y 99, y sólo se efectúa la cruza si dicho número supera el umbral de XX.
+- Para simplificar el algoritmo, consiste sólo en invertir un gen elegido al azar (agregar o quitar un vértice),
+  siempre que supere un umbral de XX %. Es decir, una vez determinado que un individuo mutará,
+  se obtiene un número al azar  ntre 0 y 99, y sólo se efectúa la mutación si dicho número supera el umbral de XX.
 '''
 
-import random
-import numpy
-import matplotlib.pyplot as plt
 import argparse
+import os
+import time
 
+import numpy
 
-def crear_individuo(fileline):
-    """
-    Devuelve un individio a partir de una fila del archivo de entrada.
-    """
-
-    # TODO: leer fila del archivo y devolver individuo correspondiente
-    return list(map(int, fileline.readline().split()))
+import azar
+import cargador
+from heuristicas import HEURISTICAS
+from salida import DIRECTORIO_SALIDA, escribir_salida, nombre_salida
 
 
-def crear_poblacion(archivo):
+def leer_grafo(archivo):
     """
-    Devuelve una poblacion de individuos, partiendo de un archivo de entrada.
+    Devuelve (cantidad de vertices, u, v) a partir de un archivo de entrada, donde u y v son los arreglos
+    de extremos de cada arista (indices desde 0, con u < v).
     """
-    adj_list = []
-    with open(archivo) as f:
-        num_vertices, num_edges, weighted = map(int, f.readline().split())
-        for i in range(num_vertices):
-            adj_list.append(crear_individuo(f))
-    return adj_list
-
+    grafo = cargador.cargar(archivo)
+    u, v = cargador.aristas(grafo)
+    return grafo.n, u, v
 
-def evaluar_aptitud(individuo):
-    """
-Evalua la aptitud del individuo recibido como parámetro. Para este caso de n-reinas,
-    es necesario evaluar si las reinas ubicadas en el tablero se amenazan entre si.
 
-Devuelve un valor entero que corresponde al numero de amenazas para cada individuo.
+def construir_adyacencia(num_vertices, u, v):
     """
-    contDA1 = 0
-    contDA2 = 0
-    contDB1 = 0
-    contDB2 = 0
-    idoGlobal = 0
-
-    # contamos las coinsidencias en el mismo renglon
-    for i in range(0, len(individuo)):
-        # cuenta coinsidencias en el condidato por renglon
-        auxcont = individuo.count(i)
-        if auxcont > 1:  # si son mas de dos entonces se atacan
-            idoGlobal = idoGlobal + auxcont
-
-    for i in range(0, len(individuo)):
-        auxcont = 0
-        for j in range(0, i+1):
-            if individuo[j] == i-j:
-                auxcont = auxcont + 1
-        if auxcont > 1:
-            contDA1 = contDA1 + auxcont
-
-    for k in range(1, len(individuo)):
-        auxcont = 0
-        i = len(individuo) - k
-        for j in range(i, len(individuo)):
-            if individuo[j] == (len(individuo)-1) - (j-i):
-                auxcont = auxcont + 1
-        if auxcont > 1:
-            contDA2 = contDA2 + auxcont
-
-    for i in range(0, len(individuo)):
-        auxcont = 0
-        for j in range(0, len(individuo)):
-            if individuo[j] == (len(individuo)-1)-(i-j):
-                auxcont = auxcont + 1
-        if auxcont > 1:
-            contDB1 = contDB1 + auxcont
-
-    for i in range(1, len(individuo)):
-        auxcont = 0
-        for j in range(i, len(individuo)):
-            if individuo[j] == j-i:
-                auxcont = auxcont + 1
-        if auxcont > 1:
-            contDB2 = contDB2 + auxcont
-
-    # print(idoGlobal, contDA1, contDA2, contDB1, contDB2)
-    idoGlobal = idoGlobal + contDA1 + contDA2 + contDB1 + contDB2
-
-    return idoGlobal
-
-
-def calcular_fitness(individuo):
-    return evaluar_aptitud(individuo)
-
-
-def seleccion_individuos(poblacion, pressure=3):
+    Devuelve (offsets, vecinos) en formato CSR a partir de los extremos de las aristas: los vecinos del
+    vértice i son vecinos[offsets[i]:offsets[i+1]].
     """
-    Devuelve una lista de individuos seleccionados por mejor fitness, limitada por pressure.
-    """
-
-    # Calcula el fitness de cada individuo, y lo guarda en pares ordenados de la forma (5 , [1,2,1,1,4,1,8,9,4,1])
-    evaluados = [(calcular_fitness(i), i) for i in poblacion]
-
-    # Ordena los pares ordenados y se queda solo con el array de valores
-    poblacion_evaluada = [i[1] for i in sorted(evaluados)]
-
-    nueva_poblacion = [i for i in poblacion_evaluada]
-
-    # Esta linea selecciona los 'n' individuos del final, donde n viene dado por 'pressure'
-    seleccionados = numpy.copy(poblacion_evaluada[:pressure])
-
-    # Convierte a la lista en inmutable
-    seleccionados.flags.writeable = False
-
-    return nueva_poblacion, seleccionados
+    extremos = numpy.concatenate((u, v))
+    orden = numpy.argsort(extremos, kind='stable')
+    vecinos = numpy.concatenate((v, u))[orden]
+    offsets = numpy.zeros(num_vertices + 1, dtype=numpy.int64)
+    numpy.cumsum(numpy.bincount(extremos, minlength=num_vertices), out=offsets[1:])
+    return offsets, vecinos
 
 
-def cruza(poblacion, seleccionados, porcentaje_cruza, pressure=3):
+def crear_individuo(num_vertices, rng, probabilidad=0.5):
     """
-    Devuelve una nueva poblacion en la que los individuos menos aptos son cruzados
-    a partir de individuos padres mas aptos. Esta nueva poblacion se crea a partir
-    de la recibida como parametro, ademas es posible definirse la cantidad de elementos
-    aptos a seleccionar para posteriormente realizar la cruza, a partir del parametro "pressure"
+    Devuelve un individuo al azar: una máscara de bits con cada vértice incluido con la probabilidad dada.
     """
+    return rng.random(num_vertices) < probabilidad
 
-    nueva_poblacion = [i for i in poblacion]
 
-    # Cruza los individuos que fueron seleccionados como padres
-    for i in range(0, pressure):
-        # Se elige un punto para hacer el intercambio
-        punto = random.randint(1, len(seleccionados[0])-1)
-
-        # Se eligen dos padres
-        padres = seleccionados[numpy.random.choice(
-            seleccionados.shape[0], size=2, replace=False), :]
-
-        # Se mezcla el material genetico de los padres en cada nuevo individuo
-        nueva_poblacion[i][:punto] = padres[0][:punto]
-        nueva_poblacion[i][punto:] = padres[1][punto:]
-
-    # Cruza los individuos que no fueron seleccionados como padres
-    for i in range(pressure, len(nueva_poblacion)):
-        if random.random() <= porcentaje_cruza:
-            # Se elige un punto para hacer el intercambio
-            punto = random.randint(1, len(seleccionados[0])-1)
-
-            # Se eligen dos padres
-            padres = seleccionados[numpy.random.choice(
-                seleccionados.shape[0], size=2, replace=False), :]
-
-            # Se mezcla el material genetico de los padres en cada nuevo individuo
-            nueva_poblacion[i][:punto] = padres[0][:punto]
-            nueva_poblacion[i][punto:] = padres[1][punto:]
-
-    return nueva_poblacion
-
-
-def mutacion(poblacion, porcentaje_mutacion, pressure=3):
+def crear_poblacion(num_vertices, tamano, rng):
     """
-    Devuelve una nueva poblacion con los individuos de la poblacion recibida 
-    como parametro ya mutados. Se debe tener en cuenta que la mutacion es posterior 
-    a la cruza. El criterio de mutacion para el caso es el intercambio de dos genes 
-    seleccionados al azar.
-"""
-    nueva_poblacion = [i for i in poblacion]
-
-    for i in range(len(nueva_poblacion)):
-
-        # Cada individuo de la poblacion (menos los padres) tienen una probabilidad de mutar
-        if random.random() <= porcentaje_mutacion:
-
-            # Se elige un punto al azar
-            punto1 = random.randint(0, len(nueva_poblacion[0])-1)
-
-            # Se elige un valor al azar
-            valor = random.randint(0, len(nueva_poblacion[0])-1)
-
-            while nueva_poblacion[i][punto1] == valor:
-                valor = random.randint(0, len(nueva_poblacion[0])-1)
-
-            # Se aplica la mutacion
-            nueva_poblacion[i][punto1] = valor
+    Devuelve una poblacion de individuos al azar, como matriz booleana de (tamano x num_vertices).
+    """
+    poblacion = numpy.empty((tamano, num_vertices), dtype=bool)
+    for i in range(tamano):
+        poblacion[i] = crear_individuo(num_vertices, rng)
+    return poblacion
 
-    return nueva_poblacion
 
+def aristas_descubiertas(poblacion, u, v):
+    """
+    Devuelve, para cada individuo, la cantidad de aristas con ningún extremo en la cobertura.
+    """
+    return (~poblacion[:, u] & ~poblacion[:, v]).sum(axis=1)
 
-def mejor_individuo_poblacion_final(poblacion_final):
 
-    mejor_fitness = 10
+def evaluar_aptitud(poblacion, u, v, penalizacion=2):
+    """
+Evalua la aptitud de todos los individuos de la población recibida como parámetro (matriz booleana).
 
-    for i in poblacion_final:
-        if evaluar_aptitud(i) <= mejor_fitness:
-            mejor_fitness = evaluar_aptitud(i)
-            mejor_individuo = i
+Devuelve un arreglo con el tamaño de la cobertura de cada individuo más una penalización por cada arista
+    sin cubrir. Un valor menor corresponde a un individuo más apto.
+    """
+    return poblacion.sum(axis=1) + penalizacion * aristas_descubiertas(poblacion, u, v)
 
-    return mejor_individuo
 
+def delta_mutacion(individuo, punto, offsets, vecinos):
+    """
+    Devuelve (cambio del tamaño de la cobertura, cambio de aristas descubiertas) provocado por invertir el gen
+    'punto' del individuo, ya mutado. Sólo depende de los vecinos del vértice: O(grado).
+    """
+    ceros = numpy.count_nonzero(~individuo[vecinos[offsets[punto]:offsets[punto + 1]]])
+    if individuo[punto]:
+        # el vértice entró a la cobertura: cubre las aristas hacia vecinos fuera de ella
+        return 1, -ceros
+    # el vértice salió de la cobertura: descubre las aristas hacia vecinos fuera de ella
+    return -1, ceros
 
-def algoritmo_genetico(genoma, generaciones, porcentaje_mutacion, porcentaje_cruza, pressure=3):
 
-    poblacion_inicial = genoma
-    print(f'\nPOBLACION INICIAL: {poblacion_inicial}\n')
+def seleccion_individuos(aptitud, pressure=3):
+    """
+    Devuelve un orden de la poblacion con los 'pressure' mejores individuos (padres) primero, ordenados
+    por fitness, y el resto después en cualquier orden. Usa argpartition en lugar de ordenar toda la poblacion.
+    """
+    orden = numpy.argpartition(aptitud, pressure - 1) if pressure < len(aptitud) else numpy.arange(len(aptitud))
+    padres = orden[:pressure]
+    padres[:] = padres[numpy.argsort(aptitud[padres], kind='stable')]
+    return orden
 
-    poblacion_final = None
-    for i in range(0, generaciones):
 
-        poblacion_por_mejor_FF, seleccionados = seleccion_individuos(
-            poblacion_inicial, pressure)
-        poblacion_cruzada = cruza(
-            poblacion_por_mejor_FF, seleccionados, porcentaje_cruza, pressure)
-        poblacion_final = mutacion(
-            poblacion_cruzada, porcentaje_mutacion, pressure)
+def cruza(actual, destino, orden, porcentaje_cruza, rng, pressure=3, mascara=None, auxiliar=None):
+    """
+    Escribe en destino la poblacion actual en el orden dado, con los individuos que no son padres cruzados
+    a partir de dos padres distintos (los primeros 'pressure' individuos). Los padres se conservan sin cambios.
+    Cada hijo toma los genes del primer padre antes de un punto de corte al azar y los del segundo desde él.
+    Todos los hijos se arman a la vez con una máscara de columnas < punto; mascara y auxiliar son buffers de
+    (tamano - pressure) x num_vertices para no reservar memoria en cada generación.
+    Devuelve los indices (en destino) de los individuos cruzados.
+    """
+    num_vertices = actual.shape[1]
+    resto = len(orden) - pressure
+    if resto <= 0 or num_vertices < 2:
+        numpy.take(actual, orden, axis=0, out=destino)
+        return numpy.empty(0, dtype=numpy.int64)
+    if mascara is None:
+        mascara = numpy.empty((resto, num_vertices), dtype=bool)
+    if auxiliar is None:
+        auxiliar = numpy.empty((resto, num_vertices), dtype=bool)
+
+    # Se decide quién se cruza, con qué padres (distintos) y en qué punto
+    cruzar = rng.random(resto) <= porcentaje_cruza
+    primero = rng.integers(0, pressure, resto)
+    segundo = (primero + rng.integers(1, pressure, resto)) % pressure if pressure > 1 else primero
+    punto = rng.integers(1, num_vertices, resto)
+
+    # Los que no se cruzan toman todos sus genes de sí mismos (punto 0)
+    izquierda = orden[primero]
+    derecha = numpy.where(cruzar, orden[segundo], orden[pressure:])
+    punto[~cruzar] = 0
+
+    numpy.take(actual, orden[:pressure], axis=0, out=destino[:pressure])
+    numpy.take(actual, derecha, axis=0, out=destino[pressure:])
+    numpy.take(actual, izquierda, axis=0, out=auxiliar)
+    numpy.less(numpy.arange(num_vertices), punto[:, None], out=mascara)
+    numpy.copyto(destino[pressure:], auxiliar, where=mascara)
+    return pressure + numpy.flatnonzero(cruzar)
+
+
+def mutacion(poblacion, porcentaje_mutacion, rng, pressure=3):
+    """
+    Muta en el lugar la poblacion recibida como parametro. Se debe tener en cuenta que la mutacion es
+    posterior a la cruza. El criterio de mutacion para el caso es invertir un gen seleccionado al azar.
+    Cada individuo (menos los padres) muta con la probabilidad dada; todos los genes se invierten a la vez.
+    Devuelve los indices de los individuos mutados y el gen invertido de cada uno.
+    """
+    resto = len(poblacion) - pressure
+    if resto <= 0:
+        return numpy.empty(0, dtype=numpy.int64), numpy.empty(0, dtype=numpy.int64)
+    mutar = rng.random(resto) <= porcentaje_mutacion
+    puntos = rng.integers(0, poblacion.shape[1], resto)[mutar]
+    filas = pressure + numpy.flatnonzero(mutar)
+    poblacion[filas, puntos] ^= True
+    return filas, puntos
 
-    return poblacion_final
 
+def reparar(individuo, u, v):
+    """
+    Devuelve una copia del individuo convertida en cobertura: por cada arista sin cubrir agrega su extremo u.
+    """
+    cobertura = individuo.copy()
+    descubiertas = ~cobertura[u] & ~cobertura[v]
+    for a, b in zip(u[descubiertas], v[descubiertas]):
+        if not cobertura[a] and not cobertura[b]:
+            cobertura[a] = True
+    return cobertura
 
-def plotear_solucion(individuo):
-    print(f'Individuo: {individuo}')
-    plt.figure()
-    x = range(len(individuo))
-    x = numpy.array(x)
-    y = numpy.array(individuo)
-    x = x + 0.5
-    y = y + 0.5
-    plt.scatter(x, y)
-    plt.xlim(0, len(individuo))
-    plt.ylim(0, len(individuo))
-    plt.xticks(x-0.5)
-    plt.yticks(x-0.5)
-    plt.grid(True)
-    plt.title(f"Individuo solucion: {individuo}")
-    plt.show()
 
+def mejor_individuo_poblacion_final(poblacion_final, u, v, penalizacion=2, aptitud=None):
+    """
+    Devuelve el individuo de menor fitness de la poblacion y su fitness. Si se recibe el fitness ya
+    calculado de la poblacion, no se vuelve a evaluar.
+    """
+    if aptitud is None:
+        aptitud = evaluar_aptitud(poblacion_final, u, v, penalizacion)
+    mejor = int(numpy.argmin(aptitud))
+    return poblacion_final[mejor], aptitud[mejor]
 
-def main(genoma, generaciones, porcentaje_mutacion, porcentaje_cruza, pressure, corridas):
-    soluciones = []
 
-    for i in range(corridas):
+def algoritmo_genetico(num_vertices, u, v, tamano, generaciones, porcentaje_mutacion, porcentaje_cruza, rng,
+                       pressure=3, penalizacion=2, cutoff=None, start_time=None, mejor=None, semillas=None,
+                       migrar=None, buffers=None, respaldo=None, reanudar=None):
+    """
+    Evoluciona una poblacion al azar hasta cumplir las generaciones o el tiempo límite (cutoff segundos
+    desde start_time). Devuelve la poblacion final, su fitness, la mejor cobertura encontrada, el seguimiento
+    [(tamaño, tiempo)] de las mejoras y la cantidad de generaciones evolucionadas.
+    mejor es el tamaño de la mejor cobertura conocida (de corridas anteriores): sólo se registran mejoras sobre él.
+    semillas es una matriz booleana de individuos (p. ej. coberturas de heuristicas.py) que reemplazan a los
+    primeros individuos al azar de la población inicial.
+    migrar(generacion, poblacion, tamanos, descubiertas) se llama al final de cada generación y puede reemplazar
+    individuos de la población (y su fitness) en el lugar; lo usa el modelo de islas (ver islas.py).
+    buffers es un arreglo booleano de (2 x tamano x num_vertices) para las dos poblaciones (p. ej. en memoria
+    compartida); por defecto se reserva uno.
+    respaldo (ver respaldo.py) guarda periódicamente la población, el estado del generador y la generación, y
+    reanudar es un estado guardado desde el que se continúa.
+
+    La poblacion actual y la siguiente ocupan dos buffers reservados al principio que se intercambian en cada
+    generación, igual que el fitness, por lo que la memoria no crece con las generaciones.
+    El fitness de cada individuo se guarda separado en tamaño de cobertura y aristas descubiertas. Los individuos
+    cruzados se vuelven a evaluar; los que sólo mutaron se actualizan con delta_mutacion() en O(grado).
+    """
+    if start_time is None:
+        start_time = time.time()
+    if mejor is None:
+        mejor = num_vertices + 1
+    mejor_cobertura = None
+    times = []
+
+    offsets, vecinos = construir_adyacencia(num_vertices, u, v)
+    if buffers is None:
+        buffers = numpy.empty((2, tamano, num_vertices), dtype=bool)
+    poblacion, siguiente = buffers[0], buffers[1]
+    generacion = 0
+    if reanudar is not None:
+        poblacion[:] = reanudar['poblacion']
+        tamanos = reanudar['tamanos'].copy()
+        descubiertas = reanudar['descubiertas'].copy()
+        rng.bit_generator.state = reanudar['rng']
+        generacion = reanudar['generacion']
+        mejor = reanudar['mejor']
+        mejor_cobertura = reanudar['mejor_cobertura']
+        times = list(reanudar['times'])
+    else:
+        poblacion[:] = crear_poblacion(num_vertices, tamano, rng)
+        if semillas is not None:
+            poblacion[:len(semillas)] = semillas[:tamano]
+        tamanos = poblacion.sum(axis=1)
+        descubiertas = aristas_descubiertas(poblacion, u, v)
+    tamanos_siguiente = numpy.empty_like(tamanos)
+    descubiertas_siguiente = numpy.empty_like(descubiertas)
+    aptitud = tamanos + penalizacion * descubiertas
+    resto = max(0, tamano - pressure)
+    mascara = numpy.empty((resto, num_vertices), dtype=bool)
+    auxiliar = numpy.empty((resto, num_vertices), dtype=bool)
+
+    while (generaciones is None or generacion < generaciones) and \
+            (cutoff is None or time.time() - start_time < cutoff):
+
+        orden = seleccion_individuos(aptitud, pressure)
+        mejor_actual = orden[0]
+
+        # El mejor individuo factible (sin aristas descubiertas) es una cobertura
+        if descubiertas[mejor_actual] == 0 and tamanos[mejor_actual] < mejor:
+            mejor = int(tamanos[mejor_actual])
+            mejor_cobertura = poblacion[mejor_actual].copy()
+            times.append((mejor, time.time() - start_time))
+
+        cruzados = cruza(poblacion, siguiente, orden, porcentaje_cruza, rng, pressure, mascara, auxiliar)
+        numpy.take(tamanos, orden, out=tamanos_siguiente)
+        numpy.take(descubiertas, orden, out=descubiertas_siguiente)
+        poblacion, siguiente = siguiente, poblacion
+        tamanos, tamanos_siguiente = tamanos_siguiente, tamanos
+        descubiertas, descubiertas_siguiente = descubiertas_siguiente, descubiertas
+        mutados, puntos = mutacion(poblacion, porcentaje_mutacion, rng, pressure)
+
+        # ACTUALIZAR EL FITNESS GUARDADO: EVALUACIÓN COMPLETA DE LOS CRUZADOS, DELTA PARA LOS MUTADOS
+        if len(cruzados):
+            tamanos[cruzados] = poblacion[cruzados].sum(axis=1)
+            descubiertas[cruzados] = aristas_descubiertas(poblacion[cruzados], u, v)
+        solo_mutados = ~numpy.isin(mutados, cruzados)
+        for i, punto in zip(mutados[solo_mutados].tolist(), puntos[solo_mutados].tolist()):
+            delta_tamano, delta_descubiertas = delta_mutacion(poblacion[i], punto, offsets, vecinos)
+            tamanos[i] += delta_tamano
+            descubiertas[i] += delta_descubiertas
+        generacion += 1
+        if migrar is not None:
+            migrar(generacion, poblacion, tamanos, descubiertas)
+        numpy.multiply(descubiertas, penalizacion, out=aptitud, casting='unsafe')
+        aptitud += tamanos
+        if respaldo is not None:
+            t = time.time() - start_time
+            if respaldo.toca(t):
+                respaldo.guardar(dict(poblacion=poblacion.copy(), tamanos=tamanos.copy(),
+                                      descubiertas=descubiertas.copy(), rng=rng.bit_generator.state,
+                                      generacion=generacion, mejor=mejor, mejor_cobertura=mejor_cobertura,
+                                      times=list(times), tiempo=t), t)
+
+    # La población de la última generación no pasó por la revisión del principio del ciclo
+    mejor_actual = seleccion_individuos(aptitud, pressure)[0]
+    if descubiertas[mejor_actual] == 0 and tamanos[mejor_actual] < mejor:
+        mejor = int(tamanos[mejor_actual])
+        mejor_cobertura = poblacion[mejor_actual].copy()
+        times.append((mejor, time.time() - start_time))
+
+    return poblacion, aptitud, mejor_cobertura, times, generacion
+
+
+def coberturas_heuristicas(num_vertices, u, v):
+    """
+    Devuelve las coberturas de las heurísticas de heuristicas.py como matriz booleana (una fila por heurística).
+    """
+    offsets, vecinos = construir_adyacencia(num_vertices, u, v)
+    semillas = numpy.zeros((len(HEURISTICAS), num_vertices), dtype=bool)
+    for i, heuristica in enumerate(HEURISTICAS.values()):
+        semillas[i, heuristica(offsets, vecinos)] = True
+    return semillas
+
+
+def main(archivo, cutoff, seed, tamano, generaciones, porcentaje_mutacion, porcentaje_cruza, pressure, corridas,
+         penalizacion=2, salida=DIRECTORIO_SALIDA, heuristicas=False, islas=0, migracion=10, migrantes=2,
+         checkpoint=0, resume=False):
+    num_vertices, u, v = leer_grafo(archivo)
+    rng = azar.generador(seed)
+    semillas = coberturas_heuristicas(num_vertices, u, v) if heuristicas else None
+    nombre = nombre_salida(archivo, 'Approx', cutoff, seed, salida)
+
+    start_time = time.time()
+    mejor_cobertura = None
+    times = []
+
+    # CHECKPOINTS OPCIONALES (VER RESPALDO.PY): LA CORRIDA ACTUAL Y EL RESULTADO DE LAS ANTERIORES
+    respaldo = reanudar = None
+    primera = 0
+    if checkpoint or resume:
+        from respaldo import Respaldo, borrar, cargar, ruta_respaldo
+        firma = dict(inst=os.path.basename(archivo), alg='Approx', cutoff=cutoff, seed=seed, tamano=tamano,
+                     generaciones=generaciones, porcentaje_mutacion=porcentaje_mutacion,
+                     porcentaje_cruza=porcentaje_cruza, pressure=pressure, corridas=corridas,
+                     penalizacion=penalizacion, heuristicas=heuristicas)
+        if resume:
+            reanudar = cargar(ruta_respaldo(nombre), firma)
+            if reanudar is None:
+                print(f'No hay checkpoint en {ruta_respaldo(nombre)}: se empieza de cero')
+            else:
+                start_time = time.time() - reanudar['tiempo']
+                primera = reanudar['corrida']
+                mejor_cobertura = reanudar['cobertura_corridas']
+                times = list(reanudar['times_corridas'])
+                print(f'REANUDANDO: EJECUCION N°: {primera+1}, GENERACION: {reanudar["generacion"]}')
+        if checkpoint:
+            respaldo = Respaldo(ruta_respaldo(nombre), checkpoint, firma, reanudar['tiempo'] if reanudar else 0.0)
+
+    if islas:
+        from islas import ag_islas
+        mejor_cobertura, times, evolucionadas = ag_islas(
+            num_vertices, u, v, tamano, generaciones, porcentaje_mutacion, porcentaje_cruza, seed, islas, migracion,
+            migrantes, pressure, penalizacion, cutoff, start_time, semillas)
+        print(f'GENERACIONES POR ISLA: {evolucionadas}')
+        corridas = 0
+
+    for i in range(primera, corridas):
         print(f'\nEJECUCION N°: {i+1}')
 
-        poblacion_final = algoritmo_genetico(
-            genoma, generaciones, porcentaje_mutacion, porcentaje_cruza, pressure)
-        print(
-            f'POBLACION FINAL (individuo, fitness): {[(i, evaluar_aptitud(i)) for i in poblacion_final]}\n')
-
-        mejor_individuo = mejor_individuo_poblacion_final(poblacion_final)
-        print(
-            f'MEJOR INDIVIDUO ENCONTRADO: {mejor_individuo}, SU FITNESS ES: {evaluar_aptitud(mejor_individuo)}\n')
-
-        if evaluar_aptitud(mejor_individuo) == 0:
-            soluciones.append(mejor_individuo)
-
-    print(f'\nSe encontraron {len(soluciones)} soluciones: {soluciones}\n')
-
-    if len(soluciones) > 0:
-        for s in soluciones:
-            plotear_solucion(s)
+        mejor = times[-1][0] if times else None
+        if respaldo is not None:
+            respaldo.contexto = dict(corrida=i, cobertura_corridas=mejor_cobertura, times_corridas=list(times))
+        poblacion_final, aptitud, cobertura, mejoras, evolucionadas = algoritmo_genetico(
+            num_vertices, u, v, tamano, generaciones, porcentaje_mutacion, porcentaje_cruza, rng, pressure,
+            penalizacion, cutoff, start_time, mejor, semillas, respaldo=respaldo,
+            reanudar=reanudar if i == primera else None)
+        print(f'GENERACIONES: {evolucionadas}')
+
+        # Si ninguna generación produjo una cobertura, se repara el mejor individuo de la población final
+        mejor_individuo, fitness = mejor_individuo_poblacion_final(poblacion_final, u, v, penalizacion, aptitud)
+        print(f'MEJOR INDIVIDUO ENCONTRADO: {int(mejor_individuo.sum())} vertices, SU FITNESS ES: {fitness}\n')
+        if cobertura is None and mejor_cobertura is None:
+            cobertura = reparar(mejor_individuo, u, v)
+            mejoras = [(int(cobertura.sum()), time.time() - start_time)]
+
+        if cobertura is not None:
+            mejor_cobertura = cobertura
+            times.extend(mejoras)
+
+    if respaldo is not None:
+        respaldo.cerrar()
+        print(respaldo.resumen())
+    print(f'\nMejor cobertura encontrada: {int(mejor_cobertura.sum())} vertices\n')
+
+    # ESCRIBIR SOLUCIÓN Y ARCHIVOS DE SEGUIMIENTO A "*.SOL" Y '*.TRACE" RESPECTIVAMENTE
+    escribir_salida(nombre, [x + 1 for x in numpy.flatnonzero(mejor_cobertura)], times)
+    if checkpoint or resume:  # la corrida terminó: el checkpoint ya no sirve
+        borrar(ruta_respaldo(nombre))
 
 
 if __name__ == "__main__":
@@ -334,29 +456,52 @@ if __name__ == "__main__":
         prog='Analizador de entrada para Approx', description='Minimum vertex cover approximation')
     parser.add_argument('-inst', action='store', type=str,
                         required=True, help='Archivo de datos de Grafo de entrada')
-    parser.add_argument('-g', help='Cantidad de generaciones', type=int)
-    parser.add_argument('-pm', help='Porcentaje de mutacion', type=float)
-    parser.add_argument('-pc', help='Porcentaje de cruza', type=float)
+    parser.add_argument('-time', action='store', default=600, type=int,
+                        help='Tiempo límite de ejecución del algoritmo')
+    parser.add_argument('-seed', action='store', default=None, type=int,
+                        help='Semilla del generador aleatorio')
+    parser.add_argument('-tp', help='Tamaño de la poblacion', type=int, default=100)
+    parser.add_argument('-g', help='Cantidad de generaciones (por defecto hasta el tiempo límite)', type=int,
+                        default=None)
+    parser.add_argument('-pm', help='Porcentaje de mutacion', type=float, default=0.5)
+    parser.add_argument('-pc', help='Porcentaje de cruza', type=float, default=0.8)
     parser.add_argument(
-        '-p', help='Pressure (candidatos a ser padres - min(2) - max(tp))', type=int, default=3)
-    parser.add_argument('-c', help='Cantidad de corridas', type=int)
+        '-p', help='Pressure (candidatos a ser padres - min(1) - max(tp)); con 1 los hijos son copias del padre',
+        type=int, default=3)
+    parser.add_argument('-c', help='Cantidad de corridas', type=int, default=1)
+    parser.add_argument('-penal', help='Penalizacion por arista sin cubrir', type=float, default=2)
+    parser.add_argument('-out', help='Directorio de los archivos de salida', type=str, default=DIRECTORIO_SALIDA)
+    parser.add_argument('-heuristicas', help='Sembrar la población inicial con las coberturas de heuristicas.py',
+                        action='store_true')
+    parser.add_argument('-islas', help='Cantidad de islas (procesos) del modelo de islas (reemplaza a -c)', type=int,
+                        default=0)
+    parser.add_argument('-migracion', help='Generaciones entre migraciones de las islas', type=int, default=10)
+    parser.add_argument('-migrantes', help='Individuos que migran a la isla vecina', type=int, default=2)
+    parser.add_argument('-checkpoint', help='Segundos entre checkpoints de la población (<salida>.ckpt); 0 los '
+                        'desactiva', type=float, default=0)
+    parser.add_argument('-resume', help='Continuar desde el checkpoint de una corrida anterior con los mismos '
+                        'argumentos', action='store_true')
 
     args = parser.parse_args()
-
-    GRAP_FILE = args.inst
-    GENOMA = crear_poblacion(GRAP_FILE)
-    GENERACIONES = args.g
-    PRESSURE = args.p
-    PORCENTAJE_MUTACION = args.pm
-    PORCENTAJE_CRUZA = args.pc
-    CORRIDAS = args.c
+    if args.p < 1 or args.p > args.tp:
+        parser.error('-p debe estar entre 1 y -tp')
+    if args.islas < 0:
+        parser.error('-islas debe ser positivo')
+    if args.migracion < 1 or args.migrantes < 1:
+        parser.error('-migracion y -migrantes deben ser al menos 1')
+    if args.checkpoint < 0:
+        parser.error('-checkpoint debe ser positivo')
+    if args.islas and (args.checkpoint or args.resume):
+        parser.error('-checkpoint y -resume no admiten -islas')
 
     print(f'\n{parser.prog} - {parser.description}\n')
 
-    print(f'GENOMA: {GENOMA}')
-    print(f'GENERACIONES: {GENERACIONES}')
-    print(f'PORCENTAJE_MUTACION: {PORCENTAJE_MUTACION}')
-    print(f'PRESSURE: {PRESSURE}')
+    print(f'GRAFO: {args.inst}')
+    print(f'TAMAÑO POBLACION: {args.tp}')
+    print(f'GENERACIONES: {args.g}')
+    print(f'PORCENTAJE_MUTACION: {args.pm}')
+    print(f'PORCENTAJE_CRUZA: {args.pc}')
+    print(f'PRESSURE: {args.p}')
 
-    main(GENOMA, GENERACIONES, PRESSURE,
-         PORCENTAJE_MUTACION, PORCENTAJE_CRUZA, CORRIDAS)
+    main(args.inst, args.time, args.seed, args.tp, args.g, args.pm, args.pc, args.p, args.c, args.penal, args.out,
+         args.heuristicas, args.islas, args.migracion, args.migrantes, args.checkpoint, args.resume)
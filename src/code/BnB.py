@@ -29,8 +29,10 @@ La estructura del archivo sería la siguiente:
 Language: Python 3
 ### Running: python3 code/BnB.py -inst data/karate.graph -alg BnB -time 600 -seed 100
 El valor inicial no se utilizará para la implementación de BnB.
+Con -checkpoint S se guarda el estado de la búsqueda cada S segundos y con -resume se continúa desde el último
+checkpoint (ver respaldo.py).
 
-La salida serán dos archivos: *.sol y *.trace creados en la carpeta Output del proyecto
+La salida serán dos archivos: *.sol y *.trace creados en la carpeta output del proyecto (o en la indicada con -out)
 *.sol --- registra el tamaño de la cobertura óptima de vértices y los nodos que contiene.
 *.trace --- registrar todas las soluciones óptimas encontradas durante la búsqueda y el momento en que se encontró
 
@@ -38,174 +40,306 @@ La salida serán dos archivos: *.sol y *.trace creados en la carpeta Output del
 '''
 
 import argparse
-import networkx as nx
-import operator
-import time
 import os
+import time
+
+import cargador
+from cotas import COTAS, cota_maxdeg, elegir_cotas
+from grafo import DESEMPATES, Grafo
+from instrumentos import PERFILES, Instrumentos, perfilar
+from memo import TablaTransposicion
+from reducciones import REGLAS, REGLAS_BUSQUEDA, elegir_reglas, kernelizar, reducir
+from salida import DIRECTORIO_SALIDA, escribir_salida, nombre_salida
 
 
 def parse(datafile):
     '''
-    Funcion para analisis de archivos de entrada
+    Funcion para analisis de archivos de entrada: devuelve los arreglos CSR (ver cargador.py)
     '''
-    adj_list = []
-    with open(datafile) as f:
-        num_vertices, num_edges, weighted = map(int, f.readline().split())
-        for i in range(num_vertices):
-            adj_list.append(map(int, f.readline().split()))
-    return adj_list
+    return cargador.cargar(datafile)
 
 
-def create_graph(adj_list):
+def create_graph(datos):
     '''
-    Utiliza la lista de adyacencia para crear un Grafo
+    Utiliza los arreglos CSR del archivo de entrada para crear un Grafo compacto
     '''
-    G = nx.Graph()
-    for i in range(len(adj_list)):
-        for j in adj_list[i]:
-            G.add_edge(i + 1, j)
-    print(G)
-    return G
+    return Grafo.desde_csr(datos)
 
 
-def BnB(G, T):
+def BnB(G, T, estadisticas=None, desempate='menor', seed=None, cotas='maxdeg', reducciones=(),
+        prefijo=(), incumbente=None, start_time=None, instrumentos=None, memoria=0, inicial=None,
+        discrepancias=None, respaldo=None, reanudar=None):
     '''
     Funcion Branch and Bound para encontrar el VC minimo de un Grafo
+    Si se recibe el diccionario estadisticas, se registra en él la cantidad de nodos explorados y las podas por cota
+    desempate y seed definen la elección entre vértices de igual grado máximo al ramificar
+    cotas es la lista de cotas inferiores a combinar (ver cotas.COTAS), p. ej. 'matching,degree'
+    reducciones es la lista de reglas a aplicar en cada nodo (ver reducciones.REGLAS_BUSQUEDA)
+    Para la búsqueda en paralelo (ver paralelo.py): prefijo es el trail (lista de (vertex,state)) que fija el
+    subproblema, incumbente es el UpperBound compartido entre procesos y start_time la hora de inicio global
+    instrumentos (ver instrumentos.py) define la verbosidad y la instrumentación opcional de la búsqueda
+    memoria es el tope en MiB de la tabla de transposición (ver memo.py); 0 la desactiva
+    inicial es una cobertura conocida de G (lista de vértices) que fija el UpperBound inicial
+    discrepancias limita la cantidad de ramas state=0 (contrarias a la heurística de tomar el vértice de grado
+    máximo) en cada camino, para la búsqueda por discrepancias limitadas (ver estrategias.py); las ramas
+    recortadas se cuentan en estadisticas['recortes']
+    respaldo (ver respaldo.py) guarda periódicamente el estado de la búsqueda y reanudar es un estado guardado
+    desde el que se continúa
     '''
-    # HORA DE INICIO DEL REGISTRO
-    start_time = time.time()
-    end_time = start_time
+    if memoria and discrepancias is not None:
+        raise ValueError('La tabla de transposición no admite la búsqueda por discrepancias limitadas')
+    if memoria and (respaldo is not None or reanudar is not None):
+        raise ValueError('La tabla de transposición no admite checkpoints')
+    cotas = elegir_cotas(cotas)
+    reducciones = elegir_reglas(reducciones, REGLAS_BUSQUEDA)
+
+    # INSTRUMENTACIÓN: SIN TIEMPOS, LAS FUNCIONES DEL CICLO SON LAS ORIGINALES
+    if instrumentos is None:
+        instrumentos = Instrumentos()
+    aplicar_ = instrumentos.cronometrar('aplicar', aplicar)
+    undo_ = instrumentos.cronometrar('deshacer', undo)
+    find_maxdeg_ = instrumentos.cronometrar('ramificar', find_maxdeg)
+    cotas = [(nombre, instrumentos.cronometrar('cotas', cota)) for nombre, cota in cotas]
+    histograma = instrumentos.histograma
+    instrumentos.abrir()
+    proxima_emision = instrumentos.intervalo if instrumentos.flujo is not None else float('inf')
+
+    # HORA DE INICIO DEL REGISTRO (AL REANUDAR, CONTINÚA EL RELOJ DE LA CORRIDA GUARDADA)
+    if start_time is None:
+        start_time = time.time()
+    if reanudar is not None:
+        start_time = time.time() - reanudar['tiempo']
+    end_time = time.time()
     delta_time = end_time-start_time
     # lista de veces en que se encuentra la solución, tuple=(VC size,delta_time)
     times = []
 
     # INICIALIZAR SOLUCIÓN CONJUNTOS VC Y CONJUNTO FRONTERA A CONJUNTO VACÍO
+    # CurVC funciona además como pila de deshacer (trail): cada entrada (node,1) es una eliminación en CurG
     OptVC = []
     CurVC = []
+    CurVC_size = 0
     Frontier = []
-    neighbor = []
+    nodos = 0
+    recortes = 0
+    # cantidad de podas causadas por cada cota
+    podas = dict((nombre, 0) for nombre, cota in cotas)
 
     # ESTABLECER LÍMITE SUPERIOR INICIAL
     UpperBound = G.number_of_nodes()
-    print('Initial UpperBound:', UpperBound)
+    if inicial is not None:
+        UpperBound = len(inicial)
+        OptVC = [(v, 1) for v in inicial]
+    instrumentos.imprimir(1, 'Initial UpperBound:', UpperBound)
 
     CurG = G.copy()  # hacer una copia de G
-    # ordena el diccionario del grado de los nodos para encontrar el nodo con el grado más alto
-    v = find_maxdeg(CurG)
-
-    # ADJUNTAR (V,1,(parent,state)) Y (V,0,(parent,state)) A LA FRONTERA
-    # tuplas de node,state,(parent vertex,parent vertex state)
-    Frontier.append((v[0], 0, (-1, -1)))
-    Frontier.append((v[0], 1, (-1, -1)))
+    CurG.baldes.configurar(desempate, seed)
+
+    # REHACER EL TRAIL QUE FIJA EL SUBPROBLEMA; NUNCA SE DESHACE POR DEBAJO DE ÉL
+    CurVC_size += rehacer(CurG, CurVC, prefijo)
+    raiz = len(CurVC)
+
+    # TABLA DE TRANSPOSICIÓN OPCIONAL: LA CLAVE SIGUE AL TRAIL
+    memo = None
+    if memoria:
+        memo = TablaTransposicion(CurG.n, memoria)
+        memo.iniciar(CurG)
+        podas['memo'] = 0
+    mejoras = 0
+    ultima = UpperBound
+
+    if reanudar is not None:  # REANUDAR DESDE UN CHECKPOINT: EL TRAIL GUARDADO RECONSTRUYE EL GRAFO RESTANTE
+        CurVC_size += rehacer(CurG, CurVC, reanudar['trail'][raiz:])
+        Frontier = reanudar['Frontier']
+        OptVC = reanudar['OptVC']
+        UpperBound = reanudar['UpperBound']
+        times = reanudar['times']
+        nodos = reanudar['nodos']
+        recortes = reanudar['recortes']
+        podas.update(reanudar['podas'])
+        instrumentos.imprimir(1, 'Reanudando: %i nodos explorados, UpperBound %i' % (nodos, UpperBound))
+    elif CurG.number_of_edges() == 0:  # el Grafo sin aristas se cubre con el conjunto vacío
+        if incumbente is None or CurVC_size <= incumbente.valor():
+            if incumbente is not None:
+                incumbente.mejorar(CurVC_size)
+            OptVC = CurVC.copy()
+            times.append((CurVC_size, time.time()-start_time))
+    else:
+        # ordena el diccionario del grado de los nodos para encontrar el nodo con el grado más alto
+        v = find_maxdeg(CurG)
+
+        # ADJUNTAR (V,1,(parent,state),mark,depth,disc) Y (V,0,(parent,state),mark,depth,disc) A LA FRONTERA
+        # tuplas de node,state,(parent vertex,parent vertex state),largo de CurVC al crear la entrada,profundidad,
+        # cantidad de ramas state=0 en el camino
+        if discrepancias is None or discrepancias > 0:
+            Frontier.append((v[0], 0, (-1, -1), raiz, 0, 1))
+        else:
+            recortes += 1
+        Frontier.append((v[0], 1, (-1, -1), raiz, 0, 0))
 
     while Frontier != [] and delta_time < T:
         # establecer el nodo actual en el último elemento en Frontier
-        (vi, state, parent) = Frontier.pop()
+        (vi, state, parent, mark, profundidad, discrepancia) = Frontier.pop()
+        nodos += 1
 
         backtrack = False
 
-        if state == 0:  # si no se selecciona vi, estado de todos los vecinos=1
-            neighbor = CurG.neighbors(vi)  # almacenar todos los vecinos de vi
-            for node in list(neighbor):
-                CurVC.append((node, 1))
-                # El nodo está en VC, elimina vecinos de CurG
-                CurG.remove_node(node)
-        elif state == 1:  # si se selecciona vi, estado de todos los vecinos=0
-            CurG.remove_node(vi)  # vi está en VC, elimine el nodo de G
-        else:
-            pass
+        largo = len(CurVC)
+        CurVC_size += aplicar_(CurG, CurVC, vi, state, reducciones)
+        if memo is not None:
+            memo.avanzar(CurVC, largo)
 
-        CurVC.append((vi, state))
-        CurVC_size = VC_Size(CurVC)
+        if incumbente is not None:  # los demás procesos pueden haber encontrado una solución mejor
+            # se poda sólo lo que no alcanza el UpperBound compartido: un empate se conserva en este subproblema
+            UpperBound = min(UpperBound, incumbente.valor() + 1)
 
         if CurG.number_of_edges() == 0:  # fin de la exploración, solución encontrada
 
             if CurVC_size < UpperBound:
-                OptVC = CurVC.copy()
-                print('Current Opt VC size', CurVC_size)
                 UpperBound = CurVC_size
+                mejoras += 1
+                ultima = CurVC_size
+                if incumbente is not None:
+                    incumbente.mejorar(CurVC_size)
+                OptVC = CurVC.copy()
+                instrumentos.imprimir(1, 'Current Opt VC size', CurVC_size)
                 times.append((CurVC_size, time.time()-start_time))
             backtrack = True
 
         else:  # solución parcial
-            CurLB = Lowerbound(CurG) + CurVC_size
-
-            if CurLB < UpperBound:  # worth exploring
-                vj = find_maxdeg(CurG)
-                # (vi,state) Es padre de vj
-                Frontier.append((vj[0], 0, (vi, state)))
-                Frontier.append((vj[0], 1, (vi, state)))
+            # la cota inferior es el máximo de las cotas elegidas; se evalúan en orden y la poda se atribuye
+            # a la primera que alcanza UpperBound, sin calcular las restantes
+            margen = UpperBound - CurVC_size
+            podadora = None
+            if memo is not None and memo.consultar(margen):  # Grafo restante ya resuelto
+                podadora = 'memo'
+            else:
+                for nombre, cota in cotas:
+                    if cota(CurG) >= margen:
+                        podadora = nombre
+                        break
+
+            if podadora is None:  # worth exploring
+                if memo is not None:
+                    memo.abrir(len(CurVC), CurVC_size, mejoras)
+                vj = find_maxdeg_(CurG)
+                # (vi,state) Es padre de vj; los hijos recuerdan el largo actual del trail
+                if discrepancias is None or discrepancia < discrepancias:
+                    Frontier.append((vj[0], 0, (vi, state), len(CurVC), profundidad + 1, discrepancia + 1))
+                else:
+                    recortes += 1
+                Frontier.append((vj[0], 1, (vi, state), len(CurVC), profundidad + 1, discrepancia))
             else:
                 # final de la ruta, dará como resultado una peor solución, retrocede al padre
+                podas[podadora] += 1
                 backtrack = True
 
         if backtrack == True:
+            if histograma is not None:
+                histograma[profundidad] += 1
             if Frontier != []:  # De lo contrario no más candidatos para procesar
-                # padre del último elemento en Frontier (tuple of (vertex,state))
-                nextnode_parent = Frontier[-1][2]
-
-                # retroceder al nivel de nextnode_parent
-                if nextnode_parent in CurVC:
-
-                    id = CurVC.index(nextnode_parent) + 1
-                    # deshacer los cambios desde el final de la copia de seguridad de CurVC hasta el nodo principal
-                    while id < len(CurVC):
-                        mynode, mystate = CurVC.pop()  # deshacer la adición a CurVC
-                        # deshacer la eliminación de CurG
-                        CurG.add_node(mynode)
-
-                        # encuentra todas las aristas conectadas a vi en el Grafo G
-                        # o los bordes que se conectaron a los nodos que no están en el conjunto de VC actual.
-
-                        curVC_nodes = list(map(lambda t: t[0], CurVC))
-                        for nd in G.neighbors(mynode):
-                            if (nd in CurG.nodes()) and (nd not in curVC_nodes):
-                                # esto agrega bordes de vi de regreso a CurG que posiblemente fueron eliminados
-                                CurG.add_edge(nd, mynode)
-
-                elif nextnode_parent == (-1, -1):
-                    # retroceder al nodo raíz
-                    CurVC.clear()
-                    CurG = G.copy()
-                else:
-                    print('error in backtracking step')
+                # retroceder al nivel del padre del último elemento en Frontier: el trail se deshace
+                # hasta el largo que tenía al crear la entrada (0 = nodo raíz), en tiempo proporcional
+                # a los cambios hechos en el subárbol
+                if memo is not None:
+                    memo.cerrar(Frontier[-1][3], UpperBound, mejoras, ultima)
+                    memo.retroceder(CurVC, Frontier[-1][3])
+                CurVC_size -= undo_(CurG, CurVC, Frontier[-1][3])
 
         end_time = time.time()
         delta_time = end_time-start_time
+        if delta_time >= proxima_emision:
+            instrumentos.emitir(delta_time, nodos, podas, len(Frontier), UpperBound, profundidad)
+            proxima_emision += instrumentos.intervalo
+        if respaldo is not None and respaldo.toca(delta_time):
+            # el trail está deshecho hasta el padre de Frontier[-1]: es el estado al inicio de la iteración
+            respaldo.guardar(dict(Frontier=list(Frontier), trail=list(CurVC), OptVC=OptVC, UpperBound=UpperBound,
+                                  times=list(times), nodos=nodos, recortes=recortes, podas=dict(podas),
+                                  tiempo=delta_time), delta_time)
         if delta_time > T:
-            print('Cutoff time reached')
-
+            instrumentos.imprimir(1, 'Cutoff time reached')
+
+    if instrumentos.flujo is not None:
+        instrumentos.emitir(delta_time, nodos, podas, len(Frontier), UpperBound, 0, 'fin')
+    instrumentos.cerrar()
+
+    if estadisticas is not None:
+        estadisticas['nodos'] = nodos
+        estadisticas['podas'] = podas
+        estadisticas['tiempo'] = delta_time
+        if discrepancias is not None:
+            estadisticas['recortes'] = recortes
+        if memo is not None:
+            estadisticas['memo'] = memo.estadisticas()
+        instrumentos.resumen(estadisticas)
     return OptVC, times
 
 
-def find_maxdeg(g):
+def aplicar(g, trail, vi, state, reducciones=()):
     '''
-    Funcion para encontrar el vertice con grado maximo en el Grafo restante
+    Funcion para aplicar la decisión (vi,state) sobre g, anotando en el trail los cambios
+    Devuelve la cantidad de nodos agregados a la cobertura
     '''
-    deglist = g.degree()
-    deglist_sorted = sorted(deglist, reverse=True, key=operator.itemgetter(
-        1))  # ordenar en orden descendente de grado de nodo
-    v = deglist_sorted[0]  # tupla - (node,degree)
-    return v
+    agregados = 0
+    marca = len(trail)
+    if state == 0:  # si no se selecciona vi, estado de todos los vecinos=1
+        for node in g.neighbors(vi):  # todos los vecinos vivos de vi
+            trail.append((node, 1))
+            # El nodo está en VC, elimina vecinos de CurG
+            g.remove_node(node)
+            agregados += 1
+    elif state == 1:  # si se selecciona vi, estado de todos los vecinos=0
+        g.remove_node(vi)  # vi está en VC, elimine el nodo de G
+        agregados += 1
+
+    trail.append((vi, state))
+    if reducciones:
+        agregados += reducir(g, trail, reducciones, marca)
+    return agregados
+
+
+def rehacer(g, trail, entradas):
+    '''
+    Funcion para volver a aplicar sobre g las entradas (node,state) de un trail guardado
+    Devuelve la cantidad de nodos con state=1 rehechos
+    '''
+    rehechos = 0
+    for (mynode, mystate) in entradas:
+        if mystate == 1:
+            g.remove_node(mynode)
+            rehechos += 1
+        trail.append((mynode, mystate))
+    return rehechos
 
 
-def Lowerbound(graph):
+def undo(g, trail, mark):
     '''
-    Funcion para estimar el limite inferior
+    Funcion para deshacer el trail hasta el largo mark, restaurando en g los nodos eliminados
+    Devuelve la cantidad de nodos con state=1 deshechos
     '''
-    lb = graph.number_of_edges() / find_maxdeg(graph)[1]
-    lb = ceil(lb)
-    return lb
+    deshechos = 0
+    while len(trail) > mark:
+        mynode, mystate = trail.pop()  # deshacer la adición a CurVC
+        if mystate == 1:
+            # deshacer la eliminación de CurG; restaura las aristas hacia los vecinos vivos
+            g.restore_node(mynode)
+            deshechos += 1
+    return deshechos
 
 
-def ceil(d):
+def find_maxdeg(g):
     '''
-    Funcion para devolver el entero mínimo que es mayor que d
+    Funcion para encontrar el vertice con grado maximo en el Grafo restante
     '''
-    if d > int(d):
-        return int(d) + 1
-    else:
-        return int(d)
+    v = g.baldes.maximo()  # tupla - (node,degree); empates según la política de desempate
+    return v
+
+
+def Lowerbound(graph):
+    '''
+    Funcion para estimar el limite inferior (cota 'maxdeg': ceil(|E| / grado máximo))
+    '''
+    return cota_maxdeg(graph)
 
 
 def VC_Size(VC):
@@ -222,40 +356,182 @@ def VC_Size(VC):
 # MAIN BODY OF CODE
 
 
-def main(inputfile, cutoff):
+def main(inputfile, cutoff, desempate='menor', seed=None, cotas='maxdeg', kernel=(), reducciones=(), workers=1,
+         profundidad=None, salida=DIRECTORIO_SALIDA, instrumentos=None, perfil=None, bits=False, separar=False,
+         memoria=0, estrategia='dfs', inicial=None, cola=128, checkpoint=0, resume=False):
+    if instrumentos is None:
+        instrumentos = Instrumentos()
+    nombre = nombre_salida(inputfile, 'BnB', cutoff, seed if desempate == 'aleatorio' else None, salida)
+
+    # CHECKPOINTS OPCIONALES (VER RESPALDO.PY): SÓLO PARA LA BÚSQUEDA DFS SECUENCIAL
+    respaldo = reanudar = None
+    if checkpoint or resume:
+        from respaldo import Respaldo, borrar, cargar, ruta_respaldo
+        firma = dict(inst=os.path.basename(inputfile), alg='BnB', cutoff=cutoff, desempate=desempate, seed=seed,
+                     cotas=cotas, kernel=list(kernel), reducciones=list(reducciones))
+        if resume:
+            reanudar = cargar(ruta_respaldo(nombre), firma)
+            if reanudar is None:
+                instrumentos.imprimir(1, 'No hay checkpoint en %s: se empieza de cero' % ruta_respaldo(nombre))
+        if checkpoint:
+            respaldo = Respaldo(ruta_respaldo(nombre), checkpoint, firma, reanudar['tiempo'] if reanudar else 0.0)
+
     # LEER EL ARCHIVO DE ENTRADA EN EL GRAPH
     adj_list = parse(inputfile)
     g = create_graph(adj_list)
-
-    Sol_VC, times = BnB(g, cutoff)
-
-    # ELIMINAR NODOS FALSOS (ESTADO=0) EN SoL_VC OBTENIDO
-    for element in Sol_VC:
-        if element[1] == 0:
-            Sol_VC.remove(element)
+    instrumentos.imprimir(1, g)
+
+    # KERNELIZACIÓN: EL BnB SE EJECUTA SOBRE EL GRAFO REDUCIDO
+    K = None
+    if kernel:
+        K = kernelizar(g, kernel)
+        instrumentos.imprimir(1, K)
+        g = K.grafo
+
+    estadisticas = {}
+    T = cutoff - (K.tiempo if K else 0)
+    if estrategia != 'dfs' or inicial is not None:
+        from estrategias import buscar
+        busqueda, argumentos = buscar, (g, T, estrategia, inicial, estadisticas, desempate, seed, cotas, reducciones,
+                                        instrumentos, memoria, cola)
+    elif separar:
+        from componentes import BnB_componentes
+        busqueda, argumentos = BnB_componentes, (g, T, estadisticas, desempate, seed, cotas, reducciones,
+                                                 instrumentos, bits, memoria)
+    elif bits:
+        from bitset import BnB_bits
+        busqueda, argumentos = BnB_bits, (g, T, estadisticas, desempate, seed, cotas, instrumentos)
+    elif workers > 1:
+        from paralelo import BnB_paralelo
+        busqueda, argumentos = BnB_paralelo, (g, T, workers, estadisticas, desempate, seed, cotas, reducciones,
+                                               profundidad, instrumentos, memoria)
+    else:
+        busqueda, argumentos = BnB, (g, T, estadisticas, desempate, seed, cotas, reducciones)
+        argumentos += ((), None, None, instrumentos, memoria, None, None, respaldo, reanudar)
+    # PERFILADO OPCIONAL DE LA BÚSQUEDA: <nombre>.prof (cProfile) o <nombre>.muestras (muestreo)
+    if perfil is not None:
+        Sol_VC, times = perfilar(perfil, nombre + ('.prof' if perfil == 'cprofile' else '.muestras'), busqueda,
+                                 *argumentos)
+    else:
+        Sol_VC, times = busqueda(*argumentos)
+    if respaldo is not None:
+        respaldo.cerrar()
+        instrumentos.imprimir(1, respaldo.resumen())
+    if workers > 1:
+        instrumentos.imprimir(1, 'Subproblemas:', estadisticas['subproblemas'])
+    if separar:
+        instrumentos.imprimir(1, 'Componentes:', estadisticas['componentes'])
+    if 'iteraciones' in estadisticas:
+        instrumentos.imprimir(1, 'Iteraciones LDS:', estadisticas['iteraciones'])
+    if 'cola_max' in estadisticas:
+        instrumentos.imprimir(1, 'Cola máxima:', estadisticas['cola_max'])
+    if 'componentes' in reducciones or separar:
+        from componentes import CACHE
+        cache = CACHE.estadisticas()
+        instrumentos.imprimir(1, 'Cache de componentes: %i aciertos, %i fallos' % (cache['aciertos'], cache['fallos']))
+    instrumentos.imprimir(1, 'Nodos explorados:', estadisticas['nodos'])
+    for cota, cantidad in estadisticas['podas'].items():
+        instrumentos.imprimir(1, 'Podas por cota %s: %i' % (cota, cantidad))
+    if 'memo' in estadisticas:
+        instrumentos.imprimir(1, 'Tabla de transposición: %(aciertos)i aciertos, %(fallos)i fallos (%(tasa).1f%%), '
+                                 '%(entradas)i entradas, %(exactas)i exactas, %(desalojos)i desalojos'
+                              % dict(estadisticas['memo'], tasa=100 * estadisticas['memo']['tasa']))
+
+    # ELIMINAR NODOS FALSOS (ESTADO=0) EN SoL_VC OBTENIDO (sin quitar de la lista que se recorre, que saltearía
+    # la entrada siguiente a cada una quitada)
+    Sol_VC = [element for element in Sol_VC if element[1] == 1]
+
+    # LLEVAR LA SOLUCIÓN Y EL SEGUIMIENTO DEL KERNEL A LOS IDS Y TAMAÑOS DEL GRAFO ORIGINAL
+    if K is not None:
+        Sol_VC = [(v, 1) for v in K.expandir([x[0] for x in Sol_VC])]
+        times = [(size + K.offset(), t + K.tiempo) for size, t in times]
 
     # ESCRIBIR SOLUCIÓN Y ARCHIVOS DE SEGUIMIENTO A "*.SOL" Y '*.TRACE" RESPECTIVAMENTE
-    inputdir, inputfile = os.path.split(inputfile)
-
-    # ESCRIBIR ARCHIVOS SOL
-    with open(inputfile.split('.')[0] + '_BnB_'+str(cutoff)+'.sol', 'w') as f:
-        f.write('%i\n' % (len(Sol_VC)))
-        f.write(','.join([str(x[0]) for x in Sol_VC]))
-
-    # ESCRIBIR ARCHIVOS DE SEGUIMIENTO
-    with open(inputfile.split('.')[0] + '_BnB_'+str(cutoff)+'.trace', 'w') as f:
-        for t in times:
-            f.write('%.2f,%i\n' % ((t[1]), t[0]))
+    escribir_salida(nombre, [x[0] for x in Sol_VC], times)
+    if checkpoint or resume:  # la corrida terminó: el checkpoint ya no sirve
+        borrar(ruta_respaldo(nombre))
 
 
 if __name__ == '__main__':
+    from estrategias import ESTRATEGIAS, INICIALES
     parser = argparse.ArgumentParser(prog='Analizador de entrada para Approx', description='Minimum vertex cover Branch and Bound')
     parser.add_argument('-inst', action='store', type=str,
                         required=True, help='Archivo de datos de Grafo de entrada')
     parser.add_argument('-time', action='store', default=1000, type=int,
                         required=True, help='Tiempo límite de ejecución del algoritmo')
+    parser.add_argument('-desempate', action='store', default='menor', choices=DESEMPATES,
+                        help='Desempate entre vértices de grado máximo: menor id o aleatorio')
+    parser.add_argument('-seed', action='store', default=None, type=int,
+                        help='Semilla para el desempate aleatorio')
+    parser.add_argument('-lb', action='store', default='maxdeg', type=str,
+                        help='Cotas inferiores separadas por coma, se usa el máximo: ' + ','.join(COTAS))
+    parser.add_argument('-kernel', action='store', default='', type=str,
+                        help='Reglas de reducción previas a la búsqueda, separadas por coma: ' + ','.join(REGLAS))
+    parser.add_argument('-reducir', action='store', default='', type=str,
+                        help='Reglas de reducción en cada nodo, separadas por coma: ' + ','.join(REGLAS_BUSQUEDA))
+    parser.add_argument('-workers', action='store', default=1, type=int,
+                        help='Cantidad de procesos para la búsqueda en paralelo')
+    parser.add_argument('-split', action='store', default=None, type=int,
+                        help='Profundidad de ramificación que define los subproblemas paralelos (por defecto según -workers)')
+    parser.add_argument('-out', action='store', default=DIRECTORIO_SALIDA, type=str,
+                        help='Directorio de los archivos de salida')
+    parser.add_argument('-v', action='store', default=1, type=int,
+                        help='Verbosidad: 0 nada, 1 mensajes habituales, 2 además el resumen de la instrumentación')
+    parser.add_argument('-stats', action='store', default=None, type=str,
+                        help="Archivo JSON lines para el flujo periódico de estadísticas ('-' para la salida estándar)")
+    parser.add_argument('-intervalo', action='store', default=1.0, type=float,
+                        help='Segundos entre líneas del flujo de estadísticas')
+    parser.add_argument('-tiempos', action='store_true',
+                        help='Medir el tiempo acumulado en aplicar, cotas, ramificar y deshacer')
+    parser.add_argument('-histograma', action='store_true',
+                        help='Registrar el histograma de profundidad de los retrocesos')
+    parser.add_argument('-perfil', action='store', default=None, choices=PERFILES,
+                        help='Perfilar la búsqueda con cProfile o por muestreo (se guarda junto al .sol)')
+    parser.add_argument('-bits', action='store_true',
+                        help='Búsqueda sobre conjuntos de bits, para grafos chicos (cotas maxdeg y degree)')
+    parser.add_argument('-memo', action='store', default=0, type=float,
+                        help='Memoria (MiB) de la tabla de transposición de Grafos restantes ya resueltos; 0 la desactiva')
+    parser.add_argument('-estrategia', action='store', default='dfs', choices=ESTRATEGIAS,
+                        help='Estrategia de búsqueda: profundidad, discrepancias limitadas o primero el mejor')
+    parser.add_argument('-inicial', action='store', default=None, choices=INICIALES,
+                        help='Cobertura inicial para el UpperBound: una heurística de heuristicas.py, la mejor de '
+                             'ellas (greedy) o la mejor más una búsqueda local corta (ls)')
+    parser.add_argument('-cola', action='store', default=128, type=float,
+                        help='Memoria (MiB) de la cola de prioridad de la estrategia mejor')
+    parser.add_argument('-componentes', action='store_true',
+                        help='Resolver por separado cada componente conexa del Grafo (después del kernel)')
+    parser.add_argument('-checkpoint', action='store', default=0, type=float,
+                        help='Segundos entre checkpoints de la búsqueda (<salida>.ckpt); 0 los desactiva')
+    parser.add_argument('-resume', action='store_true',
+                        help='Continuar desde el checkpoint de una corrida anterior con los mismos argumentos')
     args = parser.parse_args()
+    try:
+        elegir_cotas(args.lb)
+        kernel = elegir_reglas(args.kernel)
+        reducciones = elegir_reglas(args.reducir, REGLAS_BUSQUEDA)
+        if args.bits:
+            from bitset import elegir_cotas_bits
+            elegir_cotas_bits(args.lb)
+            if reducciones or args.workers > 1 or args.memo:
+                raise ValueError('El modo -bits no admite -reducir, -workers ni -memo')
+        if args.componentes and args.workers > 1:
+            raise ValueError('-componentes no admite -workers')
+        if (args.estrategia != 'dfs' or args.inicial) and (args.bits or args.workers > 1 or args.componentes):
+            raise ValueError('-estrategia e -inicial no admiten -bits, -workers ni -componentes')
+        if args.estrategia != 'dfs' and args.memo:
+            raise ValueError('-memo sólo se usa con la estrategia dfs')
+        if (args.checkpoint or args.resume) and (args.bits or args.workers > 1 or args.componentes or args.memo or
+                                                 args.estrategia != 'dfs' or args.inicial):
+            raise ValueError('-checkpoint y -resume no admiten -bits, -workers, -componentes, -memo, -estrategia '
+                             'ni -inicial')
+        if args.checkpoint < 0:
+            raise ValueError('-checkpoint debe ser positivo')
+    except ValueError as e:
+        parser.error(str(e))
 
     graph_file = args.inst
     cutoff = args.time
-    main(graph_file, cutoff)
+    instrumentos = Instrumentos(args.v, args.stats, args.intervalo, args.tiempos, args.histograma)
+    main(graph_file, cutoff, args.desempate, args.seed, args.lb, kernel, reducciones, args.workers, args.split, args.out,
+         instrumentos, args.perfil, args.bits, args.componentes, args.memo, args.estrategia, args.inicial, args.cola,
+         args.checkpoint, args.resume)
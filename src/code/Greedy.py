@@ -0,0 +1,76 @@
+'''
+Este archivo implementa un solver de heurísticas rápidas para la cobertura mínima de vértices de un Grafo de
+entrada dado.
+
+Instrucciones: el formato de los archivos de datos es el mismo que el de BnB.py.
+
+Se ejecutan en orden las heurísticas de heuristicas.py (emparejamiento maximal, voraz por grado máximo y voraz
+sin vértices redundantes), todas de tiempo lineal; cada una que mejora la cobertura anterior se registra en el
+seguimiento. El tiempo límite sólo se usa para no empezar una heurística pasado el cutoff y para el nombre de
+los archivos de salida.
+
+Language: Python 3
+### Running: python3 code/Greedy.py -inst data/karate.graph -time 600
+
+La salida serán dos archivos: *.sol y *.trace creados en la carpeta output del proyecto (o en la indicada con -out)
+*.sol --- registra el tamaño de la mejor cobertura encontrada y los nodos que contiene.
+*.trace --- registrar todas las mejoras encontradas y el momento en que se encontró
+
+### Help: python3 Greedy.py --help
+'''
+
+import argparse
+import time
+
+import cargador
+from heuristicas import HEURISTICAS, listas
+from salida import DIRECTORIO_SALIDA, escribir_salida, nombre_salida
+
+
+def main(archivo, cutoff, heuristicas=tuple(HEURISTICAS), salida=DIRECTORIO_SALIDA):
+    start_time = time.time()
+    grafo = cargador.cargar(archivo)
+    offsets, vecinos = listas(grafo.offsets, grafo.vecinos)
+
+    mejor = None
+    times = []
+    ejecutadas = 0
+    for nombre in heuristicas:
+        if time.time() - start_time >= cutoff:
+            print('Cutoff time reached')
+            break
+        cobertura = HEURISTICAS[nombre](offsets, vecinos)
+        ejecutadas += 1
+        print('%s: %i vertices (%.3f s)' % (nombre, len(cobertura), time.time() - start_time))
+        if mejor is None or len(cobertura) < len(mejor):
+            mejor = cobertura
+            times.append((len(mejor), time.time() - start_time))
+    print('Heuristicas: %i' % ejecutadas)
+    if mejor is None:
+        return
+    print('\nMejor cobertura encontrada: %i vertices\n' % len(mejor))
+
+    # ESCRIBIR SOLUCIÓN Y ARCHIVOS DE SEGUIMIENTO A "*.SOL" Y '*.TRACE" RESPECTIVAMENTE
+    nombre = nombre_salida(archivo, 'Greedy', cutoff, None, salida)
+    escribir_salida(nombre, sorted(x + 1 for x in mejor), times)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(prog='Analizador de entrada para Greedy',
+                                     description='Minimum vertex cover fast heuristics')
+    parser.add_argument('-inst', action='store', type=str,
+                        required=True, help='Archivo de datos de Grafo de entrada')
+    parser.add_argument('-time', action='store', default=600, type=int,
+                        help='Tiempo límite de ejecución del algoritmo')
+    parser.add_argument('-seed', action='store', default=None, type=int,
+                        help='Sin uso: las heurísticas son deterministas')
+    parser.add_argument('-heuristicas', action='store', default=','.join(HEURISTICAS), type=str,
+                        help='Heurísticas a ejecutar, separadas por coma: ' + ','.join(HEURISTICAS))
+    parser.add_argument('-out', action='store', default=DIRECTORIO_SALIDA, type=str,
+                        help='Directorio de los archivos de salida')
+    args = parser.parse_args()
+    heuristicas = [nombre for nombre in args.heuristicas.split(',') if nombre]
+    for nombre in heuristicas:
+        if nombre not in HEURISTICAS:
+            parser.error('Heurística desconocida: %s (opciones: %s)' % (nombre, ', '.join(HEURISTICAS)))
+    main(args.inst, args.time, heuristicas, args.out)
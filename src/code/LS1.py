@@ -0,0 +1,112 @@
+'''
+Este archivo implementa una búsqueda local por Recocido Simulado (Simulated Annealing) para encontrar una aproximacion
+a la cobertura mínima de vértices para un Grafo de entrada dado.
+
+Instrucciones: el formato de los archivos de datos es el mismo que el de BnB.py.
+
+La búsqueda parte de una cobertura voraz sin vértices redundantes y minimiza |C| + penalizacion * (aristas descubiertas).
+En cada paso se propone invertir un vértice: un extremo de una arista descubierta (si las hay, con probabilidad 1/2)
+o un vértice al azar de C. El costo del movimiento se lee de la tabla dscore de EstadoCobertura, por lo que cada paso
+cuesta O(grado) y no O(|E|).
+
+Language: Python 3
+### Running: python3 code/LS1.py -inst data/karate.graph -time 600 -seed 1045
+
+La salida serán dos archivos: *.sol y *.trace creados en la carpeta output del proyecto (o en la indicada con -out)
+*.sol --- registra el tamaño de la mejor cobertura encontrada y los nodos que contiene.
+*.trace --- registrar todas las mejoras encontradas durante la búsqueda y el momento en que se encontró
+
+### Help: python3 LS1.py --help
+'''
+
+import argparse
+import math
+
+import azar
+from busqueda_local import Reloj, construir_cobertura, leer_estado
+from salida import DIRECTORIO_SALIDA, escribir_salida, nombre_salida
+
+
+def recocido_simulado(estado, cutoff, rng, temperatura=2.0, enfriamiento=0.9999, temperatura_minima=0.05,
+                      penalizacion=2, start_time=None):
+    '''
+    Recocido simulado sobre un EstadoCobertura ya construido (cobertura completa).
+    Devuelve la mejor cobertura encontrada y la lista de mejoras (tamaño, tiempo)
+    '''
+    reloj = Reloj(cutoff, start_time)
+    mejor = list(estado.cobertura)
+    times = [(len(mejor), reloj.transcurrido())]
+    print('Cobertura inicial: %i vertices' % len(mejor))
+
+    en_c = estado.en_c
+    cobertura = estado.cobertura
+    descubiertas = estado.descubiertas
+    u = estado.u
+    v = estado.v
+    t = temperatura
+    while not reloj.agotado():
+        dscore = estado.dscore
+        if descubiertas and (not cobertura or rng.random() < 0.5):
+            e = descubiertas[rng.randrange(len(descubiertas))]
+            x = u[e] if rng.random() < 0.5 else v[e]
+        elif cobertura:
+            x = cobertura[rng.randrange(len(cobertura))]
+        else:
+            break
+
+        # delta de |C| + penalizacion * descubiertas (pesos unitarios: dscore cuenta aristas)
+        if en_c[x]:
+            delta = penalizacion * -dscore[x] - 1
+        else:
+            delta = 1 - penalizacion * dscore[x]
+        if delta <= 0 or rng.random() < math.exp(-delta / t):
+            if en_c[x]:
+                estado.quitar(x)
+            else:
+                estado.agregar(x)
+            if not descubiertas and len(cobertura) < len(mejor):
+                mejor = list(cobertura)
+                times.append((len(mejor), reloj.transcurrido()))
+                print('Mejor cobertura: %i vertices' % len(mejor))
+
+        t *= enfriamiento
+        if t < temperatura_minima:
+            # recalentamiento
+            t = temperatura
+    print('Pasos: %i' % reloj.pasos)
+    return mejor, times
+
+
+def main(archivo, cutoff, seed, temperatura=2.0, enfriamiento=0.9999, penalizacion=2, salida=DIRECTORIO_SALIDA):
+    reloj = Reloj(cutoff)
+    rng = azar.python(seed)
+    estado = leer_estado(archivo)
+    construir_cobertura(estado)
+    mejor, times = recocido_simulado(estado, cutoff, rng, temperatura, enfriamiento, penalizacion=penalizacion,
+                                     start_time=reloj.start_time)
+    print('\nMejor cobertura encontrada: %i vertices\n' % len(mejor))
+
+    # ESCRIBIR SOLUCIÓN Y ARCHIVOS DE SEGUIMIENTO A "*.SOL" Y '*.TRACE" RESPECTIVAMENTE
+    nombre = nombre_salida(archivo, 'LS1', cutoff, seed, salida)
+    escribir_salida(nombre, sorted(x + 1 for x in mejor), times)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(prog='Analizador de entrada para LS1',
+                                     description='Minimum vertex cover Simulated Annealing')
+    parser.add_argument('-inst', action='store', type=str,
+                        required=True, help='Archivo de datos de Grafo de entrada')
+    parser.add_argument('-time', action='store', default=600, type=int,
+                        help='Tiempo límite de ejecución del algoritmo')
+    parser.add_argument('-seed', action='store', default=None, type=int,
+                        help='Semilla del generador aleatorio')
+    parser.add_argument('-t0', action='store', default=2.0, type=float,
+                        help='Temperatura inicial (y de recalentamiento)')
+    parser.add_argument('-alfa', action='store', default=0.9999, type=float,
+                        help='Factor de enfriamiento por paso')
+    parser.add_argument('-penal', action='store', default=2, type=float,
+                        help='Penalización por arista descubierta')
+    parser.add_argument('-out', action='store', default=DIRECTORIO_SALIDA, type=str,
+                        help='Directorio de los archivos de salida')
+    args = parser.parse_args()
+    main(args.inst, args.time, args.seed, args.t0, args.alfa, args.penal, args.out)
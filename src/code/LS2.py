@@ -0,0 +1,140 @@
+'''
+Este archivo implementa una búsqueda local con pesos en las aristas (estilo NuMVC / FastVC) para encontrar una
+aproximacion a la cobertura mínima de vértices para un Grafo de entrada dado.
+
+Instrucciones: el formato de los archivos de datos es el mismo que el de BnB.py.
+
+La búsqueda parte de una cobertura voraz sin vértices redundantes. Cada vez que C cubre todas las aristas se guarda
+y se quita el vértice de mayor dscore; luego se intercambian vértices en dos etapas:
+- se quita de C el mejor de una muestra de 'bms' vértices (Best from Multiple Selection de FastVC), sin deshacer
+  el último agregado;
+- se elige una arista descubierta al azar y se agrega su extremo de mayor dscore que cumpla configuration checking.
+Después de cada intercambio las aristas descubiertas suman 1 a su peso; cuando el peso medio supera 'gamma' se
+multiplican todos por 'rho'. Agregar y quitar cuestan O(grado) gracias a las tablas de EstadoCobertura.
+
+Language: Python 3
+### Running: python3 code/LS2.py -inst data/karate.graph -time 600 -seed 1045
+
+La salida serán dos archivos: *.sol y *.trace creados en la carpeta output del proyecto (o en la indicada con -out)
+*.sol --- registra el tamaño de la mejor cobertura encontrada y los nodos que contiene.
+*.trace --- registrar todas las mejoras encontradas durante la búsqueda y el momento en que se encontró
+
+### Help: python3 LS2.py --help
+'''
+
+import argparse
+
+import azar
+from busqueda_local import Reloj, construir_cobertura, leer_estado
+from salida import DIRECTORIO_SALIDA, escribir_salida, nombre_salida
+
+
+def elegir_para_quitar(estado, rng, bms, tabu):
+    '''
+    Best from Multiple Selection: el vértice de mayor dscore entre 'bms' vértices de C tomados al azar
+    (todos si |C| <= bms), evitando 'tabu'
+    '''
+    cobertura = estado.cobertura
+    dscore = estado.dscore
+    if len(cobertura) <= bms:
+        candidatos = cobertura
+    else:
+        candidatos = [cobertura[rng.randrange(len(cobertura))] for _ in range(bms)]
+    mejor = -1
+    for x in candidatos:
+        if x != tabu and (mejor == -1 or dscore[x] > dscore[mejor]):
+            mejor = x
+    return mejor
+
+
+def numvc(estado, cutoff, rng, bms=50, gamma=None, rho=0.3, start_time=None):
+    '''
+    Búsqueda local con pesos sobre un EstadoCobertura ya construido (cobertura completa).
+    Devuelve la mejor cobertura encontrada y la lista de mejoras (tamaño, tiempo)
+    '''
+    if gamma is None:
+        gamma = max(2, estado.n // 2)
+    reloj = Reloj(cutoff, start_time)
+    mejor = list(estado.cobertura)
+    times = [(len(mejor), reloj.transcurrido())]
+    print('Cobertura inicial: %i vertices' % len(mejor))
+
+    en_c = estado.en_c
+    cobertura = estado.cobertura
+    descubiertas = estado.descubiertas
+    conf = estado.conf
+    u = estado.u
+    v = estado.v
+    peso_total = sum(estado.peso)
+    tabu = -1
+    while not reloj.agotado():
+        dscore = estado.dscore
+        if not descubiertas:
+            if len(cobertura) < len(mejor):
+                mejor = list(cobertura)
+                times.append((len(mejor), reloj.transcurrido()))
+                print('Mejor cobertura: %i vertices' % len(mejor))
+            if not cobertura:
+                break
+            estado.quitar(max(cobertura, key=dscore.__getitem__))
+            continue
+
+        # PRIMERA ETAPA: QUITAR
+        x = elegir_para_quitar(estado, rng, bms, tabu)
+        if x != -1:
+            estado.quitar(x)
+
+        # SEGUNDA ETAPA: AGREGAR UN EXTREMO DE UNA ARISTA DESCUBIERTA
+        e = descubiertas[rng.randrange(len(descubiertas))]
+        a, b = u[e], v[e]
+        if not conf[a]:
+            y = b
+        elif not conf[b]:
+            y = a
+        else:
+            y = a if dscore[a] > dscore[b] or (dscore[a] == dscore[b] and rng.random() < 0.5) else b
+        estado.agregar(y)
+        tabu = y
+
+        # PESOS
+        peso_total += len(descubiertas)
+        estado.aumentar_pesos()
+        if peso_total > gamma * estado.m:
+            estado.olvidar_pesos(rho)
+            peso_total = sum(estado.peso)
+    print('Pasos: %i' % reloj.pasos)
+    return mejor, times
+
+
+def main(archivo, cutoff, seed, bms=50, gamma=None, rho=0.3, salida=DIRECTORIO_SALIDA):
+    reloj = Reloj(cutoff)
+    rng = azar.python(seed)
+    estado = leer_estado(archivo)
+    construir_cobertura(estado)
+    mejor, times = numvc(estado, cutoff, rng, bms, gamma, rho, start_time=reloj.start_time)
+    print('\nMejor cobertura encontrada: %i vertices\n' % len(mejor))
+
+    # ESCRIBIR SOLUCIÓN Y ARCHIVOS DE SEGUIMIENTO A "*.SOL" Y '*.TRACE" RESPECTIVAMENTE
+    nombre = nombre_salida(archivo, 'LS2', cutoff, seed, salida)
+    escribir_salida(nombre, sorted(x + 1 for x in mejor), times)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(prog='Analizador de entrada para LS2',
+                                     description='Minimum vertex cover edge weighting local search')
+    parser.add_argument('-inst', action='store', type=str,
+                        required=True, help='Archivo de datos de Grafo de entrada')
+    parser.add_argument('-time', action='store', default=600, type=float,
+                        help='Tiempo límite de ejecución del algoritmo')
+    parser.add_argument('-seed', action='store', default=None, type=int,
+                        help='Semilla del generador aleatorio')
+    parser.add_argument('-bms', action='store', default=50, type=int,
+                        help='Tamaño de la muestra para elegir el vértice a quitar')
+    parser.add_argument('-gamma', action='store', default=None, type=int,
+                        help='Umbral de peso medio para el olvido de pesos (por defecto |V|/2)')
+    parser.add_argument('-rho', action='store', default=0.3, type=float,
+                        help='Factor de olvido de pesos')
+    parser.add_argument('-out', action='store', default=DIRECTORIO_SALIDA, type=str,
+                        help='Directorio de los archivos de salida')
+    args = parser.parse_args()
+    main(args.inst, args.time, args.seed, args.bms, args.gamma, args.rho, args.out)
@@ -0,0 +1,229 @@
+'''
+Este archivo implementa el análisis de los seguimientos (.trace) de las corridas guardadas en la carpeta output.
+
+Las corridas se agrupan por instancia, algoritmo y cutoff (a partir del nombre <instancia>_<alg>_<cutoff>[_<seed>]);
+cada semilla es una corrida del grupo. Para cada instancia se usa como referencia el óptimo indicado con
+-optimos o, si no se indica, la mejor cobertura encontrada por todas las corridas de esa instancia.
+- Tabla de error relativo: por grupo, cantidad de corridas, tamaño final mínimo y promedio, error relativo
+  promedio (tamaño - referencia) / referencia y tiempo promedio de la última mejora.
+- Curvas tiempo-a-objetivo (TTT): para cada objetivo q el tamaño buscado es floor(referencia * (1 + q)); el
+  tiempo de una corrida es el de la primera mejora que lo alcanza. La curva es la distribución empírica
+  P(T <= t_i) = (i - 0.5) / n con los tiempos ordenados, donde n incluye a las corridas que no lo alcanzaron.
+  Se imprime cuántas corridas lo alcanzaron y la mediana de los tiempos; con -csv se guardan los puntos de cada
+  curva (ttt.csv) y la tabla de errores (errores.csv) para graficarlos. Una corrida que alcanzó el objetivo
+  sólo en su .sol cuenta como alcanzada, pero sin tiempo: no entra en la curva ni en la mediana.
+Se leen los dos formatos de .trace de la carpeta output ('0.00, 34' y '0.0005130767822265625,30', ver salida.py).
+El tamaño final de una corrida es el menor entre su .trace y su .sol, porque algunos .trace terminan antes de
+la última mejora. Sólo se usan los .sol que son coberturas de su instancia (ver verificador.py).
+
+Language: Python 3
+### Running: python3 code/analisis.py
+### Running: python3 code/analisis.py -dir output -objetivos 0 0.01 0.05 -optimos karate=14 jazz=158 -csv output/analisis
+
+### Help: python3 analisis.py --help
+'''
+
+import argparse
+import collections
+import csv
+import glob
+import math
+import os
+
+import cargador
+from salida import DIRECTORIO_SALIDA, leer_sol, leer_trace, partes_nombre
+from verificador import DIRECTORIO_DATOS, instancias, verificar_cobertura
+
+Corrida = collections.namedtuple('Corrida', ['inst', 'alg', 'cutoff', 'seed', 'mejoras', 'final'])
+
+
+def tamano_sol(archivo, ruta_grafo, grafos):
+    '''
+    Tamaño de la solución del .sol si existe y es una cobertura de su instancia (None en otro caso); grafos
+    guarda las instancias ya cargadas con los extremos de sus aristas
+    '''
+    if ruta_grafo is None or not os.path.exists(archivo):
+        return None
+    try:
+        tamano, vertices = leer_sol(archivo)
+    except (OSError, ValueError):
+        return None
+    if ruta_grafo not in grafos:
+        grafo = cargador.cargar(ruta_grafo)
+        grafos[ruta_grafo] = (grafo,) + cargador.aristas(grafo)
+    grafo, u, v = grafos[ruta_grafo]
+    if verificar_cobertura(grafo, tamano, vertices, u, v):
+        return None
+    return tamano
+
+
+def leer_corridas(directorio, conocidas=None):
+    '''
+    Lista de Corrida de los .trace del directorio; mejoras es la lista de (tiempo, tamaño). conocidas es el
+    diccionario nombre -> ruta de las instancias (ver verificador.instancias()); sin él no se usan los .sol
+    '''
+    conocidas = conocidas or {}
+    corridas = []
+    grafos = {}
+    for archivo in sorted(glob.glob(os.path.join(directorio, '*.trace'))):
+        partes = partes_nombre(archivo, conocidas)
+        if partes is None:
+            continue
+        mejoras = leer_trace(archivo)
+        # el .trace puede terminar antes de la última mejora: el final es el menor entre él y el .sol válido
+        finales = [tamano for t, tamano in mejoras]
+        sol = tamano_sol(archivo[:-len('.trace')] + '.sol', conocidas.get(partes[0]), grafos)
+        if sol is not None:
+            finales.append(sol)
+        corridas.append(Corrida(*partes, mejoras=mejoras, final=min(finales) if finales else None))
+    return corridas
+
+
+def tiempo_a_objetivo(mejoras, objetivo):
+    '''
+    Momento de la primera mejora con tamaño <= objetivo (None si no se alcanzó)
+    '''
+    for t, tamano in mejoras:
+        if tamano <= objetivo:
+            return t
+    return None
+
+
+def curva_ttt(tiempos, n):
+    '''
+    Puntos (t, P(T <= t)) de la distribución empírica de los tiempos alcanzados entre n corridas
+    '''
+    return [(t, (i + 0.5) / n) for i, t in enumerate(sorted(tiempos))]
+
+
+def mediana(valores):
+    valores = sorted(valores)
+    medio = len(valores) // 2
+    return valores[medio] if len(valores) % 2 else (valores[medio - 1] + valores[medio]) / 2
+
+
+def agrupar(corridas):
+    grupos = collections.OrderedDict()
+    for c in sorted(corridas, key=lambda c: (c.inst, c.alg, float(c.cutoff))):
+        grupos.setdefault((c.inst, c.alg, c.cutoff), []).append(c)
+    return grupos
+
+
+def referencias(corridas, optimos):
+    '''
+    Tamaño de referencia por instancia: el óptimo indicado o la mejor cobertura de todas las corridas
+    '''
+    mejores = dict(optimos)
+    for c in corridas:
+        if c.inst not in optimos and c.final is not None:
+            mejores[c.inst] = min(mejores.get(c.inst, c.final), c.final)
+    return mejores
+
+
+def tabla_errores(grupos, referencia):
+    filas = []
+    for (inst, alg, cutoff), corridas in grupos.items():
+        finales = [c.final for c in corridas if c.final is not None]
+        ultimas = [c.mejoras[-1][0] for c in corridas if c.mejoras]
+        ref = referencia.get(inst)
+        filas.append({
+            'inst': inst, 'alg': alg, 'cutoff': cutoff, 'corridas': len(corridas), 'referencia': ref,
+            'minimo': min(finales) if finales else None,
+            'promedio': sum(finales) / len(finales) if finales else None,
+            'error_relativo': (sum((f - ref) / ref for f in finales) / len(finales)) if finales and ref else None,
+            'tiempo_mejor': sum(ultimas) / len(ultimas) if ultimas else None,
+        })
+    return filas
+
+
+def tabla_ttt(grupos, referencia, objetivos):
+    filas = []
+    puntos = []
+    for (inst, alg, cutoff), corridas in grupos.items():
+        ref = referencia.get(inst)
+        if ref is None:
+            continue
+        for q in objetivos:
+            objetivo = int(math.floor(ref * (1 + q) + 1e-9))
+            tiempos = [t for t in (tiempo_a_objetivo(c.mejoras, objetivo) for c in corridas) if t is not None]
+            alcanzadas = sum(1 for c in corridas if c.final is not None and c.final <= objetivo)
+            filas.append({'inst': inst, 'alg': alg, 'cutoff': cutoff, 'q': q, 'objetivo': objetivo,
+                          'alcanzadas': alcanzadas, 'corridas': len(corridas),
+                          'mediana': mediana(tiempos) if tiempos else None})
+            for t, p in curva_ttt(tiempos, len(corridas)):
+                puntos.append({'inst': inst, 'alg': alg, 'cutoff': cutoff, 'q': q, 'objetivo': objetivo,
+                               'tiempo': t, 'probabilidad': p})
+    return filas, puntos
+
+
+def formato(valor, patron):
+    return '-' if valor is None else patron % valor
+
+
+def main(directorio, objetivos, optimos, salida_csv=None, datos=DIRECTORIO_DATOS):
+    corridas = leer_corridas(directorio, instancias(datos))
+    if not corridas:
+        print('No hay archivos .trace en %s' % directorio)
+        return
+    grupos = agrupar(corridas)
+    referencia = referencias(corridas, optimos)
+    errores = tabla_errores(grupos, referencia)
+    ttt, puntos = tabla_ttt(grupos, referencia, objetivos)
+
+    print('ERROR RELATIVO (referencia: %s)' % ('óptimos indicados y mejor conocida' if optimos else 'mejor conocida'))
+    patron = '%-14s %-7s %-7s %8s %6s %8s %10s %10s %11s'
+    print(patron % ('INSTANCIA', 'ALG', 'CUTOFF', 'CORRIDAS', 'REF', 'MINIMO', 'PROMEDIO', 'ERROR REL', 'T. MEJORA'))
+    for f in errores:
+        print(patron % (f['inst'], f['alg'], f['cutoff'], f['corridas'], formato(f['referencia'], '%i'),
+                        formato(f['minimo'], '%i'), formato(f['promedio'], '%.1f'),
+                        formato(f['error_relativo'], '%.4f'), formato(f['tiempo_mejor'], '%.2f')))
+
+    print('\nTIEMPO A OBJETIVO (corridas que lo alcanzaron / corridas, mediana del tiempo)')
+    print('%-14s %-7s %-7s ' % ('INSTANCIA', 'ALG', 'CUTOFF') + ' '.join('%18s' % ('q=%g' % q) for q in objetivos))
+    por_grupo = collections.OrderedDict()
+    for f in ttt:
+        por_grupo.setdefault((f['inst'], f['alg'], f['cutoff']), []).append(f)
+    for (inst, alg, cutoff), filas in por_grupo.items():
+        celdas = ['%i/%i %s' % (f['alcanzadas'], f['corridas'], formato(f['mediana'], '%.3fs')) for f in filas]
+        print('%-14s %-7s %-7s ' % (inst, alg, cutoff) + ' '.join('%18s' % c for c in celdas))
+
+    if salida_csv:
+        os.makedirs(salida_csv, exist_ok=True)
+        for nombre, filas in (('errores.csv', errores), ('ttt.csv', puntos)):
+            with open(os.path.join(salida_csv, nombre), 'w', newline='') as f:
+                escritor = csv.DictWriter(f, fieldnames=list(filas[0]) if filas else ['inst'])
+                escritor.writeheader()
+                escritor.writerows(filas)
+        print('\nCSV escritos en %s' % salida_csv)
+
+
+def leer_optimos(valores):
+    '''
+    Óptimos conocidos con la forma instancia=tamaño
+    '''
+    optimos = {}
+    for valor in valores:
+        inst, _, tamano = valor.partition('=')
+        optimos[inst] = int(tamano)
+    return optimos
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(prog='Análisis de seguimientos',
+                                     description='Curvas tiempo-a-objetivo y errores relativos de los .trace')
+    parser.add_argument('-dir', action='store', default=DIRECTORIO_SALIDA, type=str,
+                        help='Directorio con los archivos .trace y .sol')
+    parser.add_argument('-objetivos', nargs='+', default=[0, 0.01, 0.05], type=float,
+                        help='Errores relativos objetivo de las curvas tiempo-a-objetivo')
+    parser.add_argument('-optimos', nargs='*', default=[], type=str,
+                        help='Óptimos conocidos con la forma instancia=tamaño (por defecto la mejor cobertura encontrada)')
+    parser.add_argument('-csv', action='store', default=None, type=str,
+                        help='Directorio donde escribir errores.csv y ttt.csv')
+    parser.add_argument('-data', action='store', default=DIRECTORIO_DATOS, type=str,
+                        help='Directorio de las instancias, para separar el nombre de la instancia del archivo')
+    args = parser.parse_args()
+    try:
+        optimos = leer_optimos(args.optimos)
+    except ValueError:
+        parser.error('-optimos espera valores instancia=tamaño')
+    main(args.dir, args.objetivos, optimos, args.csv, args.data)
@@ -0,0 +1,60 @@
+'''
+Este archivo centraliza los generadores aleatorios de los solvers, para que una corrida sea reproducible con
+la misma semilla (y la misma cantidad de procesos).
+
+Ningún solver usa el estado global de random ni de numpy.random: cada uno recibe un generador explícito creado
+a partir de -seed.
+- generador(): numpy.random.Generator, para las operaciones vectorizadas (Approx.py, islas.py).
+- python(): random.Random, para los ciclos con sorteos escalares (LS1, LS2), donde un sorteo de random es varias
+  veces más rápido que uno de numpy, y para el orden aleatorio del desempate de BnB. Con una semilla entera da la
+  misma secuencia que random.Random(seed), así las corridas de LS1 y LS2 son comparables con las de versiones
+  anteriores.
+- derivar(): una numpy.random.SeedSequence independiente por proceso, isla o subproblema. Ambos generadores
+  aceptan una SeedSequence derivada en lugar de la semilla.
+Con seed None las secuencias se inicializan con entropía del sistema (corridas no reproducibles).
+
+Language: Python 3
+'''
+
+import random
+
+import numpy
+
+
+def secuencia(seed=None):
+    '''
+    SeedSequence a partir de una semilla entera, una SeedSequence o None
+    '''
+    if isinstance(seed, numpy.random.SeedSequence):
+        return seed
+    return numpy.random.SeedSequence(seed)
+
+
+def generador(seed=None):
+    '''
+    numpy.random.Generator a partir de la semilla (si ya es un Generator se devuelve el mismo)
+    '''
+    if isinstance(seed, numpy.random.Generator):
+        return seed
+    return numpy.random.default_rng(secuencia(seed))
+
+
+def python(seed=None):
+    '''
+    random.Random a partir de la semilla (si ya es un random.Random se devuelve el mismo)
+    '''
+    if isinstance(seed, random.Random):
+        return seed
+    if isinstance(seed, numpy.random.SeedSequence):
+        seed = int(seed.generate_state(1, numpy.uint64)[0])
+    return random.Random(seed)
+
+
+def derivar(seed, cantidad):
+    '''
+    Lista de 'cantidad' SeedSequence independientes derivadas de la semilla; con seed None devuelve Nones
+    (cada proceso usa entropía del sistema)
+    '''
+    if seed is None:
+        return [None] * cantidad
+    return secuencia(seed).spawn(cantidad)
@@ -0,0 +1,210 @@
+'''
+Este archivo implementa el modo de conjuntos de bits (bitsets) de BnB, para grafos chicos y medianos.
+
+El grafo restante y la cobertura parcial se representan con enteros de Python usados como conjuntos de bits:
+- vecinos[v]: máscara con los vecinos de v en el grafo original (bit u encendido si (u,v) es arista).
+- vivos: máscara de los vértices que siguen en el grafo restante.
+Elegir v (state=1) es vivos & ~(1 << v); descartar v (state=0) agrega a la cobertura sus vecinos vivos,
+vecinos[v] & vivos, y los quita con una sola operación AND sobre todas las palabras a la vez. El grado de u en
+el grafo restante es (vecinos[u] & vivos).bit_count().
+
+Como cada entrada de la frontera guarda la máscara de su padre, no hay trail ni deshacer: retroceder es tomar
+la siguiente entrada. En cada nodo se recorre la lista de vértices con grado positivo (heredada del padre y
+filtrada) para obtener a la vez |E|, el grado máximo y la lista de los hijos.
+
+El orden de ramificación y las cotas son los mismos que los de BnB(), por lo que con el desempate 'menor' se
+encuentran las mismas soluciones en el mismo orden y la salida (*.sol y *.trace) coincide con la de BnB()
+(salvo los tiempos). Lo mismo vale para el desempate 'aleatorio' con la misma semilla, porque ambos usan el
+orden aleatorio de grafo.claves_desempate().
+Cotas disponibles: 'maxdeg' y 'degree'; no se aplican reducciones dentro de la búsqueda.
+
+Conviene en grafos de hasta unos cientos de vértices (karate, football, jazz), donde explora más nodos por
+segundo que el Grafo CSR. En grafos más grandes (email, delaunay_n10, netscience) recorrer todos los vértices
+activos en cada nodo cuesta más que las actualizaciones O(grado) del Grafo CSR (ver bench/bnb_grafo.py).
+
+Language: Python 3
+'''
+
+import time
+
+from cotas import ceil
+from grafo import claves_desempate
+from instrumentos import Instrumentos
+
+COTAS_BITS = ('maxdeg', 'degree')
+
+
+def mascaras(G):
+    '''
+    Máscaras de vecinos (en el Grafo original) y máscara de los vértices no eliminados de G
+    '''
+    vecinos = [0] * (G.n + 1)
+    for v in range(1, G.n + 1):
+        mascara = 0
+        for u in G.all_neighbors(v):
+            mascara |= 1 << u
+        vecinos[v] = mascara
+    vivos = 0
+    for v in G.nodes():
+        vivos |= 1 << v
+    return vecinos, vivos
+
+
+def elegir_cotas_bits(nombres):
+    if isinstance(nombres, str):
+        nombres = [nombre for nombre in nombres.split(',') if nombre]
+    for nombre in nombres:
+        if nombre not in COTAS_BITS:
+            raise ValueError('Cota no disponible en el modo bitset: %s (opciones: %s)'
+                             % (nombre, ', '.join(COTAS_BITS)))
+    return list(nombres)
+
+
+def cota_degree_bits(grados, m):
+    '''
+    Cota por secuencia de grados (ver cotas.cota_degree) a partir de la lista de grados positivos
+    '''
+    cubiertas = 0
+    k = 0
+    for d in sorted(grados, reverse=True):
+        if cubiertas + d >= m:
+            return k + 1
+        cubiertas += d
+        k += 1
+    return k
+
+
+def cobertura(G, cadena):
+    '''
+    Reconstruye la cobertura como la lista (node,state) que arma BnB() en CurVC: cadena es la lista enlazada
+    (padre, v, state, vivos antes de la decisión) de las decisiones desde la raíz
+    '''
+    decisiones = []
+    while cadena is not None:
+        cadena, v, state, vivos = cadena
+        decisiones.append((v, state, vivos))
+    VC = []
+    for v, state, vivos in reversed(decisiones):
+        if state == 0:
+            VC.extend((u, 1) for u in G.all_neighbors(v) if vivos >> u & 1)
+        VC.append((v, state))
+    return VC
+
+
+def BnB_bits(G, T, estadisticas=None, desempate='menor', seed=None, cotas='maxdeg', instrumentos=None):
+    '''
+    Funcion Branch and Bound sobre bitsets; mismos argumentos y resultado (OptVC, times) que BnB()
+    '''
+    cotas = elegir_cotas_bits(cotas)
+    if instrumentos is None:
+        instrumentos = Instrumentos()
+    histograma = instrumentos.histograma
+    instrumentos.abrir()
+    proxima_emision = instrumentos.intervalo if instrumentos.flujo is not None else float('inf')
+    clave = claves_desempate(G.n + 1, desempate, seed) if desempate == 'aleatorio' else None
+
+    start_time = time.time()
+    delta_time = 0.0
+    times = []
+    vecinos, vivos = mascaras(G)
+    bits = [1 << u for u in range(G.n + 1)]
+
+    OptVC = []
+    nodos = 0
+    podas = dict((nombre, 0) for nombre in cotas)
+    UpperBound = G.number_of_nodes()
+    instrumentos.imprimir(1, 'Initial UpperBound:', UpperBound)
+
+    def analizar(vivos, lista):
+        '''
+        Grados en el grafo restante: devuelve (lista de vértices con grado positivo, grados, |E|, vértice de
+        grado máximo, grado máximo)
+        '''
+        activos = []
+        grados = []
+        suma = 0
+        dmax = 0
+        vmax = -1
+        for u in lista:
+            if not vivos & bits[u]:
+                continue
+            d = (vecinos[u] & vivos).bit_count()
+            if d:
+                activos.append(u)
+                grados.append(d)
+                suma += d
+                if d > dmax:
+                    dmax = d
+                    vmax = u
+                elif clave is not None and d == dmax and clave[u] < clave[vmax]:
+                    vmax = u
+        return activos, grados, suma // 2, vmax, dmax
+
+    activos, grados, m, v, dmax = analizar(vivos, G.nodes())
+    Frontier = []
+    if m == 0:  # el Grafo sin aristas se cubre con el conjunto vacío
+        times.append((0, time.time() - start_time))
+    else:
+        # entradas (node, state, vivos del padre, tamaño de la cobertura del padre, vértices activos del padre,
+        # cadena de decisiones del padre, profundidad)
+        Frontier.append((v, 0, vivos, 0, activos, None, 0))
+        Frontier.append((v, 1, vivos, 0, activos, None, 0))
+
+    while Frontier != [] and delta_time < T:
+        vi, state, vivos, size, lista, cadena, profundidad = Frontier.pop()
+        nodos += 1
+
+        cadena = (cadena, vi, state, vivos)
+        if state == 0:
+            quitados = vecinos[vi] & vivos
+            size += quitados.bit_count()
+            vivos &= ~quitados
+        else:
+            vivos &= ~bits[vi]
+            size += 1
+
+        activos, grados, m, vj, dmax = analizar(vivos, lista)
+        if m == 0:  # fin de la exploración, solución encontrada
+            if size < UpperBound:
+                UpperBound = size
+                OptVC = cobertura(G, cadena)
+                instrumentos.imprimir(1, 'Current Opt VC size', size)
+                times.append((size, time.time() - start_time))
+            backtrack = True
+        else:
+            # cotas en el orden elegido; la poda se atribuye a la primera que alcanza UpperBound
+            margen = UpperBound - size
+            podadora = None
+            for nombre in cotas:
+                cota = ceil(m / dmax) if nombre == 'maxdeg' else cota_degree_bits(grados, m)
+                if cota >= margen:
+                    podadora = nombre
+                    break
+            if podadora is not None:
+                podas[podadora] += 1
+                backtrack = True
+            else:
+                Frontier.append((vj, 0, vivos, size, activos, cadena, profundidad + 1))
+                Frontier.append((vj, 1, vivos, size, activos, cadena, profundidad + 1))
+                backtrack = False
+
+        if backtrack and histograma is not None:
+            histograma[profundidad] += 1
+
+        delta_time = time.time() - start_time
+        if delta_time >= proxima_emision:
+            instrumentos.emitir(delta_time, nodos, podas, len(Frontier), UpperBound, profundidad)
+            proxima_emision += instrumentos.intervalo
+        if delta_time > T:
+            instrumentos.imprimir(1, 'Cutoff time reached')
+
+    if instrumentos.flujo is not None:
+        instrumentos.emitir(delta_time, nodos, podas, len(Frontier), UpperBound, 0, 'fin')
+    instrumentos.cerrar()
+
+    if estadisticas is not None:
+        estadisticas['nodos'] = nodos
+        estadisticas['podas'] = podas
+        estadisticas['tiempo'] = delta_time
+        instrumentos.resumen(estadisticas)
+    return OptVC, times
@@ -0,0 +1,206 @@
+'''
+Este archivo implementa la estructura común de los solvers de búsqueda local (LS1.py y LS2.py).
+
+EstadoCobertura mantiene una cobertura parcial C junto con tablas de puntajes incrementales:
+- dscore[v]: cambio en el peso total de aristas descubiertas al invertir v. Para v en C es <= 0 (las aristas
+  que sólo cubre v, con signo negativo); para v fuera de C es >= 0 (las aristas descubiertas que cubriría).
+- el conjunto de aristas descubiertas y el conjunto C, como listas con posiciones para agregar, quitar
+  y elegir al azar en O(1).
+Agregar o quitar un vértice actualiza todas las tablas en O(grado).
+
+Language: Python 3
+'''
+
+import time
+
+import cargador
+
+
+class EstadoCobertura:
+    '''
+    Cobertura parcial con puntajes y pesos de aristas mantenidos en forma incremental
+    '''
+
+    def __init__(self, n, u, v):
+        '''
+        n: cantidad de vértices (ids desde 0); u, v: listas de extremos de cada arista
+        '''
+        self.n = n
+        self.m = len(u)
+        self.u = u
+        self.v = v
+        # INCIDENCIA EN FORMATO CSR: aristas y extremo opuesto de cada vértice
+        grado = [0] * (n + 1)
+        for a, b in zip(u, v):
+            grado[a] += 1
+            grado[b] += 1
+        self.offsets = offsets = [0] * (n + 1)
+        for x in range(n):
+            offsets[x + 1] = offsets[x] + grado[x]
+        siguiente = offsets[:-1]
+        self.incidentes = incidentes = [0] * (2 * self.m)
+        self.opuestos = opuestos = [0] * (2 * self.m)
+        for e, (a, b) in enumerate(zip(u, v)):
+            incidentes[siguiente[a]] = e
+            opuestos[siguiente[a]] = b
+            siguiente[a] += 1
+            incidentes[siguiente[b]] = e
+            opuestos[siguiente[b]] = a
+            siguiente[b] += 1
+        self.grado = grado[:n]
+
+        self.peso = [1] * self.m
+        self.en_c = bytearray(n)
+        # con C vacío todas las aristas están descubiertas
+        self.dscore = self.grado.copy()
+        self.descubiertas = list(range(self.m))
+        self.pos_descubierta = list(range(self.m))
+        self.cobertura = []
+        self.pos_cobertura = [0] * n
+        # configuration checking (NuMVC): conf[v] == 1 si algún vecino cambió desde que v salió de C
+        self.conf = bytearray(b'\x01') * n
+
+    def agregar(self, x):
+        '''
+        Agrega x a la cobertura
+        '''
+        en_c = self.en_c
+        dscore = self.dscore
+        peso = self.peso
+        conf = self.conf
+        descubiertas = self.descubiertas
+        pos_descubierta = self.pos_descubierta
+        en_c[x] = 1
+        self.pos_cobertura[x] = len(self.cobertura)
+        self.cobertura.append(x)
+        d = 0
+        for i in range(self.offsets[x], self.offsets[x + 1]):
+            y = self.opuestos[i]
+            e = self.incidentes[i]
+            w = peso[e]
+            if en_c[y]:
+                # la arista pasa de estar cubierta sólo por y a estar cubierta por ambos
+                dscore[y] += w
+            else:
+                # la arista descubierta pasa a estar cubierta sólo por x
+                dscore[y] -= w
+                d -= w
+                ultima = descubiertas.pop()
+                if ultima != e:
+                    descubiertas[pos_descubierta[e]] = ultima
+                    pos_descubierta[ultima] = pos_descubierta[e]
+            conf[y] = 1
+        dscore[x] = d
+
+    def quitar(self, x):
+        '''
+        Quita x de la cobertura
+        '''
+        en_c = self.en_c
+        dscore = self.dscore
+        peso = self.peso
+        conf = self.conf
+        descubiertas = self.descubiertas
+        pos_descubierta = self.pos_descubierta
+        en_c[x] = 0
+        ultimo = self.cobertura.pop()
+        if ultimo != x:
+            self.cobertura[self.pos_cobertura[x]] = ultimo
+            self.pos_cobertura[ultimo] = self.pos_cobertura[x]
+        d = 0
+        for i in range(self.offsets[x], self.offsets[x + 1]):
+            y = self.opuestos[i]
+            e = self.incidentes[i]
+            w = peso[e]
+            if en_c[y]:
+                # la arista pasa a estar cubierta sólo por y
+                dscore[y] -= w
+            else:
+                # la arista queda descubierta
+                dscore[y] += w
+                d += w
+                pos_descubierta[e] = len(descubiertas)
+                descubiertas.append(e)
+            conf[y] = 1
+        dscore[x] = d
+        conf[x] = 0
+
+    def aumentar_pesos(self):
+        '''
+        Suma 1 al peso de cada arista descubierta (ambos extremos fuera de C ganan 1 de dscore)
+        '''
+        peso = self.peso
+        dscore = self.dscore
+        u = self.u
+        v = self.v
+        for e in self.descubiertas:
+            peso[e] += 1
+            dscore[u[e]] += 1
+            dscore[v[e]] += 1
+
+    def olvidar_pesos(self, rho):
+        '''
+        Multiplica todos los pesos por rho (mínimo 1) y recalcula los puntajes en O(|E|)
+        '''
+        self.peso = peso = [max(1, int(rho * w)) for w in self.peso]
+        dscore = self.dscore = [0] * self.n
+        en_c = self.en_c
+        for e, (a, b) in enumerate(zip(self.u, self.v)):
+            if en_c[a] and not en_c[b]:
+                dscore[a] -= peso[e]
+            elif en_c[b] and not en_c[a]:
+                dscore[b] -= peso[e]
+            elif not en_c[a] and not en_c[b]:
+                dscore[a] += peso[e]
+                dscore[b] += peso[e]
+
+    def quitar_redundantes(self):
+        '''
+        Quita los vértices de C que no cubren ninguna arista en forma exclusiva (dscore == 0)
+        '''
+        for x in list(self.cobertura):
+            if self.en_c[x] and self.dscore[x] == 0:
+                self.quitar(x)
+
+
+def construir_cobertura(estado):
+    '''
+    Construcción voraz por aristas (FastVC): cada arista descubierta agrega su extremo de mayor grado;
+    luego se quitan los vértices redundantes
+    '''
+    en_c = estado.en_c
+    grado = estado.grado
+    for a, b in zip(estado.u, estado.v):
+        if not en_c[a] and not en_c[b]:
+            estado.agregar(a if grado[a] >= grado[b] else b)
+    estado.quitar_redundantes()
+
+
+def leer_estado(archivo):
+    '''
+    Lee un archivo de Grafo y devuelve el EstadoCobertura inicial (C vacío)
+    '''
+    grafo = cargador.cargar(archivo)
+    u, v = cargador.aristas(grafo)
+    return EstadoCobertura(grafo.n, u.tolist(), v.tolist())
+
+
+class Reloj:
+    '''
+    Control del tiempo límite consultando time.time() sólo cada 'cada' pasos
+    '''
+
+    def __init__(self, cutoff, start_time=None, cada=1024):
+        self.start_time = time.time() if start_time is None else start_time
+        self.cutoff = cutoff
+        self.cada = cada
+        self.pasos = 0
+
+    def transcurrido(self):
+        return time.time() - self.start_time
+
+    def agotado(self):
+        self.pasos += 1
+        if self.pasos % self.cada:
+            return False
+        return self.transcurrido() >= self.cutoff
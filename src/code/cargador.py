@@ -0,0 +1,195 @@
+'''
+Este archivo implementa la lectura de los archivos de Grafo (.graph) compartida por todos los solvers.
+
+Formato: la primera fila contiene número de vértices, número de aristas y pesos; la fila i+1 contiene los
+vecinos del vértice i (numerados desde 1). El archivo se lee con numpy.memmap y se analiza en bloque,
+sin ciclos de Python por fila: se ubican el inicio y el fin de cada número, se arman todos los números a la
+vez dígito por dígito (Horner) y se asigna cada número a su fila contando los saltos de línea anteriores.
+El resultado es directamente el Grafo en formato CSR, y se verifica que coincida con los conteos del
+encabezado y que sea simétrico.
+
+Cache binaria: la primera lectura de data/x.graph escribe al lado el archivo data/x.graph.csr con un encabezado
+(tamaño, fecha de modificación y SHA-1 del texto original) seguido de los arreglos offsets y vecinos en int32.
+Las lecturas siguientes mapean esos arreglos en memoria (numpy.memmap) sin analizar el texto. Si el texto
+cambió de tamaño o de fecha se compara el SHA-1: si difiere, la cache se reconstruye automáticamente.
+
+Language: Python 3
+'''
+
+import hashlib
+import os
+import struct
+from collections import namedtuple
+
+import numpy
+
+# offsets: n+1 posiciones; los vecinos (ids desde 0) del vértice i (id i+1 en el archivo) son vecinos[offsets[i]:offsets[i+1]]
+GrafoCSR = namedtuple('GrafoCSR', ['n', 'm', 'offsets', 'vecinos'])
+
+ESPACIOS = b' \t\r\n'
+
+# ENCABEZADO DE LA CACHE: marca, n, m, tamaño y fecha (ns) del texto, SHA-1 del texto; relleno hasta 64 bytes
+EXTENSION_CACHE = '.csr'
+MARCA_CACHE = b'VCCSR\x00\x00\x01'
+FORMATO_CACHE = '<8sqqqq20s4x'
+TAMANO_ENCABEZADO = struct.calcsize(FORMATO_CACHE)
+
+
+def _encabezado(datos):
+    '''
+    Devuelve (n, m, weighted, posición donde empieza la primera fila de adyacencia)
+    '''
+    saltos = numpy.flatnonzero(datos[:4096] == ord('\n'))
+    fin = int(saltos[0]) if len(saltos) else len(datos)
+    campos = datos[:fin].tobytes().split()
+    if len(campos) < 2:
+        raise ValueError('Encabezado inválido: se esperaba "vertices aristas pesos"')
+    n, m = int(campos[0]), int(campos[1])
+    weighted = int(campos[2]) if len(campos) > 2 else 0
+    return n, m, weighted, fin + 1
+
+
+def cargar(archivo, cache=True):
+    '''
+    Lee un archivo .graph y devuelve un GrafoCSR con arreglos int32 de numpy
+    Con cache=True se usa (y si hace falta se escribe) la cache binaria archivo + '.csr'
+    '''
+    if cache:
+        grafo = leer_cache(archivo)
+        if grafo is not None:
+            return grafo
+    grafo = analizar(archivo)
+    if cache:
+        try:
+            escribir_cache(archivo, grafo)
+        except OSError:
+            # directorio de sólo lectura: se sigue sin cache
+            pass
+    return grafo
+
+
+def analizar(archivo):
+    '''
+    Analiza el texto de un archivo .graph y devuelve un GrafoCSR verificado
+    '''
+    datos = numpy.memmap(archivo, dtype=numpy.uint8, mode='r')
+    n, m, weighted, inicio = _encabezado(datos)
+    if weighted:
+        raise ValueError('%s: los Grafos con pesos no están soportados' % archivo)
+    cuerpo = numpy.asarray(datos[inicio:])
+
+    es_digito = (cuerpo >= ord('0')) & (cuerpo <= ord('9'))
+    otros = ~es_digito
+    for espacio in ESPACIOS:
+        otros &= cuerpo != espacio
+    if otros.any():
+        posicion = inicio + int(numpy.flatnonzero(otros)[0])
+        raise ValueError('%s: caracter inválido %r en la posición %i' % (archivo, chr(datos[posicion]), posicion))
+
+    # INICIO Y FIN DE CADA NÚMERO
+    anterior = numpy.concatenate(([False], es_digito[:-1]))
+    siguiente = numpy.concatenate((es_digito[1:], [False]))
+    inicios = numpy.flatnonzero(es_digito & ~anterior).astype(numpy.int32)
+    fines = numpy.flatnonzero(es_digito & ~siguiente).astype(numpy.int32) + 1
+    del anterior, siguiente, es_digito
+
+    # VALOR DE CADA NÚMERO POR HORNER: SE AVANZA UN DÍGITO A LA VEZ EN TODOS LOS NÚMEROS A LA VEZ
+    vecinos = numpy.zeros(len(inicios), dtype=numpy.int32)
+    largo = fines - inicios
+    for k in range(int(largo.max()) if len(largo) else 0):
+        activos = numpy.flatnonzero(largo > k)
+        vecinos[activos] = vecinos[activos] * 10 + (cuerpo[inicios[activos] + k] - ord('0'))
+
+    # FILA DE CADA NÚMERO = CANTIDAD DE SALTOS DE LÍNEA ANTERIORES
+    saltos = numpy.flatnonzero(cuerpo == ord('\n'))
+    filas = numpy.searchsorted(saltos, inicios)
+    if len(filas) and filas[-1] >= n:
+        raise ValueError('%s: hay adyacencias en más filas que los %i vértices del encabezado' % (archivo, n))
+
+    offsets = numpy.zeros(n + 1, dtype=numpy.int32)
+    numpy.cumsum(numpy.bincount(filas, minlength=n), out=offsets[1:])
+    vecinos -= 1
+    verificar(archivo, n, m, offsets, vecinos)
+    return GrafoCSR(n, m, offsets, vecinos)
+
+
+def verificar(archivo, n, m, offsets, vecinos):
+    '''
+    Verifica que los arreglos CSR coincidan con el encabezado: ids válidos, 2m entradas y adyacencia simétrica
+    '''
+    if len(vecinos) != 2 * m:
+        raise ValueError('%s: el encabezado indica %i aristas pero las filas suman %i extremos (se esperaban %i)'
+                         % (archivo, m, len(vecinos), 2 * m))
+    if len(vecinos) and (vecinos.min() < 0 or vecinos.max() >= n):
+        raise ValueError('%s: hay vecinos fuera del rango 1..%i' % (archivo, n))
+    origen = numpy.repeat(numpy.arange(n, dtype=numpy.int64), numpy.diff(offsets))
+    directas = numpy.sort(origen * n + vecinos)
+    inversas = numpy.sort(vecinos.astype(numpy.int64) * n + origen)
+    if not numpy.array_equal(directas, inversas):
+        raise ValueError('%s: la lista de adyacencia no es simétrica' % archivo)
+
+
+def _sha1(archivo):
+    h = hashlib.sha1()
+    with open(archivo, 'rb') as f:
+        for bloque in iter(lambda: f.read(1 << 20), b''):
+            h.update(bloque)
+    return h.digest()
+
+
+def escribir_cache(archivo, grafo):
+    '''
+    Escribe la cache binaria del Grafo; se escribe en un archivo temporal y se renombra para que
+    las ejecuciones concurrentes nunca lean una cache a medio escribir
+    '''
+    estado = os.stat(archivo)
+    encabezado = struct.pack(FORMATO_CACHE, MARCA_CACHE, grafo.n, grafo.m, estado.st_size, estado.st_mtime_ns,
+                             _sha1(archivo))
+    destino = archivo + EXTENSION_CACHE
+    temporal = '%s.%i.tmp' % (destino, os.getpid())
+    with open(temporal, 'wb') as f:
+        f.write(encabezado)
+        f.write(numpy.ascontiguousarray(grafo.offsets, dtype='<i4').tobytes())
+        f.write(numpy.ascontiguousarray(grafo.vecinos, dtype='<i4').tobytes())
+    os.replace(temporal, destino)
+
+
+def leer_cache(archivo):
+    '''
+    Devuelve el GrafoCSR mapeado desde la cache binaria, o None si no existe o no corresponde al texto actual
+    '''
+    destino = archivo + EXTENSION_CACHE
+    try:
+        with open(destino, 'rb') as f:
+            encabezado = f.read(TAMANO_ENCABEZADO)
+        estado = os.stat(archivo)
+        tamano_cache = os.path.getsize(destino)
+    except OSError:
+        return None
+    if len(encabezado) < TAMANO_ENCABEZADO:
+        return None
+    marca, n, m, tamano, fecha, sha1 = struct.unpack(FORMATO_CACHE, encabezado)
+    if marca != MARCA_CACHE or tamano_cache != TAMANO_ENCABEZADO + 4 * (n + 1 + 2 * m):
+        return None
+    if (tamano, fecha) != (estado.st_size, estado.st_mtime_ns):
+        # el texto fue modificado (o sólo tocado, p. ej. por git checkout): se decide por el SHA-1
+        if tamano != estado.st_size or sha1 != _sha1(archivo):
+            return None
+        try:
+            with open(destino, 'r+b') as f:
+                f.write(struct.pack(FORMATO_CACHE, marca, n, m, tamano, estado.st_mtime_ns, sha1))
+        except OSError:
+            pass
+    offsets = numpy.memmap(destino, dtype='<i4', mode='r', offset=TAMANO_ENCABEZADO, shape=(n + 1,))
+    vecinos = numpy.memmap(destino, dtype='<i4', mode='r', offset=TAMANO_ENCABEZADO + 4 * (n + 1), shape=(2 * m,))
+    return GrafoCSR(n, m, offsets, vecinos)
+
+
+def aristas(grafo):
+    '''
+    Devuelve los arreglos (u, v) de extremos de cada arista, con ids desde 0 y u < v
+    '''
+    origen = numpy.repeat(numpy.arange(grafo.n, dtype=numpy.int64), numpy.diff(grafo.offsets))
+    destino = grafo.vecinos.astype(numpy.int64)
+    una_vez = origen < destino
+    return origen[una_vez], destino[una_vez]
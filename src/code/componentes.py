@@ -0,0 +1,334 @@
+'''
+Este archivo implementa la descomposición en componentes conexas de la cobertura mínima de vértices.
+
+La cobertura mínima de un Grafo es la unión de coberturas mínimas de sus componentes conexas, por lo que cada
+componente se puede resolver por separado y los óptimos se suman. Se usa en dos lugares:
+- BnB_componentes(): en la raíz (después de la kernelización) separa el Grafo en componentes, las resuelve
+  de menor a mayor con BnB() y combina las soluciones y el seguimiento en uno solo.
+- separar_componentes(): regla 'componentes' de reducciones.reducir(), dentro de la búsqueda. Después de cada
+  decisión busca, a partir de los vecinos de los vértices eliminados, componentes chicas (hasta LIMITE_CHICA
+  vértices) mediante un BFS acotado; cada una se resuelve en forma exacta y su cobertura se agrega al trail,
+  con lo que la componente queda sin aristas y desaparece del problema.
+
+Las componentes chicas se resuelven con cobertura_exacta() sobre máscaras de bits y su solución se guarda en
+una cache indexada por forma canónica (forma_canonica()), de modo que componentes isomorfas se resuelven una
+sola vez.
+
+Language: Python 3
+'''
+
+import itertools
+import time
+
+from grafo import Grafo
+from memo import LRU
+
+# componentes de hasta LIMITE_CHICA vértices se resuelven al encontrarlas durante la búsqueda
+LIMITE_CHICA = 16
+# componentes de hasta LIMITE_CANONICO vértices se guardan en la cache por forma canónica
+LIMITE_CANONICO = 12
+# máximo de permutaciones a probar para la forma canónica (si hay más, la componente no se guarda)
+MAX_PERMUTACIONES = 256
+
+
+def componentes(g):
+    '''
+    Devuelve las componentes conexas con aristas del Grafo restante g, como listas de vértices
+    '''
+    eliminado = g.eliminado
+    offsets = g.offsets
+    vecinos = g.vecinos
+    visitado = bytearray(g.n + 1)
+    resultado = []
+    for s in g.nodes():
+        if visitado[s] or g.grado[s] == 0:
+            continue
+        visitado[s] = 1
+        componente = [s]
+        i = 0
+        while i < len(componente):
+            v = componente[i]
+            i += 1
+            for u in vecinos[offsets[v]:offsets[v + 1]]:
+                if not eliminado[u] and not visitado[u]:
+                    visitado[u] = 1
+                    componente.append(u)
+        resultado.append(componente)
+    return resultado
+
+
+def componente_chica(g, s, limite, visitado):
+    '''
+    BFS desde s acotado a 'limite' vértices: devuelve la componente de s si tiene a lo sumo 'limite' vértices,
+    o None. Los vértices recorridos se marcan en visitado (un set) para no repetir el recorrido
+    '''
+    eliminado = g.eliminado
+    offsets = g.offsets
+    vecinos = g.vecinos
+    componente = [s]
+    vistos = {s}
+    i = 0
+    while i < len(componente):
+        v = componente[i]
+        i += 1
+        for u in vecinos[offsets[v]:offsets[v + 1]]:
+            if not eliminado[u] and u not in vistos:
+                if len(componente) == limite or u in visitado:
+                    visitado.update(vistos)
+                    return None
+                vistos.add(u)
+                componente.append(u)
+    visitado.update(vistos)
+    return componente
+
+
+def adyacencia_local(g, componente):
+    '''
+    Máscaras de adyacencia de la componente con los vértices numerados 0..k-1 en el orden de la lista
+    '''
+    eliminado = g.eliminado
+    offsets = g.offsets
+    vecinos = g.vecinos
+    indice = dict((v, i) for i, v in enumerate(componente))
+    adj = []
+    for v in componente:
+        mascara = 0
+        for u in vecinos[offsets[v]:offsets[v + 1]]:
+            if not eliminado[u]:
+                mascara |= 1 << indice[u]
+        adj.append(mascara)
+    return adj
+
+
+def cobertura_exacta(adj):
+    '''
+    Cobertura mínima exacta de un grafo chico dado por máscaras de adyacencia; devuelve la máscara de la
+    cobertura. Ramifica en el vértice de grado máximo (v o todos sus vecinos) y aplica la regla de grado 1
+    '''
+    k = len(adj)
+    memo = {}
+
+    def resolver(vivos):
+        if vivos in memo:
+            return memo[vivos]
+        dmax = 0
+        vmax = -1
+        colgante = -1
+        for v in range(k):
+            if vivos >> v & 1:
+                d = (adj[v] & vivos).bit_count()
+                if d == 1 and colgante == -1:
+                    colgante = v
+                if d > dmax:
+                    dmax, vmax = d, v
+        if dmax == 0:
+            resultado = 0
+        elif colgante != -1:
+            # el vecino de un vértice colgante siempre puede estar en la cobertura
+            u = (adj[colgante] & vivos).bit_length() - 1
+            resultado = resolver(vivos & ~(1 << u)) | (1 << u)
+        else:
+            con_v = resolver(vivos & ~(1 << vmax)) | (1 << vmax)
+            vecinos = adj[vmax] & vivos
+            sin_v = resolver(vivos & ~vecinos & ~(1 << vmax)) | vecinos
+            resultado = con_v if con_v.bit_count() <= sin_v.bit_count() else sin_v
+        memo[vivos] = resultado
+        return resultado
+
+    return resolver((1 << k) - 1)
+
+
+def forma_canonica(adj):
+    '''
+    Forma canónica de un grafo chico: el mínimo, entre los órdenes de los vértices compatibles con la partición
+    por invariantes (grado y grados de los vecinos, refinada hasta estabilizarse), de la tupla de máscaras de
+    adyacencia renumeradas. Devuelve (forma, orden) o None si hay demasiadas permutaciones para probar
+    '''
+    k = len(adj)
+    vecinos = [[u for u in range(k) if adj[v] >> u & 1] for v in range(k)]
+    color = [(len(vecinos[v]),) for v in range(k)]
+    while True:
+        nuevo = [(color[v], tuple(sorted(color[u] for u in vecinos[v]))) for v in range(k)]
+        valores = sorted(set(nuevo))
+        nuevo = [valores.index(c) for c in nuevo]
+        if len(valores) == len(set(color)):
+            color = nuevo
+            break
+        color = nuevo
+    celdas = [[v for v in range(k) if color[v] == c] for c in sorted(set(color))]
+    cantidad = 1
+    for celda in celdas:
+        for i in range(2, len(celda) + 1):
+            cantidad *= i
+    if cantidad > MAX_PERMUTACIONES:
+        return None
+
+    mejor = None
+    for eleccion in itertools.product(*(itertools.permutations(celda) for celda in celdas)):
+        orden = [v for parte in eleccion for v in parte]
+        posicion = [0] * k
+        for i, v in enumerate(orden):
+            posicion[v] = i
+        forma = tuple(sum(1 << posicion[u] for u in vecinos[v]) for v in orden)
+        if mejor is None or forma < mejor[0]:
+            mejor = (forma, orden)
+    return mejor
+
+
+class CacheComponentes:
+    '''
+    Cache de coberturas mínimas de componentes chicas, con registro de aciertos y fallos. Tiene dos niveles:
+    - por conjunto de vértices: durante la búsqueda la misma componente reaparece en muchas ramas, y como sus
+      aristas son las del Grafo original entre esos vértices, el conjunto ordenado alcanza como clave (este
+      nivel se vacía al cambiar de Grafo).
+    - por forma canónica: componentes isomorfas comparten la cobertura, guardada como máscara sobre las
+      posiciones del orden canónico.
+    Cada nivel guarda a lo sumo 'capacidad' entradas y desaloja la usada hace más tiempo (memo.LRU).
+    '''
+
+    def __init__(self, capacidad=100000):
+        self.capacidad = capacidad
+        self.tabla = LRU(capacidad)
+        self.vistas = LRU(capacidad)
+        self.grafo = None
+        self.aciertos = 0
+        self.fallos = 0
+
+    def cobertura(self, g, componente):
+        '''
+        Devuelve los vértices de una cobertura mínima de la componente (lista de vértices de g)
+        '''
+        if g is not self.grafo:
+            self.grafo = g
+            self.vistas = LRU(self.capacidad)
+        clave = tuple(sorted(componente))
+        guardada = self.vistas.get(clave)
+        if guardada is not None:
+            self.aciertos += 1
+            return guardada
+        mascara = self.resolver(adyacencia_local(g, clave))
+        guardada = [v for i, v in enumerate(clave) if mascara >> i & 1]
+        self.vistas.poner(clave, guardada)
+        return guardada
+
+    def resolver(self, adj):
+        '''
+        Devuelve la máscara (sobre los índices de adj) de una cobertura mínima, usando la cache si es posible
+        '''
+        canonica = forma_canonica(adj) if len(adj) <= LIMITE_CANONICO else None
+        if canonica is None:
+            return cobertura_exacta(adj)
+        forma, orden = canonica
+        guardada = self.tabla.get(forma)
+        if guardada is None:
+            self.fallos += 1
+            cobertura = cobertura_exacta(adj)
+            self.tabla.poner(forma, sum(1 << i for i, v in enumerate(orden) if cobertura >> v & 1))
+            return cobertura
+        self.aciertos += 1
+        return sum(1 << v for i, v in enumerate(orden) if guardada >> i & 1)
+
+    def estadisticas(self):
+        return {'aciertos': self.aciertos, 'fallos': self.fallos, 'entradas': len(self.tabla) + len(self.vistas),
+                'desalojos': self.tabla.desalojos + self.vistas.desalojos}
+
+
+# cache compartida por la regla de búsqueda y BnB_componentes() dentro de un mismo proceso
+CACHE = CacheComponentes()
+
+
+def separar_componentes(g, trail, semillas, limite=LIMITE_CHICA, cache=CACHE):
+    '''
+    Regla 'componentes': resuelve las componentes chicas que contienen a alguna semilla; sus vértices de la
+    cobertura se eliminan de g y se anotan en el trail como (node, 1). Devuelve la cantidad agregada
+    '''
+    agregados = 0
+    visitado = set()
+    eliminado = g.eliminado
+    for s in semillas:
+        if eliminado[s] or g.grado[s] == 0 or s in visitado:
+            continue
+        componente = componente_chica(g, s, limite, visitado)
+        if componente is None:
+            continue
+        for v in cache.cobertura(g, componente):
+            trail.append((v, 1))
+            g.remove_node(v)
+            agregados += 1
+    return agregados
+
+
+def subgrafo(g, componente):
+    '''
+    Grafo compacto de una componente, con los vértices renumerados 1..k; devuelve (Grafo, etiquetas)
+    '''
+    etiquetas = [0] + sorted(componente)
+    indice = dict((v, i) for i, v in enumerate(etiquetas))
+    eliminado = g.eliminado
+    filas = [sorted(indice[u] for u in g.all_neighbors(v) if not eliminado[u]) for v in etiquetas[1:]]
+    return Grafo.desde_lista_adyacencia(filas), etiquetas
+
+
+def BnB_componentes(G, T, estadisticas=None, desempate='menor', seed=None, cotas='maxdeg', reducciones=(),
+                    instrumentos=None, bits=False, memoria=0):
+    '''
+    Resuelve cada componente conexa de G por separado (de menor a mayor) y combina los resultados;
+    devuelve (OptVC, times) como BnB(). Mientras una componente no se resolvió, su aporte es una cobertura
+    trivial (todos sus vértices menos uno), así el seguimiento siempre informa coberturas completas
+    Con memoria > 0 cada componente grande usa su propia tabla de transposición (ver memo.py)
+    '''
+    from BnB import BnB
+    from memo import combinar_memo
+    if bits:
+        from bitset import BnB_bits
+    start_time = time.time()
+    partes = sorted(componentes(G), key=len)
+    # cobertura actual de cada componente, en ids de G
+    coberturas = [sorted(parte)[:-1] for parte in partes]
+    total = sum(len(c) for c in coberturas)
+    times = [(total, time.time() - start_time)]
+    nodos = 0
+    podas = {}
+    acumulado = {}
+
+    for i, parte in enumerate(partes):
+        delta_time = time.time() - start_time
+        if delta_time >= T:
+            break
+        if len(parte) <= LIMITE_CHICA:
+            coberturas[i] = CACHE.cobertura(G, parte)
+        else:
+            sub, etiquetas = subgrafo(G, parte)
+            sub_estadisticas = {}
+            if bits:
+                OptVC, sub_times = BnB_bits(sub, T - delta_time, sub_estadisticas, desempate, seed, cotas,
+                                            instrumentos)
+                sub_times = [(size, delta_time + t) for size, t in sub_times]
+            else:
+                OptVC, sub_times = BnB(sub, T, sub_estadisticas, desempate, seed, cotas, reducciones,
+                                       start_time=start_time, instrumentos=instrumentos, memoria=memoria)
+            nodos += sub_estadisticas['nodos']
+            for nombre, cantidad in sub_estadisticas['podas'].items():
+                podas[nombre] = podas.get(nombre, 0) + cantidad
+            combinar_memo(acumulado, sub_estadisticas)
+            # cada mejora de la componente es una mejora de la cobertura combinada
+            otros = total - len(coberturas[i])
+            for size, t in sub_times:
+                if otros + size < times[-1][0]:
+                    times.append((otros + size, t))
+            solucion = [etiquetas[v] for v, state in OptVC if state == 1]
+            if OptVC and len(solucion) < len(coberturas[i]):
+                coberturas[i] = solucion
+        total = sum(len(c) for c in coberturas)
+        if total < times[-1][0]:
+            times.append((total, time.time() - start_time))
+
+    if estadisticas is not None:
+        estadisticas['nodos'] = nodos
+        estadisticas['podas'] = podas
+        estadisticas['tiempo'] = time.time() - start_time
+        estadisticas['componentes'] = len(partes)
+        estadisticas['cache'] = CACHE.estadisticas()
+        estadisticas.update(acumulado)
+    OptVC = [(v, 1) for cobertura in coberturas for v in cobertura]
+    return OptVC, times
@@ -0,0 +1,214 @@
+'''
+Este archivo implementa las cotas inferiores del tamaño de la cobertura mínima de vértices utilizadas por BnB para podar.
+
+Todas las cotas reciben el Grafo restante (grafo.Grafo) y devuelven un entero menor o igual que el tamaño
+de la cobertura mínima de ese Grafo. Se registran en el diccionario COTAS con el nombre que se usa en la
+línea de comandos (-lb maxdeg,matching,...).
+
+- maxdeg: ceil(|E| / grado máximo), la cota original de BnB.
+- degree: menor k tal que la suma de los k mayores grados alcanza |E|.
+- matching: tamaño de un emparejamiento maximal voraz (cada arista del emparejamiento necesita un vértice distinto).
+- clique: cubrimiento voraz por cliques; una clique de tamaño s necesita al menos s-1 vértices.
+- lp: relajación lineal (semi-entera), calculada como la mitad de un emparejamiento máximo del doble cubrimiento bipartito.
+
+Language: Python 3
+'''
+
+from collections import deque
+
+
+def ceil(d):
+    '''
+    Funcion para devolver el entero mínimo que es mayor que d
+    '''
+    if d > int(d):
+        return int(d) + 1
+    else:
+        return int(d)
+
+
+def cota_maxdeg(g):
+    '''
+    Cota ceil(|E| / grado máximo)
+    '''
+    return ceil(g.number_of_edges() / g.baldes.grado_maximo())
+
+
+def cota_degree(g):
+    '''
+    Cota por secuencia de grados: cada vértice de la cobertura cubre a lo sumo su grado en aristas,
+    por lo tanto se necesitan al menos k vértices, con k el menor tal que los k mayores grados suman |E|
+    '''
+    m = g.number_of_edges()
+    baldes = g.baldes.baldes
+    cubiertas = 0
+    k = 0
+    for d in range(g.baldes.grado_maximo(), 0, -1):
+        cantidad = len(baldes[d])
+        if cubiertas + cantidad * d >= m:
+            return k + ceil((m - cubiertas) / d)
+        cubiertas += cantidad * d
+        k += cantidad
+    return k
+
+
+def cota_matching(g):
+    '''
+    Cota por emparejamiento maximal voraz, recorriendo los vértices de menor a mayor grado
+    '''
+    eliminado = g.eliminado
+    offsets = g.offsets
+    vecinos = g.vecinos
+    emparejado = bytearray(g.n + 1)
+    tamano = 0
+    for balde in g.baldes.baldes[1:]:
+        for u in balde:
+            if emparejado[u]:
+                continue
+            for v in vecinos[offsets[u]:offsets[u + 1]]:
+                if not eliminado[v] and not emparejado[v]:
+                    emparejado[u] = 1
+                    emparejado[v] = 1
+                    tamano += 1
+                    break
+    return tamano
+
+
+def cota_clique(g):
+    '''
+    Cota por cubrimiento voraz de cliques: se particionan los vértices no aislados en cliques
+    (de mayor a menor grado) y se suma |C| - 1 por cada clique C
+    '''
+    eliminado = g.eliminado
+    offsets = g.offsets
+    vecinos = g.vecinos
+    cubierto = bytearray(g.n + 1)
+    # marca[u] == v si u es vecino del último miembro v agregado a la clique
+    marca = [0] * (g.n + 1)
+    cota = 0
+    baldes = g.baldes.baldes
+    for d in range(g.baldes.grado_maximo(), 0, -1):
+        for v in baldes[d]:
+            if cubierto[v]:
+                continue
+            cubierto[v] = 1
+            candidatos = [u for u in vecinos[offsets[v]:offsets[v + 1]] if not eliminado[u] and not cubierto[u]]
+            while candidatos:
+                w = candidatos.pop()
+                cubierto[w] = 1
+                cota += 1
+                for u in vecinos[offsets[w]:offsets[w + 1]]:
+                    marca[u] = w
+                candidatos = [u for u in candidatos if marca[u] == w]
+    return cota
+
+
+def emparejamiento_bipartito(g):
+    '''
+    Emparejamiento máximo (Hopcroft-Karp) del doble cubrimiento bipartito del Grafo restante:
+    cada vértice v tiene una copia izquierda y una derecha, y cada arista (u, v) une u_izq con v_der y v_izq con u_der.
+    Devuelve (pareja_izq, pareja_der), con 0 para los vértices sin pareja.
+    '''
+    n = g.n
+    eliminado = g.eliminado
+    offsets = g.offsets
+    vecinos = g.vecinos
+    izquierda = [v for v in range(1, n + 1) if not eliminado[v] and g.grado[v] > 0]
+    adyacentes = [None] * (n + 1)
+    for v in izquierda:
+        adyacentes[v] = [u for u in vecinos[offsets[v]:offsets[v + 1]] if not eliminado[u]]
+    pareja_izq = [0] * (n + 1)
+    pareja_der = [0] * (n + 1)
+    infinito = n + 1
+
+    # EMPAREJAMIENTO INICIAL VORAZ
+    for v in izquierda:
+        for u in adyacentes[v]:
+            if not pareja_der[u]:
+                pareja_izq[v] = u
+                pareja_der[u] = v
+                break
+
+    while True:
+        # BFS DESDE LOS VÉRTICES IZQUIERDOS LIBRES PARA ARMAR LOS NIVELES
+        nivel = [infinito] * (n + 1)
+        cola = deque()
+        for v in izquierda:
+            if not pareja_izq[v]:
+                nivel[v] = 0
+                cola.append(v)
+        encontrado = False
+        while cola:
+            v = cola.popleft()
+            for u in adyacentes[v]:
+                w = pareja_der[u]
+                if not w:
+                    encontrado = True
+                elif nivel[w] == infinito:
+                    nivel[w] = nivel[v] + 1
+                    cola.append(w)
+        if not encontrado:
+            break
+
+        # DFS ITERATIVO POR CAMINOS DE AUMENTO QUE RESPETAN LOS NIVELES
+        siguiente = [0] * (n + 1)
+        for raiz in izquierda:
+            if pareja_izq[raiz]:
+                continue
+            camino = [raiz]
+            while camino:
+                v = camino[-1]
+                lista = adyacentes[v]
+                avanzo = False
+                while siguiente[v] < len(lista):
+                    u = lista[siguiente[v]]
+                    siguiente[v] += 1
+                    w = pareja_der[u]
+                    if not w:
+                        # camino de aumento encontrado: se invierten las parejas a lo largo de camino
+                        for x in reversed(camino):
+                            anterior = pareja_izq[x]
+                            pareja_izq[x] = u
+                            pareja_der[u] = x
+                            u = anterior
+                        camino = []
+                        avanzo = True
+                        break
+                    if nivel[w] == nivel[v] + 1:
+                        camino.append(w)
+                        avanzo = True
+                        break
+                if not avanzo:
+                    nivel[v] = infinito
+                    camino.pop()
+    return pareja_izq, pareja_der
+
+
+def cota_lp(g):
+    '''
+    Cota por relajación lineal: el óptimo semi-entero del LP de cobertura es |M| / 2,
+    con M un emparejamiento máximo del doble cubrimiento bipartito
+    '''
+    pareja_izq, pareja_der = emparejamiento_bipartito(g)
+    return ceil(sum(1 for u in pareja_izq if u) / 2)
+
+
+COTAS = {
+    'maxdeg': cota_maxdeg,
+    'degree': cota_degree,
+    'matching': cota_matching,
+    'clique': cota_clique,
+    'lp': cota_lp,
+}
+
+
+def elegir_cotas(nombres):
+    '''
+    Devuelve la lista de pares (nombre, cota) a partir de una lista separada por comas, p. ej. 'matching,degree'
+    '''
+    if isinstance(nombres, str):
+        nombres = [nombre.strip() for nombre in nombres.split(',') if nombre.strip()]
+    desconocidas = [nombre for nombre in nombres if nombre not in COTAS]
+    if desconocidas or not nombres:
+        raise ValueError('Cotas desconocidas: %s (disponibles: %s)' % (','.join(desconocidas), ','.join(COTAS)))
+    return [(nombre, COTAS[nombre]) for nombre in nombres]
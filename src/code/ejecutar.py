@@ -0,0 +1,302 @@
+'''
+Este archivo implementa un ejecutor unificado de los solvers (BnB, Approx, LS1, LS2, Greedy) sobre varias instancias.
+
+Modo lote: ejecuta el producto instancias x algoritmos x semillas x tiempos límite. Cada ejecución es un proceso
+independiente; hasta -procesos de ellos corren a la vez y cada uno se corta si supera su tiempo límite más -margen
+segundos (la carga del grafo y la escritura de la salida quedan fuera del cutoff del solver).
+Modo portafolio (-portafolio): para cada instancia corre todos los algoritmos a la vez y los detiene en cuanto un
+algoritmo exacto termina antes de su tiempo límite, lo que significa que demostró la optimalidad de su cobertura.
+
+Los archivos *.sol y *.trace quedan en la carpeta output del proyecto (o en la indicada con -out) con el nombre
+habitual <instancia>_<alg>_<cutoff>[_<seed>]. Al final se imprime un resumen con el tamaño de la cobertura y el
+momento de la última mejora de cada ejecución, y opcionalmente se guarda en CSV.
+
+Language: Python 3
+### Running: python3 code/ejecutar.py -inst data/karate.graph data/jazz.graph -alg BnB LS2 -seed 1 2 -time 60
+### Running: python3 code/ejecutar.py -inst data/email.graph -portafolio -time 600 -seed 1045
+
+### Help: python3 ejecutar.py --help
+'''
+
+import argparse
+import collections
+import csv
+import glob
+import os
+import shlex
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from salida import DIRECTORIO_SALIDA, nombre_salida
+
+DIRECTORIO_CODIGO = os.path.dirname(os.path.abspath(__file__))
+DIRECTORIO_DATOS = os.path.normpath(os.path.join(DIRECTORIO_CODIGO, '..', 'data'))
+
+# script y tipo del argumento -time de cada solver (el tipo define cómo aparece el cutoff en el nombre de salida)
+ALGORITMOS = collections.OrderedDict([
+    ('BnB', ('BnB.py', int)),
+    ('Approx', ('Approx.py', int)),
+    ('LS1', ('LS1.py', int)),
+    ('LS2', ('LS2.py', float)),
+    ('Greedy', ('Greedy.py', int)),
+])
+# algoritmos cuya terminación antes del tiempo límite demuestra optimalidad
+EXACTOS = ('BnB',)
+
+Trabajo = collections.namedtuple('Trabajo', ['inst', 'alg', 'cutoff', 'seed', 'opciones'])
+
+CAMPOS = ['inst', 'alg', 'cutoff', 'seed', 'estado', 'tamano', 'tiempo_mejor', 'segundos']
+
+
+def usa_semilla(alg, opciones):
+    '''
+    BnB sólo usa la semilla con el desempate aleatorio; Greedy no la usa
+    '''
+    if alg == 'Greedy':
+        return False
+    return alg != 'BnB' or 'aleatorio' in opciones
+
+
+def armar_trabajos(instancias, algoritmos, seeds, cutoffs, opciones):
+    '''
+    Producto instancias x algoritmos x semillas x cutoffs, sin repetir ejecuciones que no usan la semilla
+    '''
+    trabajos = []
+    for inst in instancias:
+        for alg in algoritmos:
+            extra = tuple(opciones.get(alg, ()))
+            for cutoff in cutoffs:
+                for seed in (seeds if usa_semilla(alg, extra) else [None]):
+                    trabajo = Trabajo(inst, alg, ALGORITMOS[alg][1](cutoff), seed, extra)
+                    if trabajo not in trabajos:
+                        trabajos.append(trabajo)
+    return trabajos
+
+
+def comando(trabajo, salida):
+    script = os.path.join(DIRECTORIO_CODIGO, ALGORITMOS[trabajo.alg][0])
+    cmd = [sys.executable, script, '-inst', trabajo.inst, '-time', str(trabajo.cutoff), '-out', salida]
+    if trabajo.seed is not None:
+        cmd += ['-seed', str(trabajo.seed)]
+    return cmd + list(trabajo.opciones)
+
+
+def nombre(trabajo, salida):
+    return nombre_salida(trabajo.inst, trabajo.alg, trabajo.cutoff, trabajo.seed, salida)
+
+
+def lanzar(trabajo, salida, verbose=False, error=subprocess.PIPE):
+    '''
+    Inicia el solver en su propio grupo de procesos, para poder detenerlo junto con sus workers
+    error es el destino de su salida de errores (por defecto un pipe que se lee con communicate())
+    '''
+    destino = None if verbose else subprocess.DEVNULL
+    return subprocess.Popen(comando(trabajo, salida), stdout=destino, stderr=error, start_new_session=True)
+
+
+def informar_error(error):
+    '''
+    Imprime la última línea de la salida de errores (bytes) de un solver que falló
+    '''
+    print(' '.join(error.decode(errors='replace').strip().splitlines()[-1:]), file=sys.stderr)
+
+
+def detener(proc):
+    '''
+    Termina el grupo de procesos del solver (SIGTERM y, si no alcanza, SIGKILL)
+    '''
+    for sig in (signal.SIGTERM, signal.SIGKILL):
+        try:
+            os.killpg(proc.pid, sig)
+        except ProcessLookupError:
+            return
+        try:
+            proc.wait(timeout=5)
+            return
+        except subprocess.TimeoutExpired:
+            pass
+
+
+def leer_resultado(trabajo, salida, desde):
+    '''
+    Tamaño de la cobertura (.sol) y momento de la última mejora (.trace) escritos por el trabajo;
+    (None, None) si no hay archivos más nuevos que 'desde'
+    '''
+    base = nombre(trabajo, salida)
+    try:
+        if os.path.getmtime(base + '.sol') < desde:
+            return None, None
+        with open(base + '.sol') as f:
+            tamano = int(f.readline())
+        tiempo_mejor = None
+        with open(base + '.trace') as f:
+            for linea in f:
+                if linea.strip():
+                    tiempo_mejor = float(linea.split(',')[0])
+        return tamano, tiempo_mejor
+    except (OSError, ValueError):
+        return None, None
+
+
+def resultado(trabajo, salida, estado, inicio):
+    tamano, tiempo_mejor = leer_resultado(trabajo, salida, inicio)
+    return {'inst': os.path.split(trabajo.inst)[1].split('.')[0], 'alg': trabajo.alg, 'cutoff': trabajo.cutoff,
+            'seed': trabajo.seed, 'estado': estado, 'tamano': tamano, 'tiempo_mejor': tiempo_mejor,
+            'segundos': round(time.time() - inicio, 2)}
+
+
+def ejecutar_trabajo(trabajo, salida, margen, verbose=False):
+    '''
+    Ejecuta un trabajo con límite de tiempo de pared cutoff + margen
+    '''
+    inicio = time.time()
+    proc = lanzar(trabajo, salida, verbose)
+    try:
+        _, error = proc.communicate(timeout=trabajo.cutoff + margen)
+        estado = 'ok' if proc.returncode == 0 else 'error'
+        if proc.returncode != 0:
+            informar_error(error)
+    except subprocess.TimeoutExpired:
+        detener(proc)
+        estado = 'timeout'
+    return resultado(trabajo, salida, estado, inicio)
+
+
+def lote(trabajos, salida, procesos, margen, verbose=False):
+    '''
+    Ejecuta los trabajos de a 'procesos' a la vez (cada trabajo es un proceso aparte; los hilos sólo esperan)
+    '''
+    resultados = []
+    with ThreadPoolExecutor(max_workers=procesos) as ejecutor:
+        futuros = [ejecutor.submit(ejecutar_trabajo, t, salida, margen, verbose) for t in trabajos]
+        for i, futuro in enumerate(as_completed(futuros)):
+            r = futuro.result()
+            print('[%i/%i] %s %s %s %s: %s, %s vertices' % (i + 1, len(trabajos), r['inst'], r['alg'], r['cutoff'],
+                                                         r['seed'], r['estado'], r['tamano']))
+            resultados.append(r)
+    orden = {(os.path.split(t.inst)[1].split('.')[0], t.alg, t.cutoff, t.seed): i for i, t in enumerate(trabajos)}
+    resultados.sort(key=lambda r: orden[(r['inst'], r['alg'], r['cutoff'], r['seed'])])
+    return resultados
+
+
+def portafolio(trabajos, salida, margen, verbose=False):
+    '''
+    Corre todos los trabajos (una instancia) a la vez; si un algoritmo exacto termina antes de su cutoff,
+    su cobertura es óptima y se detiene al resto
+    '''
+    inicio = time.time()
+    # la salida de errores va a un archivo temporal por trabajo: como el ciclo sólo consulta poll(), un pipe que
+    # nadie lee bloquearía al solver que escriba más que su buffer
+    errores = {t: tempfile.TemporaryFile() for t in trabajos}
+    procesos = {t: lanzar(t, salida, verbose, errores[t]) for t in trabajos}
+    estados = {}
+    optimo = None
+    while len(estados) < len(trabajos):
+        transcurrido = time.time() - inicio
+        for t, proc in procesos.items():
+            if t in estados:
+                continue
+            if proc.poll() is not None:
+                estados[t] = 'ok' if proc.returncode == 0 else 'error'
+                if proc.returncode != 0:
+                    errores[t].seek(0)
+                    informar_error(errores[t].read())
+                if proc.returncode == 0 and t.alg in EXACTOS and transcurrido < t.cutoff and optimo is None:
+                    optimo = t
+                    estados[t] = 'optimo'
+            elif optimo is not None:
+                detener(proc)
+                estados[t] = 'detenido'
+            elif transcurrido > t.cutoff + margen:
+                detener(proc)
+                estados[t] = 'timeout'
+        time.sleep(0.05)
+    for archivo in errores.values():
+        archivo.close()
+    if optimo is not None:
+        print('%s demostró optimalidad a los %.2f segundos' % (optimo.alg, time.time() - inicio))
+    return [resultado(t, salida, estados[t], inicio) for t in trabajos]
+
+
+def resumir(resultados, archivo_csv=None):
+    '''
+    Imprime una fila por ejecución y la mejor cobertura por instancia; opcionalmente escribe un CSV
+    '''
+    formato = '%-14s %-7s %-7s %-6s %-9s %8s %12s %9s'
+    print('\n' + formato % ('INSTANCIA', 'ALG', 'CUTOFF', 'SEED', 'ESTADO', 'TAMAÑO', 'T. MEJORA', 'SEGUNDOS'))
+    mejores = collections.OrderedDict()
+    for r in resultados:
+        print(formato % (r['inst'], r['alg'], r['cutoff'], '-' if r['seed'] is None else r['seed'], r['estado'],
+                         '-' if r['tamano'] is None else r['tamano'],
+                         '-' if r['tiempo_mejor'] is None else '%.2f' % r['tiempo_mejor'], '%.2f' % r['segundos']))
+        if r['tamano'] is not None and (r['inst'] not in mejores or r['tamano'] < mejores[r['inst']][0]):
+            mejores[r['inst']] = (r['tamano'], r['alg'])
+    print('\nMEJOR COBERTURA POR INSTANCIA')
+    for inst, (tamano, alg) in mejores.items():
+        print('%-14s %8i (%s)' % (inst, tamano, alg))
+
+    if archivo_csv:
+        with open(archivo_csv, 'w', newline='') as f:
+            escritor = csv.DictWriter(f, fieldnames=CAMPOS)
+            escritor.writeheader()
+            escritor.writerows(resultados)
+
+
+def leer_opciones(valores):
+    '''
+    Opciones extra por algoritmo con la forma ALG="-opcion valor ..."
+    '''
+    opciones = {}
+    for valor in valores:
+        alg, _, resto = valor.partition('=')
+        if alg not in ALGORITMOS:
+            raise ValueError('Algoritmo desconocido en -opciones: %s' % alg)
+        opciones.setdefault(alg, []).extend(shlex.split(resto))
+    return opciones
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(prog='Analizador de entrada para ejecutar',
+                                     description='Ejecución por lotes y portafolio de los solvers de vertex cover')
+    parser.add_argument('-inst', nargs='+', default=None,
+                        help='Archivos de Grafo de entrada (por defecto todos los de la carpeta data)')
+    parser.add_argument('-alg', nargs='+', default=list(ALGORITMOS), choices=list(ALGORITMOS),
+                        help='Algoritmos a ejecutar')
+    parser.add_argument('-seed', nargs='+', default=[None], type=int,
+                        help='Semillas de los generadores aleatorios')
+    parser.add_argument('-time', nargs='+', default=[600], type=int,
+                        help='Tiempos límite de ejecución de cada algoritmo')
+    parser.add_argument('-procesos', default=os.cpu_count() or 1, type=int,
+                        help='Cantidad de ejecuciones simultáneas en modo lote')
+    parser.add_argument('-margen', default=30, type=float,
+                        help='Segundos de tolerancia sobre el tiempo límite antes de detener una ejecución')
+    parser.add_argument('-portafolio', action='store_true',
+                        help='Correr todos los algoritmos a la vez en cada instancia hasta que uno demuestre optimalidad')
+    parser.add_argument('-opciones', action='append', default=[],
+                        help='Opciones extra de un algoritmo, por ejemplo: -opciones "BnB=-kernel grado1,lp"')
+    parser.add_argument('-out', default=DIRECTORIO_SALIDA, type=str,
+                        help='Directorio de los archivos de salida')
+    parser.add_argument('-csv', default=None, type=str,
+                        help='Archivo CSV donde guardar el resumen')
+    parser.add_argument('-v', action='store_true', help='Mostrar la salida de los solvers')
+    args = parser.parse_args()
+    try:
+        opciones = leer_opciones(args.opciones)
+    except ValueError as e:
+        parser.error(str(e))
+
+    instancias = args.inst or sorted(glob.glob(os.path.join(DIRECTORIO_DATOS, '*.graph')))
+    if args.portafolio:
+        resultados = []
+        for inst in instancias:
+            print('\nPORTAFOLIO: %s' % inst)
+            trabajos = armar_trabajos([inst], args.alg, args.seed[:1], args.time[:1], opciones)
+            resultados.extend(portafolio(trabajos, args.out, args.margen, args.v))
+    else:
+        trabajos = armar_trabajos(instancias, args.alg, args.seed, args.time, opciones)
+        resultados = lote(trabajos, args.out, args.procesos, args.margen, args.v)
+    resumir(resultados, args.csv)
@@ -0,0 +1,263 @@
+'''
+Este archivo implementa las estrategias de búsqueda de BnB y la cota superior inicial.
+
+BnB() recorre el árbol en profundidad (la frontera es una pila), por lo que en grafos grandes la primera
+cobertura completa es mala y el seguimiento baja de a un vértice. Las estrategias disponibles son:
+- 'dfs': la búsqueda en profundidad de BnB().
+- 'lds': búsqueda por discrepancias limitadas. La heurística de BnB() es tomar el vértice de grado máximo
+  (state=1); cada rama state=0 es una discrepancia. La iteración k recorre con BnB() sólo los caminos con a lo
+  sumo k discrepancias, empezando por k=0 (el camino voraz), con la mejor cobertura de las iteraciones
+  anteriores como UpperBound. Si una iteración no recorta ninguna rama, el árbol se recorrió completo y la
+  cobertura es óptima.
+- 'mejor': primero el mejor según la cota inferior (tamaño de la cobertura parcial más la cota), con
+  zambullidas: del nodo extraído de la cola se sigue por el hijo de menor cota hasta una hoja o una poda y el
+  otro hijo va a la cola, así se encuentran coberturas completas desde el principio. La cola tiene un tope de
+  memoria; cuando se llena, los hijos pendientes se recorren en profundidad antes de volver a la cola.
+Cada nodo de 'mejor' guarda su padre y las entradas que agregó al trail; para pasar de un nodo a otro se
+deshace el trail hasta el ancestro común y se rehacen las entradas del camino (ver mover()).
+
+Cualquiera de las estrategias puede partir de una cobertura inicial (cobertura_inicial()): una de las
+heurísticas de heuristicas.py, la mejor de ellas ('greedy') o la mejor seguida de una corrida corta de LS2
+('ls').
+
+La comparación entre estrategias está en bench/estrategias.py.
+
+Language: Python 3
+'''
+
+import contextlib
+import heapq
+import io
+import itertools
+import time
+
+import azar
+from BnB import BnB, aplicar, find_maxdeg, rehacer, undo
+from busqueda_local import EstadoCobertura
+from cotas import elegir_cotas
+from heuristicas import HEURISTICAS, mejor_heuristica
+from instrumentos import Instrumentos
+from reducciones import REGLAS_BUSQUEDA, elegir_reglas
+
+ESTRATEGIAS = ('dfs', 'lds', 'mejor')
+INICIALES = ('greedy', 'ls') + tuple(HEURISTICAS)
+# la búsqueda local de la cobertura inicial usa esta fracción del cutoff, con un tope en segundos
+FRACCION_LS = 0.1
+MAX_LS = 5.0
+# memoria aproximada de un nodo de la cola de 'mejor' (nodo, entradas del trail y entrada del heap)
+BYTES_NODO = 300
+
+
+def cobertura_inicial(g, metodo, T, seed=None):
+    '''
+    Cobertura del Grafo restante g (lista de vértices) para usar como UpperBound inicial
+    '''
+    if metodo in HEURISTICAS:
+        return HEURISTICAS[metodo](g.offsets, g.vecinos, g.eliminado)
+    nombre, cobertura = mejor_heuristica(g.offsets, g.vecinos, g.eliminado)
+    if metodo == 'greedy':
+        return cobertura
+    aristas = g.edges()
+    estado = EstadoCobertura(g.n + 1, [a for a, b in aristas], [b for a, b in aristas])
+    for v in cobertura:
+        estado.agregar(v)
+    from LS2 import numvc
+    with contextlib.redirect_stdout(io.StringIO()):
+        mejor, times = numvc(estado, min(FRACCION_LS * T, MAX_LS), azar.python(seed))
+    return mejor
+
+
+def lds(G, T, estadisticas=None, desempate='menor', seed=None, cotas='maxdeg', reducciones=(), inicial=None,
+        start_time=None, instrumentos=None):
+    '''
+    Búsqueda por discrepancias limitadas: BnB() con 0, 1, 2, ... discrepancias; devuelve (OptVC, times)
+    '''
+    if start_time is None:
+        start_time = time.time()
+    OptVC = [] if inicial is None else [(v, 1) for v in inicial]
+    times = []
+    total = {'nodos': 0, 'podas': {}, 'iteraciones': 0}
+    k = 0
+    while time.time() - start_time < T:
+        sub_estadisticas = {}
+        sub_VC, sub_times = BnB(G, T, sub_estadisticas, desempate, seed, cotas, reducciones, start_time=start_time,
+                                instrumentos=instrumentos, inicial=inicial, discrepancias=k)
+        if sub_times:
+            OptVC = sub_VC
+            inicial = [v for v, state in sub_VC if state == 1]
+            times.extend(sub_times)
+        total['nodos'] += sub_estadisticas['nodos']
+        for nombre, cantidad in sub_estadisticas['podas'].items():
+            total['podas'][nombre] = total['podas'].get(nombre, 0) + cantidad
+        total['iteraciones'] += 1
+        if sub_estadisticas['recortes'] == 0:  # árbol completo: la cobertura es óptima
+            break
+        k += 1
+    if estadisticas is not None:
+        estadisticas.update(total)
+        estadisticas['tiempo'] = time.time() - start_time
+    return OptVC, times
+
+
+def mover(g, trail, actual, destino):
+    '''
+    Lleva g y el trail del nodo actual al nodo destino; cada nodo es (padre, entradas, profundidad, largo del
+    trail, tamaño de la cobertura, cota)
+    '''
+    camino = []
+    while destino[2] > actual[2]:
+        camino.append(destino)
+        destino = destino[0]
+    while actual[2] > destino[2]:
+        actual = actual[0]
+    while actual is not destino:
+        camino.append(destino)
+        destino = destino[0]
+        actual = actual[0]
+    undo(g, trail, actual[3])
+    for nodo in reversed(camino):
+        rehacer(g, trail, nodo[1])
+
+
+def mejor_primero(G, T, estadisticas=None, desempate='menor', seed=None, cotas='maxdeg', reducciones=(),
+                  inicial=None, start_time=None, instrumentos=None, memoria=128):
+    '''
+    Búsqueda primero el mejor con zambullidas y cola acotada a 'memoria' MiB; devuelve (OptVC, times)
+    '''
+    cotas = elegir_cotas(cotas)
+    reducciones = elegir_reglas(reducciones, REGLAS_BUSQUEDA)
+    if instrumentos is None:
+        instrumentos = Instrumentos()
+    instrumentos.abrir()
+    proxima_emision = instrumentos.intervalo if instrumentos.flujo is not None else float('inf')
+    capacidad = max(1, int(memoria * 2 ** 20) // BYTES_NODO)
+
+    if start_time is None:
+        start_time = time.time()
+    delta_time = time.time() - start_time
+    times = []
+    OptVC = []
+    UpperBound = G.number_of_nodes()
+    if inicial is not None:
+        UpperBound = len(inicial)
+        OptVC = [(v, 1) for v in inicial]
+    instrumentos.imprimir(1, 'Initial UpperBound:', UpperBound)
+
+    CurG = G.copy()
+    CurG.baldes.configurar(desempate, seed)
+    CurVC = []
+    nodos = 0
+    podas = dict((nombre, 0) for nombre, cota in cotas)
+    cola = []  # heap de (cota, -profundidad, contador, nodo)
+    pila = []  # hijos pendientes cuando la cola está llena
+    contador = itertools.count()
+    cola_max = 0
+
+    raiz = (None, (), 0, 0, 0, 0)
+    actual = raiz
+    siguiente = raiz if CurG.number_of_edges() > 0 else None
+    if siguiente is None:
+        OptVC = []
+        times.append((0, time.time() - start_time))
+
+    while delta_time < T:
+        if siguiente is not None:
+            nodo, siguiente = siguiente, None
+        elif pila:
+            nodo = pila.pop()
+        elif cola:
+            nodo = heapq.heappop(cola)[3]
+        else:
+            break
+        if nodo[5] >= UpperBound:  # la cota del nodo ya alcanza la mejor cobertura encontrada
+            continue
+        mover(CurG, CurVC, actual, nodo)
+        actual = nodo
+        largo, size = nodo[3], nodo[4]
+
+        # EVALUAR LOS DOS HIJOS (PRIMERO TOMAR EL VÉRTICE DE GRADO MÁXIMO)
+        v = find_maxdeg(CurG)[0]
+        hijos = []
+        for state in (1, 0):
+            nodos += 1
+            hijo_size = size + aplicar(CurG, CurVC, v, state, reducciones)
+            if CurG.number_of_edges() == 0:  # solución encontrada
+                if hijo_size < UpperBound:
+                    UpperBound = hijo_size
+                    OptVC = CurVC.copy()
+                    instrumentos.imprimir(1, 'Current Opt VC size', hijo_size)
+                    times.append((hijo_size, time.time() - start_time))
+            else:
+                margen = UpperBound - hijo_size
+                cota = 0
+                podadora = None
+                for nombre, funcion in cotas:
+                    cota = max(cota, funcion(CurG))
+                    if cota >= margen:
+                        podadora = nombre
+                        break
+                if podadora is None:
+                    hijos.append((nodo, tuple(CurVC[largo:]), nodo[2] + 1, len(CurVC), hijo_size, hijo_size + cota))
+                else:
+                    podas[podadora] += 1
+            undo(CurG, CurVC, largo)
+
+        # ZAMBULLIDA EN EL HIJO DE MENOR COTA; EL OTRO VA A LA COLA (O A LA PILA SI LA COLA ESTÁ LLENA)
+        if hijos:
+            hijos.sort(key=lambda hijo: hijo[5])
+            siguiente = hijos[0]
+            for hijo in hijos[1:]:
+                if pila or len(cola) >= capacidad:
+                    pila.append(hijo)
+                else:
+                    heapq.heappush(cola, (hijo[5], -hijo[2], next(contador), hijo))
+            cola_max = max(cola_max, len(cola))
+
+        delta_time = time.time() - start_time
+        if delta_time >= proxima_emision:
+            instrumentos.emitir(delta_time, nodos, podas, len(cola) + len(pila), UpperBound, nodo[2])
+            proxima_emision += instrumentos.intervalo
+        if delta_time > T:
+            instrumentos.imprimir(1, 'Cutoff time reached')
+
+    if instrumentos.flujo is not None:
+        instrumentos.emitir(delta_time, nodos, podas, len(cola) + len(pila), UpperBound, 0, 'fin')
+    instrumentos.cerrar()
+
+    if estadisticas is not None:
+        estadisticas['nodos'] = nodos
+        estadisticas['podas'] = podas
+        estadisticas['tiempo'] = delta_time
+        estadisticas['cola_max'] = cola_max
+        instrumentos.resumen(estadisticas)
+    return OptVC, times
+
+
+def buscar(G, T, estrategia='dfs', inicial=None, estadisticas=None, desempate='menor', seed=None, cotas='maxdeg',
+           reducciones=(), instrumentos=None, memoria=0, cola=128):
+    '''
+    Ejecuta la estrategia elegida, opcionalmente desde una cobertura inicial ('greedy' o 'ls');
+    devuelve (OptVC, times) como BnB()
+    memoria es el tope de la tabla de transposición ('dfs') y cola el de la cola de 'mejor', ambos en MiB
+    '''
+    if instrumentos is None:
+        instrumentos = Instrumentos()
+    start_time = time.time()
+    times = []
+    semilla = None
+    if inicial is not None:
+        semilla = cobertura_inicial(G, inicial, T, seed)
+        times.append((len(semilla), time.time() - start_time))
+        instrumentos.imprimir(1, 'Cobertura inicial (%s): %i vertices' % (inicial, len(semilla)))
+
+    argumentos = (G, T, estadisticas, desempate, seed, cotas, reducciones)
+    if estrategia == 'dfs':
+        OptVC, sub_times = BnB(*argumentos, start_time=start_time, instrumentos=instrumentos, memoria=memoria,
+                               inicial=semilla)
+    elif estrategia == 'lds':
+        OptVC, sub_times = lds(*argumentos, inicial=semilla, start_time=start_time, instrumentos=instrumentos)
+    else:
+        OptVC, sub_times = mejor_primero(*argumentos, inicial=semilla, start_time=start_time,
+                                         instrumentos=instrumentos, memoria=cola)
+    times.extend(sub_times)
+    return OptVC, times
@@ -0,0 +1,326 @@
+'''
+Este archivo implementa un Grafo compacto para los algoritmos de cobertura mínima de vértices.
+
+El Grafo se almacena en formato CSR (compressed sparse row): el arreglo "offsets" indica, para cada vértice v,
+el rango offsets[v]:offsets[v+1] del arreglo "vecinos" que contiene su lista de adyacencia.
+La estructura no cambia durante la búsqueda; en su lugar se mantienen banderas de vértices eliminados y
+contadores de grado vivos, de modo que eliminar o restaurar un vértice cuesta O(grado).
+
+Los vértices se numeran de 1 a n como en los archivos de datos; la posición 0 no se utiliza.
+
+Language: Python 3
+'''
+
+from array import array
+from heapq import heapify, heappop, heappush
+
+import azar
+
+# POLITICAS DE DESEMPATE ENTRE VERTICES DE GRADO MAXIMO
+DESEMPATES = ('menor', 'aleatorio')
+
+# cantidad de vértices a partir de la cual un balde mantiene un heap para el desempate
+BALDE_CHICO = 32
+
+
+def claves_desempate(n, desempate='menor', seed=None):
+    '''
+    Clave de cada posición 0..n-1 para el desempate entre vértices de grado máximo: la identidad con 'menor' y una
+    permutación aleatoria (reproducible con seed) con 'aleatorio'
+    '''
+    clave = list(range(n))
+    if desempate == 'aleatorio':
+        azar.python(seed).shuffle(clave)
+    return clave
+
+
+class BaldesGrado:
+    '''
+    Cola de baldes por grado: baldes[d] contiene los vértices vivos de grado d.
+    Mover un vértice entre baldes cuesta O(1) (intercambio con el último del balde), de modo que el
+    vértice de grado máximo se obtiene sin ordenar la lista de grados.
+    El desempate elige el vértice de menor clave del balde: clave[v] = v con 'menor' y una permutación aleatoria
+    de los vértices con 'aleatorio'. Así la elección depende sólo del Grafo restante, y no del orden de los
+    baldes ni de los sorteos hechos en otras ramas (las podas de BnB en paralelo dependen del tiempo).
+    Un balde de grado máximo con más de BALDE_CHICO vértices pasa a tener además un heap de claves
+    (monticulos[d]) con borrado perezoso: quitar un vértice no lo saca del heap, y maximo() descarta las
+    entradas de la cima que ya no están en el balde. Cuando un heap acumula más del doble de entradas que su balde
+    se descarta, y maximo() lo vuelve a armar si el balde vuelve a ser el de grado máximo: el armado cuesta
+    O(len(balde)), pagado por las inserciones que hicieron crecer el heap, y los baldes que ya no se consultan
+    dejan de recibir inserciones. Así maximo() cuesta O(1) amortizado aunque el balde tenga O(n) vértices (Grafos
+    casi regulares, o el final de la búsqueda con casi todos los vértices de grado 1 o 2).
+    '''
+
+    def __init__(self, grado, eliminado, desempate='menor', seed=None):
+        self.baldes = [[] for d in range(max(grado) + 1)]
+        self.monticulos = [None] * (max(grado) + 1)
+        # posición de cada vértice dentro de su balde
+        self.pos = [0] * len(grado)
+        self.dmax = 0
+        for v in range(len(grado)):
+            if not eliminado[v]:
+                self.insertar(v, grado[v])
+        self.configurar(desempate, seed)
+
+    def configurar(self, desempate='menor', seed=None):
+        '''
+        Establece la política de desempate: 'menor' (menor id) o 'aleatorio' (un orden aleatorio de los vértices,
+        reproducible con seed)
+        '''
+        if desempate not in DESEMPATES:
+            raise ValueError('Politica de desempate desconocida: %s' % desempate)
+        self.desempate = desempate
+        self.clave = claves_desempate(len(self.pos), desempate, seed)
+        # vertice[k] es el vértice de clave k
+        self.vertice = [0] * len(self.clave)
+        for v, k in enumerate(self.clave):
+            self.vertice[k] = v
+        # los heaps están ordenados por la clave anterior
+        self.monticulos = [None] * len(self.baldes)
+
+    def copy(self):
+        b = BaldesGrado.__new__(BaldesGrado)
+        b.baldes = [balde.copy() for balde in self.baldes]
+        b.monticulos = [None if monticulo is None else monticulo.copy() for monticulo in self.monticulos]
+        b.pos = self.pos.copy()
+        b.dmax = self.dmax
+        b.desempate = self.desempate
+        # las claves no cambian durante la búsqueda: se comparten
+        b.clave = self.clave
+        b.vertice = self.vertice
+        return b
+
+    def insertar(self, v, d):
+        balde = self.baldes[d]
+        self.pos[v] = len(balde)
+        balde.append(v)
+        monticulo = self.monticulos[d]
+        if monticulo is not None:
+            heappush(monticulo, self.clave[v])
+            if len(monticulo) > 2 * len(balde) + 8:
+                self.monticulos[d] = None
+        if d > self.dmax:
+            self.dmax = d
+
+    def quitar(self, v, d):
+        balde = self.baldes[d]
+        ultimo = balde.pop()
+        if ultimo != v:
+            i = self.pos[v]
+            balde[i] = ultimo
+            self.pos[ultimo] = i
+
+    def grado_maximo(self):
+        '''
+        Devuelve el grado máximo entre los vértices vivos
+        '''
+        baldes = self.baldes
+        while self.dmax > 0 and not baldes[self.dmax]:
+            self.dmax -= 1
+        return self.dmax
+
+    def maximo(self):
+        '''
+        Devuelve la tupla (vértice, grado) de grado máximo; entre los de igual grado, el de menor clave.
+        Es el mínimo de un balde chico o la cima del heap del balde, una vez descartadas las entradas de vértices
+        que salieron de él.
+        '''
+        d = self.grado_maximo()
+        balde = self.baldes[d]
+        if not balde:
+            return (-1, -1)
+        monticulo = self.monticulos[d]
+        if monticulo is None:
+            if len(balde) <= BALDE_CHICO:
+                if self.desempate == 'menor':
+                    return (min(balde), d)
+                return (min(balde, key=self.clave.__getitem__), d)
+            clave = self.clave
+            monticulo = self.monticulos[d] = [clave[v] for v in balde]
+            heapify(monticulo)
+        pos = self.pos
+        vertice = self.vertice
+        v = vertice[monticulo[0]]
+        while pos[v] >= len(balde) or balde[pos[v]] != v:
+            heappop(monticulo)
+            v = vertice[monticulo[0]]
+        return (v, d)
+
+
+class Grafo:
+    '''
+    Grafo no dirigido en formato CSR con eliminación y restauración de vértices en O(grado).
+    Mantiene además una cola de baldes por grado (atributo baldes) actualizada en cada cambio.
+    '''
+
+    def __init__(self, n, offsets, vecinos):
+        '''
+        n: cantidad de vértices; offsets: arreglo de n+2 posiciones; vecinos: arreglo de 2|E| posiciones
+        '''
+        self.n = n
+        self.offsets = offsets
+        self.vecinos = vecinos
+        # grado vivo de cada vértice (cantidad de vecinos no eliminados)
+        self.grado = [offsets[v + 1] - offsets[v] for v in range(n + 1)]
+        # eliminado[v] == 1 si v fue eliminado del Grafo restante
+        self.eliminado = bytearray(n + 1)
+        self.eliminado[0] = 1
+        self.num_aristas = len(vecinos) // 2
+        self.num_vertices = n
+        self.baldes = BaldesGrado(self.grado, self.eliminado)
+
+    @classmethod
+    def desde_lista_adyacencia(cls, adj_list):
+        '''
+        Crea el Grafo a partir de la lista de adyacencia leída del archivo de entrada (fila i = vértice i+1)
+        '''
+        n = len(adj_list)
+        offsets = array('i', [0, 0])
+        vecinos = array('i')
+        for fila in adj_list:
+            vecinos.extend(fila)
+            offsets.append(len(vecinos))
+        return cls(n, offsets, vecinos)
+
+    @classmethod
+    def desde_csr(cls, datos):
+        '''
+        Crea el Grafo a partir de un cargador.GrafoCSR (offsets y vecinos de numpy, ids desde 0)
+        '''
+        offsets = array('i', [0])
+        offsets.frombytes(datos.offsets.astype('int32').tobytes())
+        vecinos = array('i')
+        vecinos.frombytes((datos.vecinos + 1).astype('int32').tobytes())
+        return cls(datos.n, offsets, vecinos)
+
+    def copy(self):
+        '''
+        Devuelve una copia del Grafo; la estructura CSR se comparte porque nunca se modifica
+        '''
+        g = Grafo.__new__(Grafo)
+        g.n = self.n
+        g.offsets = self.offsets
+        g.vecinos = self.vecinos
+        g.grado = self.grado.copy()
+        g.eliminado = bytearray(self.eliminado)
+        g.num_aristas = self.num_aristas
+        g.num_vertices = self.num_vertices
+        g.baldes = self.baldes.copy()
+        return g
+
+    def __str__(self):
+        return 'Grafo con %i vertices y %i aristas' % (self.num_vertices, self.num_aristas)
+
+    def number_of_nodes(self):
+        return self.num_vertices
+
+    def number_of_edges(self):
+        return self.num_aristas
+
+    def degree(self, v):
+        return self.grado[v]
+
+    def nodes(self):
+        '''
+        Devuelve los vértices no eliminados
+        '''
+        eliminado = self.eliminado
+        return [v for v in range(1, self.n + 1) if not eliminado[v]]
+
+    def all_neighbors(self, v):
+        '''
+        Devuelve todos los vecinos de v en el Grafo original
+        '''
+        return self.vecinos[self.offsets[v]:self.offsets[v + 1]]
+
+    def neighbors(self, v):
+        '''
+        Devuelve los vecinos de v que no fueron eliminados
+        '''
+        eliminado = self.eliminado
+        return [u for u in self.vecinos[self.offsets[v]:self.offsets[v + 1]] if not eliminado[u]]
+
+    def edges(self):
+        '''
+        Devuelve las aristas (u, v) con u < v entre vértices no eliminados
+        '''
+        eliminado = self.eliminado
+        return [(u, v) for u in range(1, self.n + 1) if not eliminado[u]
+                for v in self.vecinos[self.offsets[u]:self.offsets[u + 1]] if u < v and not eliminado[v]]
+
+    def remove_node(self, v):
+        '''
+        Elimina v del Grafo restante, actualizando el grado de sus vecinos vivos
+        '''
+        eliminado = self.eliminado
+        grado = self.grado
+        baldes = self.baldes
+        eliminado[v] = 1
+        baldes.quitar(v, grado[v])
+        # cada vecino vivo pasa del balde d al d-1 (quitar e insertar de BaldesGrado, sin las llamadas)
+        cubos = baldes.baldes
+        monticulos = baldes.monticulos
+        pos = baldes.pos
+        clave = baldes.clave
+        for u in self.vecinos[self.offsets[v]:self.offsets[v + 1]]:
+            if not eliminado[u]:
+                d = grado[u]
+                balde = cubos[d]
+                ultimo = balde.pop()
+                if ultimo != u:
+                    i = pos[u]
+                    balde[i] = ultimo
+                    pos[ultimo] = i
+                balde = cubos[d - 1]
+                pos[u] = len(balde)
+                balde.append(u)
+                monticulo = monticulos[d - 1]
+                if monticulo is not None:
+                    heappush(monticulo, clave[u])
+                    if len(monticulo) > 2 * len(balde) + 8:
+                        monticulos[d - 1] = None
+                grado[u] = d - 1
+        self.num_aristas -= grado[v]
+        self.num_vertices -= 1
+
+    def restore_node(self, v):
+        '''
+        Restaura v al Grafo restante, recalculando su grado a partir de los vecinos vivos
+        '''
+        eliminado = self.eliminado
+        grado = self.grado
+        baldes = self.baldes
+        # cada vecino vivo pasa del balde du al du+1 (quitar e insertar de BaldesGrado, sin las llamadas)
+        cubos = baldes.baldes
+        monticulos = baldes.monticulos
+        pos = baldes.pos
+        clave = baldes.clave
+        dmax = baldes.dmax
+        d = 0
+        for u in self.vecinos[self.offsets[v]:self.offsets[v + 1]]:
+            if not eliminado[u]:
+                du = grado[u]
+                balde = cubos[du]
+                ultimo = balde.pop()
+                if ultimo != u:
+                    i = pos[u]
+                    balde[i] = ultimo
+                    pos[ultimo] = i
+                balde = cubos[du + 1]
+                pos[u] = len(balde)
+                balde.append(u)
+                monticulo = monticulos[du + 1]
+                if monticulo is not None:
+                    heappush(monticulo, clave[u])
+                    if len(monticulo) > 2 * len(balde) + 8:
+                        monticulos[du + 1] = None
+                grado[u] = du + 1
+                if du >= dmax:
+                    dmax = du + 1
+                d += 1
+        baldes.dmax = dmax
+        eliminado[v] = 0
+        grado[v] = d
+        baldes.insertar(v, d)
+        self.num_aristas += d
+        self.num_vertices += 1
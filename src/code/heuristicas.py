@@ -0,0 +1,135 @@
+'''
+Este archivo implementa heurísticas de tiempo lineal para obtener coberturas en milisegundos.
+
+- emparejamiento(): emparejamiento maximal voraz; los dos extremos de cada arista emparejada forman una
+  cobertura de a lo sumo el doble del óptimo (2-aproximación).
+- voraz(): toma siempre el vértice de grado máximo en el grafo restante. Los vértices se guardan en baldes
+  por grado con borrado perezoso: al bajar el grado de un vértice se lo agrega al balde nuevo y las entradas
+  viejas se descartan al sacarlas, por lo que el costo total es O(|V| + |E|).
+- voraz_redundantes(): voraz() seguido de quitar_redundantes(), que saca de la cobertura los vértices con
+  todos sus vecinos en ella (de menor a mayor grado).
+
+Todas reciben el Grafo en formato CSR (offsets, vecinos) con los vértices 0..len(offsets)-2 y, opcionalmente,
+la máscara eliminado de grafo.Grafo para trabajar sobre el Grafo restante. Devuelven la lista de vértices de
+la cobertura. Las usan Greedy.py (solver), BnB (UpperBound inicial, ver estrategias.py) y Approx.py
+(individuos iniciales de la población).
+
+Language: Python 3
+'''
+
+import collections
+
+
+def listas(offsets, vecinos):
+    '''
+    Convierte arreglos de numpy en listas (recorrerlas desde Python es más rápido)
+    '''
+    if hasattr(offsets, 'tolist'):
+        offsets = offsets.tolist()
+    if hasattr(vecinos, 'tolist'):
+        vecinos = vecinos.tolist()
+    return offsets, vecinos
+
+
+def emparejamiento(offsets, vecinos, eliminado=None):
+    '''
+    Cobertura por emparejamiento maximal (2-aproximación)
+    '''
+    offsets, vecinos = listas(offsets, vecinos)
+    n = len(offsets) - 1
+    cubierto = bytearray(eliminado) if eliminado is not None else bytearray(n)
+    cobertura = []
+    for v in range(n):
+        if cubierto[v]:
+            continue
+        for u in vecinos[offsets[v]:offsets[v + 1]]:
+            if not cubierto[u]:
+                cubierto[u] = cubierto[v] = 1
+                cobertura.append(v)
+                cobertura.append(u)
+                break
+    return cobertura
+
+
+def voraz(offsets, vecinos, eliminado=None):
+    '''
+    Cobertura voraz por grado máximo con baldes de grado
+    '''
+    offsets, vecinos = listas(offsets, vecinos)
+    n = len(offsets) - 1
+    quitado = bytearray(eliminado) if eliminado is not None else bytearray(n)
+    grado = [0] * n
+    for v in range(n):
+        if not quitado[v]:
+            grado[v] = sum(1 for u in vecinos[offsets[v]:offsets[v + 1]] if not quitado[u])
+    dmax = max(grado) if n else 0
+    baldes = [[] for _ in range(dmax + 1)]
+    for v in range(n):
+        if grado[v]:
+            baldes[grado[v]].append(v)
+
+    cobertura = []
+    d = dmax
+    while d > 0:
+        balde = baldes[d]
+        if not balde:
+            d -= 1
+            continue
+        v = balde.pop()
+        if quitado[v] or grado[v] != d:  # entrada vieja
+            continue
+        quitado[v] = 1
+        cobertura.append(v)
+        for u in vecinos[offsets[v]:offsets[v + 1]]:
+            if not quitado[u]:
+                du = grado[u] - 1
+                grado[u] = du
+                if du:
+                    baldes[du].append(u)
+    return cobertura
+
+
+def quitar_redundantes(offsets, vecinos, cobertura, eliminado=None):
+    '''
+    Quita de la cobertura, de menor a mayor grado, los vértices cuyos vecinos (vivos) están todos en ella
+    '''
+    offsets, vecinos = listas(offsets, vecinos)
+    en_c = bytearray(len(offsets) - 1)
+    for v in cobertura:
+        en_c[v] = 1
+    if eliminado is not None:
+        # los vértices eliminados no tienen aristas que cubrir
+        for v in range(len(en_c)):
+            if eliminado[v]:
+                en_c[v] = 1
+    for v in sorted(cobertura, key=lambda x: offsets[x + 1] - offsets[x]):
+        if all(en_c[u] for u in vecinos[offsets[v]:offsets[v + 1]]):
+            en_c[v] = 0
+    return [v for v in cobertura if en_c[v]]
+
+
+def voraz_redundantes(offsets, vecinos, eliminado=None):
+    '''
+    Cobertura voraz sin vértices redundantes
+    '''
+    return quitar_redundantes(offsets, vecinos, voraz(offsets, vecinos, eliminado), eliminado)
+
+
+HEURISTICAS = collections.OrderedDict([
+    ('emparejamiento', emparejamiento),
+    ('voraz', voraz),
+    ('voraz_redundantes', voraz_redundantes),
+])
+
+
+def mejor_heuristica(offsets, vecinos, eliminado=None, nombres=HEURISTICAS):
+    '''
+    Ejecuta las heurísticas indicadas y devuelve (nombre, cobertura) de la menor cobertura
+    '''
+    offsets, vecinos = listas(offsets, vecinos)
+    mejor = None
+    for nombre in nombres:
+        cobertura = HEURISTICAS[nombre](offsets, vecinos, eliminado)
+        if mejor is None or len(cobertura) < len(mejor[1]):
+            mejor = (nombre, cobertura)
+    return mejor
@@ -0,0 +1,204 @@
+'''
+Este archivo implementa la instrumentación opcional de la búsqueda BnB.
+
+Instrumentos reúne lo que BnB() puede registrar además de 'nodos' y 'podas':
+- verbosidad: 0 no imprime nada, 1 imprime los mensajes habituales (UpperBound inicial, mejoras, cutoff),
+  2 agrega un resumen de la instrumentación al terminar.
+- histograma de profundidad de retroceso: cantidad de ramas cerradas (hoja o poda) en cada nivel del árbol.
+- tiempos acumulados en aplicar, cotas, ramificar y deshacer (tiempos=True). Se miden envolviendo las funciones
+  antes de entrar al ciclo, de modo que sin tiempos el ciclo llama a las funciones originales.
+- flujo de estadísticas en formato JSON lines: una línea cada 'intervalo' segundos con nodos, podas, tamaño de la
+  frontera, UpperBound y profundidad actual.
+- perfilado de la ejecución completa con cProfile o por muestreo (ver perfilar()).
+
+Con los valores por defecto no hay flujo, tiempos ni histograma y el ciclo de BnB sólo paga una comparación
+de tiempo por nodo.
+
+Language: Python 3
+'''
+
+import collections
+import cProfile
+import json
+import os
+import pstats
+import signal
+import time
+
+PERFILES = ('cprofile', 'muestreo')
+
+
+class Instrumentos:
+    '''
+    Configuración y acumuladores de la instrumentación de BnB()
+    '''
+
+    def __init__(self, verbosidad=1, flujo=None, intervalo=1.0, tiempos=False, histograma=False):
+        self.verbosidad = verbosidad
+        self.flujo = flujo
+        self.intervalo = intervalo
+        self.tiempos = dict((nombre, 0.0) for nombre in ('aplicar', 'cotas', 'ramificar', 'deshacer')) \
+            if tiempos else None
+        self.histograma = collections.Counter() if histograma else None
+        self.frontera_max = 0
+        self._archivo = None
+
+    def configuracion(self):
+        '''
+        Argumentos para crear unos Instrumentos equivalentes y vacíos (p. ej. en cada proceso de paralelo.py)
+        '''
+        return dict(verbosidad=self.verbosidad, flujo=self.flujo,
+                    intervalo=self.intervalo, tiempos=self.tiempos is not None,
+                    histograma=self.histograma is not None)
+
+    def imprimir(self, nivel, *args):
+        if self.verbosidad >= nivel:
+            print(*args)
+
+    def cronometrar(self, nombre, funcion):
+        '''
+        Devuelve funcion envuelta para acumular su tiempo en tiempos[nombre]; sin tiempos devuelve funcion
+        '''
+        if self.tiempos is None:
+            return funcion
+        tiempos = self.tiempos
+        reloj = time.perf_counter
+
+        def cronometrada(*args):
+            inicio = reloj()
+            resultado = funcion(*args)
+            tiempos[nombre] += reloj() - inicio
+            return resultado
+        return cronometrada
+
+    def abrir(self):
+        '''
+        Abre el flujo JSON lines (ruta de archivo, '-' para la salida estándar o un archivo ya abierto)
+        '''
+        if self.flujo is None or self._archivo is not None:
+            return
+        if self.flujo == '-':
+            self._archivo = None
+        elif isinstance(self.flujo, str):
+            self._archivo = open(self.flujo, 'a')
+        else:
+            self._archivo = self.flujo
+
+    def cerrar(self):
+        if self._archivo is not None and isinstance(self.flujo, str):
+            self._archivo.close()
+        self._archivo = None
+
+    def emitir(self, t, nodos, podas, frontera, upper, profundidad, evento='progreso'):
+        '''
+        Escribe una línea del flujo de estadísticas
+        '''
+        self.frontera_max = max(self.frontera_max, frontera)
+        if self.flujo is None:
+            return
+        linea = {'evento': evento, 'pid': os.getpid(), 't': round(t, 4), 'nodos': nodos, 'podas': dict(podas),
+                 'frontera': frontera, 'frontera_max': self.frontera_max, 'upper': upper,
+                 'profundidad': profundidad}
+        if self.tiempos is not None:
+            linea['tiempos'] = dict((k, round(v, 4)) for k, v in self.tiempos.items())
+        if self.histograma is not None:
+            linea['histograma'] = dict(sorted(self.histograma.items()))
+        texto = json.dumps(linea)
+        if self._archivo is None:
+            print(texto, flush=True)
+        else:
+            self._archivo.write(texto + '\n')
+            self._archivo.flush()
+
+    def resumen(self, estadisticas):
+        '''
+        Copia los acumuladores en el diccionario de estadísticas de BnB() e imprime un resumen (verbosidad 2)
+        '''
+        if self.flujo is not None:
+            estadisticas['frontera_max'] = self.frontera_max
+        if self.tiempos is not None:
+            estadisticas['tiempos'] = dict(self.tiempos)
+        if self.histograma is not None:
+            estadisticas['histograma'] = dict(sorted(self.histograma.items()))
+        imprimir_resumen(estadisticas, self.verbosidad)
+
+
+def imprimir_resumen(estadisticas, verbosidad):
+    if verbosidad < 2:
+        return
+    if 'frontera_max' in estadisticas:
+        print('Frontera máxima:', estadisticas['frontera_max'])
+    for nombre, segundos in estadisticas.get('tiempos', {}).items():
+        print('Tiempo en %s: %.3f s' % (nombre, segundos))
+    if 'histograma' in estadisticas:
+        print('Retrocesos por profundidad:', dict(sorted(estadisticas['histograma'].items())))
+
+
+def combinar(total, estadisticas):
+    '''
+    Acumula en total la instrumentación de un subproblema (tiempos e histograma se suman, la frontera máxima
+    es el máximo)
+    '''
+    if 'frontera_max' in estadisticas:
+        total['frontera_max'] = max(total.get('frontera_max', 0), estadisticas['frontera_max'])
+    if 'tiempos' in estadisticas:
+        tiempos = total.setdefault('tiempos', {})
+        for nombre, segundos in estadisticas['tiempos'].items():
+            tiempos[nombre] = tiempos.get(nombre, 0.0) + segundos
+    if 'histograma' in estadisticas:
+        histograma = total.setdefault('histograma', {})
+        for profundidad, cantidad in estadisticas['histograma'].items():
+            histograma[profundidad] = histograma.get(profundidad, 0) + cantidad
+
+
+class Muestreo:
+    '''
+    Perfilador por muestreo: cada 'intervalo' segundos de CPU (SIGPROF) registra la función y línea en ejecución.
+    Sólo funciona en el hilo principal de sistemas POSIX
+    '''
+
+    def __init__(self, intervalo=0.005):
+        self.intervalo = intervalo
+        self.muestras = collections.Counter()
+
+    def _registrar(self, sig, frame):
+        if frame is not None:
+            codigo = frame.f_code
+            self.muestras[(os.path.basename(codigo.co_filename), codigo.co_name, frame.f_lineno or 0)] += 1
+
+    def enable(self):
+        self._anterior = signal.signal(signal.SIGPROF, self._registrar)
+        signal.setitimer(signal.ITIMER_PROF, self.intervalo, self.intervalo)
+
+    def disable(self):
+        signal.setitimer(signal.ITIMER_PROF, 0, 0)
+        signal.signal(signal.SIGPROF, self._anterior)
+
+    def escribir(self, archivo, cantidad=20):
+        total = sum(self.muestras.values()) or 1
+        filas = ['%6.2f%% %6i  %s:%i %s' % (100 * c / total, c, f, l, n)
+                 for (f, n, l), c in self.muestras.most_common()]
+        with open(archivo, 'w') as f:
+            f.write('\n'.join(filas) + '\n')
+        print('\n'.join(filas[:cantidad]))
+
+
+def perfilar(tipo, archivo, funcion, *args, **kwargs):
+    '''
+    Ejecuta funcion(*args, **kwargs) bajo el perfilador elegido ('cprofile' o 'muestreo') y guarda el resultado
+    en archivo (estadísticas de pstats o tabla de muestras); devuelve el resultado de funcion
+    '''
+    directorio = os.path.dirname(archivo)
+    if directorio:
+        os.makedirs(directorio, exist_ok=True)
+    perfil = cProfile.Profile() if tipo == 'cprofile' else Muestreo()
+    perfil.enable()
+    try:
+        return funcion(*args, **kwargs)
+    finally:
+        perfil.disable()
+        if tipo == 'cprofile':
+            perfil.dump_stats(archivo)
+            pstats.Stats(archivo).sort_stats('cumulative').print_stats(20)
+        else:
+            perfil.escribir(archivo)
@@ -0,0 +1,185 @@
+'''
+Este archivo implementa el algoritmo genético de Approx.py con el modelo de islas en varios procesos.
+
+Cada isla es una población independiente que evoluciona con algoritmo_genetico() en su propio proceso. Cada
+'intervalo' generaciones la isla i publica sus 'migrantes' mejores individuos y recibe los de la isla i-1
+(topología de anillo), que reemplazan a sus peores individuos. Las migraciones están numeradas (épocas): la isla
+i espera a que su vecina publique la misma época y no publica la siguiente hasta que la isla i+1 leyó la
+anterior. Así cada isla recibe siempre los mismos migrantes y, con una cantidad fija de generaciones (-g), la
+corrida es reproducible con la misma semilla y cantidad de islas. Cada isla usa su propio generador derivado
+de la semilla (ver azar.py). Una isla que terminó (por el cutoff) deja de publicar y sus vecinas dejan de
+esperarla.
+
+Los datos compartidos son arreglos de numpy sobre multiprocessing.shared_memory, de modo que migrar es copiar
+filas de una matriz booleana, sin serializar objetos de Python:
+- migrantes: (islas x migrantes x vértices) individuos publicados, con su tamaño y aristas descubiertas.
+- version: última época publicada por cada isla (cada isla escribe su fila bajo su propio lock).
+- leida: última época de cada isla leída por la siguiente; terminada: islas que ya terminaron.
+- poblaciones: (islas x 2 x tamaño x vértices) los dos buffers de población de cada isla (ver
+  algoritmo_genetico()), que evoluciona directamente sobre la memoria compartida.
+- mejores: la mejor cobertura encontrada por cada isla y su tamaño; al terminar se toma la menor (ante un empate,
+  la de la isla de menor índice).
+Cada proceso devuelve sólo su seguimiento [(tamaño, tiempo)] y la cantidad de generaciones; al terminar se
+ordenan por tiempo las mejoras de todas las islas, conservando las estrictas, para escribir el .trace.
+
+Language: Python 3
+### Running: python3 code/Approx.py -inst data/email.graph -time 600 -seed 1 -islas 4 -migracion 10 -migrantes 2
+'''
+
+import multiprocessing
+import time
+from multiprocessing import shared_memory
+
+import numpy
+
+import azar
+from Approx import algoritmo_genetico, mejor_individuo_poblacion_final, reparar
+
+
+class ArreglosCompartidos:
+    '''
+    Arreglos de numpy en un bloque de memoria compartida, creados por el proceso principal y abiertos por nombre
+    en cada isla. formas es una lista de (nombre, forma, dtype)
+    '''
+
+    def __init__(self, formas, nombre=None):
+        self.formas = formas
+        tamanos = [int(numpy.prod(forma)) * numpy.dtype(dtype).itemsize for _, forma, dtype in formas]
+        if nombre is None:
+            self.memoria = shared_memory.SharedMemory(create=True, size=max(1, sum(tamanos)))
+        else:
+            self.memoria = shared_memory.SharedMemory(name=nombre)
+        desplazamiento = 0
+        for (clave, forma, dtype), tamano in zip(formas, tamanos):
+            setattr(self, clave, numpy.ndarray(forma, dtype=dtype, buffer=self.memoria.buf, offset=desplazamiento))
+            desplazamiento += tamano
+
+    def cerrar(self, liberar=False):
+        for clave, forma, dtype in self.formas:
+            delattr(self, clave)
+        self.memoria.close()
+        if liberar:
+            self.memoria.unlink()
+
+
+def formas(islas, tamano, num_vertices, migrantes):
+    return [('migrantes', (islas, migrantes, num_vertices), bool),
+            ('migrantes_fitness', (islas, migrantes, 2), numpy.int64),
+            ('version', (islas,), numpy.int64),
+            ('leida', (islas,), numpy.int64),
+            ('terminada', (islas,), numpy.int64),
+            ('poblaciones', (islas, 2, tamano, num_vertices), bool),
+            ('mejores', (islas, num_vertices), bool),
+            ('mejores_tamano', (islas,), numpy.int64)]
+
+
+def esperar(condicion):
+    while not condicion():
+        time.sleep(ESPERA)
+
+
+# segundos entre consultas mientras una isla espera a su vecina
+ESPERA = 0.0005
+
+# ESTADO DE CADA PROCESO DEL POOL (se inicializa una sola vez por proceso)
+_estado = {}
+
+
+def _inicializar(nombre, forma, locks, configuracion):
+    _estado.update(compartidos=ArreglosCompartidos(forma, nombre), locks=locks, configuracion=configuracion)
+
+
+def _evolucionar(isla, semilla):
+    '''
+    Evoluciona la isla con el generador de la semilla recibida; devuelve (seguimiento, generaciones)
+    '''
+    c = _estado['configuracion']
+    compartidos = _estado['compartidos']
+    locks = _estado['locks']
+    islas = len(locks)
+    vecina = (isla - 1) % islas
+    siguiente = (isla + 1) % islas
+    m = compartidos.migrantes.shape[1]
+
+    def migrar(generacion, poblacion, tamanos, descubiertas):
+        if generacion % c['intervalo'] or islas == 1:
+            return
+        epoca = generacion // c['intervalo']
+        aptitud = tamanos + c['penalizacion'] * descubiertas
+        # PUBLICAR LOS MEJORES, CUANDO LA ISLA SIGUIENTE YA LEYÓ LA ÉPOCA ANTERIOR
+        mejores = numpy.argpartition(aptitud, m - 1)[:m] if m < len(aptitud) else numpy.arange(len(aptitud))
+        mejores = mejores[numpy.argsort(aptitud[mejores], kind='stable')]
+        esperar(lambda: compartidos.leida[isla] >= epoca - 1 or compartidos.terminada[siguiente])
+        with locks[isla]:
+            compartidos.migrantes[isla, :len(mejores)] = poblacion[mejores]
+            compartidos.migrantes_fitness[isla, :len(mejores), 0] = tamanos[mejores]
+            compartidos.migrantes_fitness[isla, :len(mejores), 1] = descubiertas[mejores]
+            compartidos.version[isla] = epoca
+        # RECIBIR LOS DE LA VECINA EN LUGAR DE LOS PEORES (LOS PADRES NO SE REEMPLAZAN)
+        esperar(lambda: compartidos.version[vecina] >= epoca or compartidos.terminada[vecina])
+        if compartidos.version[vecina] < epoca:  # la vecina terminó
+            return
+        k = min(m, len(aptitud) - c['pressure'])
+        with locks[vecina]:
+            if k > 0:
+                peores = c['pressure'] + numpy.argpartition(-aptitud[c['pressure']:], k - 1)[:k]
+                poblacion[peores] = compartidos.migrantes[vecina, :k]
+                tamanos[peores] = compartidos.migrantes_fitness[vecina, :k, 0]
+                descubiertas[peores] = compartidos.migrantes_fitness[vecina, :k, 1]
+            compartidos.leida[vecina] = epoca
+
+    rng = azar.generador(semilla)
+    try:
+        poblacion, aptitud, cobertura, times, generaciones = algoritmo_genetico(
+            c['num_vertices'], c['u'], c['v'], c['tamano'], c['generaciones'], c['porcentaje_mutacion'],
+            c['porcentaje_cruza'], rng, c['pressure'], c['penalizacion'], c['cutoff'], c['start_time'],
+            semillas=c['semillas'], migrar=migrar, buffers=compartidos.poblaciones[isla])
+    finally:
+        compartidos.terminada[isla] = 1
+
+    # Si la isla no produjo ninguna cobertura, se repara su mejor individuo
+    if cobertura is None:
+        individuo, fitness = mejor_individuo_poblacion_final(poblacion, c['u'], c['v'], c['penalizacion'], aptitud)
+        cobertura = reparar(individuo, c['u'], c['v'])
+        times = [(int(cobertura.sum()), time.time() - c['start_time'])]
+    compartidos.mejores[isla] = cobertura
+    compartidos.mejores_tamano[isla] = cobertura.sum()
+    return times, generaciones
+
+
+def ag_islas(num_vertices, u, v, tamano, generaciones, porcentaje_mutacion, porcentaje_cruza, seed, islas,
+             intervalo=10, migrantes=2, pressure=3, penalizacion=2, cutoff=None, start_time=None, semillas=None):
+    '''
+    Algoritmo genético con 'islas' poblaciones en procesos separados y migración cada 'intervalo' generaciones.
+    Devuelve la mejor cobertura (máscara booleana), el seguimiento [(tamaño, tiempo)] y las generaciones de
+    cada isla
+    '''
+    if start_time is None:
+        start_time = time.time()
+    ctx = multiprocessing.get_context()
+    forma = formas(islas, tamano, num_vertices, max(1, min(migrantes, tamano)))
+    compartidos = ArreglosCompartidos(forma)
+    try:
+        compartidos.version[:] = 0
+        compartidos.leida[:] = 0
+        compartidos.terminada[:] = 0
+        locks = [ctx.Lock() for _ in range(islas)]
+        configuracion = dict(num_vertices=num_vertices, u=u, v=v, tamano=tamano, generaciones=generaciones,
+                             porcentaje_mutacion=porcentaje_mutacion, porcentaje_cruza=porcentaje_cruza,
+                             pressure=pressure, penalizacion=penalizacion, cutoff=cutoff, start_time=start_time,
+                             semillas=semillas, intervalo=intervalo)
+        # un generador independiente por isla a partir de la semilla
+        semillas_islas = azar.derivar(seed, islas)
+        with ctx.Pool(islas, initializer=_inicializar,
+                      initargs=(compartidos.memoria.name, forma, locks, configuracion)) as pool:
+            resultados = pool.starmap(_evolucionar, list(enumerate(semillas_islas)))
+
+        # SEGUIMIENTO EN ORDEN GLOBAL DE TIEMPO, CONSERVANDO SÓLO LAS MEJORAS ESTRICTAS
+        times = []
+        for size, t in sorted((mejora for sub_times, _ in resultados for mejora in sub_times), key=lambda x: x[1]):
+            if not times or size < times[-1][0]:
+                times.append((size, t))
+        mejor = int(numpy.argmin(compartidos.mejores_tamano))
+        return compartidos.mejores[mejor].copy(), times, [g for _, g in resultados]
+    finally:
+        compartidos.cerrar(liberar=True)
@@ -0,0 +1,178 @@
+'''
+Este archivo implementa la tabla de transposición (memoización) de BnB y la cache LRU que la sostiene.
+
+En BnB() el mismo Grafo restante se alcanza por distintos órdenes de decisión (p. ej. elegir u y después v, o
+descartar un vecino común que los fuerza a ambos) y se vuelve a resolver desde cero. La tabla guarda, para cada
+Grafo restante ya resuelto, lo que la búsqueda probó sobre él:
+- clave: hash de Zobrist del conjunto de vértices activos (vivos y con grado positivo): el XOR de un entero
+  aleatorio de 64 bits por cada vértice eliminado o aislado. Las aristas del Grafo restante son las del Grafo
+  original entre los vértices activos, así que ese conjunto lo identifica. No alcanza con los eliminados: al
+  ramificar en v una rama elimina v y la otra lo deja aislado, por lo que dos nodos distintos del árbol nunca
+  tendrían el mismo conjunto de eliminados aunque el Grafo restante sea el mismo.
+  La clave se actualiza en forma incremental con las entradas (node, 1) del trail: cada vértice eliminado deja
+  de estar activo, igual que sus vecinos vivos que quedaron con grado 0 (antes tenían a ese vértice de vecino,
+  así que no estaban aislados).
+- valor: (cota, exacta). Al cerrarse el subárbol de un nodo con cobertura parcial de tamaño s, toda cobertura
+  del resto de tamaño menor que UpperBound - s habría mejorado la solución, por lo que el óptimo del Grafo
+  restante es al menos UpperBound - s. Si la última mejora se encontró dentro del subárbol, la cota es el
+  óptimo exacto.
+Al llegar de nuevo al mismo Grafo restante con cobertura parcial s', si s' + cota >= UpperBound se poda.
+
+Las componentes chicas ya se memoizan por forma canónica en componentes.CacheComponentes, que usa la misma LRU.
+
+La tabla tiene un tope de memoria (MiB) convertido a cantidad de entradas con BYTES_ENTRADA; al llenarse se
+desaloja la entrada usada hace más tiempo. Se registran aciertos, fallos, podas y desalojos.
+
+Language: Python 3
+'''
+
+import collections
+import random
+
+# memoria aproximada de una entrada de la tabla (clave de 64 bits, tupla (cota, exacta) y nodo del OrderedDict)
+BYTES_ENTRADA = 240
+
+
+class LRU:
+    '''
+    Diccionario con capacidad máxima que desaloja la entrada usada hace más tiempo
+    '''
+
+    def __init__(self, capacidad):
+        self.capacidad = max(1, capacidad)
+        self.tabla = collections.OrderedDict()
+        self.desalojos = 0
+
+    def __len__(self):
+        return len(self.tabla)
+
+    def get(self, clave):
+        valor = self.tabla.get(clave)
+        if valor is not None:
+            self.tabla.move_to_end(clave)
+        return valor
+
+    def poner(self, clave, valor):
+        tabla = self.tabla
+        if clave in tabla:
+            tabla.move_to_end(clave)
+        elif len(tabla) >= self.capacidad:
+            tabla.popitem(last=False)
+            self.desalojos += 1
+        tabla[clave] = valor
+
+
+class TablaTransposicion:
+    '''
+    Tabla de transposición de BnB() para un Grafo de n vértices, con un tope de 'memoria' MiB
+    '''
+
+    def __init__(self, n, memoria, seed=0):
+        rng = random.Random(seed)
+        self.zobrist = [rng.getrandbits(64) for _ in range(n + 1)]
+        self.tabla = LRU(int(memoria * 2 ** 20) // BYTES_ENTRADA)
+        self.grafo = None
+        self.clave = 0
+        # nodos con el subárbol abierto: (largo del trail, clave, tamaño de la cobertura, mejoras al abrir)
+        self.abiertos = []
+        self.aciertos = 0
+        self.fallos = 0
+        self.podas = 0
+        self.exactas = 0
+
+    def iniciar(self, g):
+        '''
+        Clave del Grafo restante g: XOR de los vértices eliminados o aislados
+        '''
+        self.grafo = g
+        zobrist = self.zobrist
+        clave = 0
+        for v in range(1, g.n + 1):
+            if g.eliminado[v] or g.grado[v] == 0:
+                clave ^= zobrist[v]
+        self.clave = clave
+
+    def avanzar(self, trail, desde):
+        '''
+        Actualiza la clave con las entradas agregadas al trail desde la posición 'desde' (ya aplicadas)
+        '''
+        g = self.grafo
+        eliminado = g.eliminado
+        grado = g.grado
+        offsets = g.offsets
+        vecinos = g.vecinos
+        zobrist = self.zobrist
+        clave = self.clave
+        aislados = set()
+        for v, state in trail[desde:]:
+            if state == 1:
+                clave ^= zobrist[v]
+                for u in vecinos[offsets[v]:offsets[v + 1]]:
+                    if not eliminado[u] and grado[u] == 0:
+                        aislados.add(u)
+        for u in aislados:
+            clave ^= zobrist[u]
+        self.clave = clave
+
+    def retroceder(self, trail, hasta):
+        '''
+        Actualiza la clave con las entradas que se van a deshacer (las posteriores a 'hasta'); se llama antes
+        de deshacer el trail, con el Grafo todavía en el estado posterior, por lo que el cálculo es el mismo
+        que el de avanzar()
+        '''
+        self.avanzar(trail, hasta)
+
+    def consultar(self, margen):
+        '''
+        Devuelve True si el Grafo restante ya se probó sin coberturas de tamaño menor que margen
+        (margen = UpperBound - tamaño de la cobertura parcial)
+        '''
+        entrada = self.tabla.get(self.clave)
+        if entrada is None:
+            self.fallos += 1
+            return False
+        self.aciertos += 1
+        if entrada[0] >= margen:
+            self.podas += 1
+            return True
+        return False
+
+    def abrir(self, largo, size, mejoras):
+        '''
+        Registra un nodo que se ramifica: su subárbol termina cuando se deshace el trail por debajo de largo
+        '''
+        self.abiertos.append((largo, self.clave, size, mejoras))
+
+    def cerrar(self, hasta, UpperBound, mejoras, ultima):
+        '''
+        Guarda la cota de los nodos cuyo subárbol terminó al deshacer el trail hasta el largo 'hasta';
+        mejoras es la cantidad de soluciones encontradas hasta ahora y ultima el tamaño de la última
+        '''
+        abiertos = self.abiertos
+        while abiertos and abiertos[-1][0] > hasta:
+            largo, clave, size, mejoras_al_abrir = abiertos.pop()
+            exacta = mejoras > mejoras_al_abrir and ultima == UpperBound
+            anterior = self.tabla.get(clave)
+            cota = UpperBound - size
+            if anterior is None or cota > anterior[0] or (exacta and not anterior[1]):
+                self.tabla.poner(clave, (cota, exacta))
+                self.exactas += exacta
+
+    def estadisticas(self):
+        consultas = self.aciertos + self.fallos
+        return {'aciertos': self.aciertos, 'fallos': self.fallos, 'podas': self.podas,
+                'tasa': self.aciertos / consultas if consultas else 0.0, 'entradas': len(self.tabla),
+                'exactas': self.exactas, 'desalojos': self.tabla.desalojos}
+
+
+def combinar_memo(total, estadisticas):
+    '''
+    Acumula en total las estadísticas de la tabla de un subproblema (ver paralelo.py y componentes.py)
+    '''
+    if 'memo' not in estadisticas:
+        return
+    memo = total.setdefault('memo', dict((k, 0) for k in estadisticas['memo']))
+    for nombre, cantidad in estadisticas['memo'].items():
+        memo[nombre] += cantidad
+    consultas = memo['aciertos'] + memo['fallos']
+    memo['tasa'] = memo['aciertos'] / consultas if consultas else 0.0
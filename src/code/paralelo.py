@@ -0,0 +1,158 @@
+'''
+Este archivo implementa la búsqueda Branch and Bound en paralelo sobre varios procesos.
+
+El árbol de búsqueda se divide en subproblemas independientes fijando las primeras decisiones de ramificación
+(profundidad k: hasta 2^k subproblemas). Cada subproblema se resuelve con BnB() en un proceso del pool,
+partiendo del trail que lo define. El mejor UpperBound se comparte entre los procesos en memoria compartida,
+de modo que cada uno poda con las soluciones encontradas por los demás.
+
+Cada subproblema poda sólo lo que no alcanza el UpperBound compartido, así que conserva su propia mejor
+cobertura aunque otro proceso haya encontrado antes una del mismo tamaño. Al terminar se elige la menor y, ante
+un empate, la del subproblema de menor índice; con desempate aleatorio cada subproblema usa su propia secuencia
+derivada de la semilla (ver azar.py). Así, en una corrida que termina antes del cutoff, la cobertura del .sol no
+depende del orden en que los procesos resolvieron los subproblemas. El .trace sí depende de ese orden: las
+mejoras se registran con la hora de inicio global y al terminar se ordenan por tiempo.
+
+Language: Python 3
+### Running: python3 code/BnB.py -inst data/jazz.graph -time 600 -workers 8
+'''
+
+import multiprocessing
+import time
+
+import azar
+from BnB import BnB, aplicar, find_maxdeg, undo
+from instrumentos import Instrumentos, combinar, imprimir_resumen
+from memo import combinar_memo
+
+
+class IncumbenteCompartido:
+    '''
+    UpperBound compartido entre procesos: la lectura no toma el lock, la mejora sí
+    '''
+
+    def __init__(self, valor_inicial, ctx=multiprocessing):
+        self.compartido = ctx.RawValue('i', valor_inicial)
+        self.lock = ctx.Lock()
+
+    def valor(self):
+        return self.compartido.value
+
+    def mejorar(self, size):
+        '''
+        Registra size como nuevo UpperBound si mejora el actual; devuelve True si lo mejoró
+        '''
+        with self.lock:
+            if size < self.compartido.value:
+                self.compartido.value = size
+                return True
+            return False
+
+
+def dividir(G, profundidad, reducciones=(), desempate='menor', seed=None):
+    '''
+    Funcion para dividir el árbol de búsqueda fijando las primeras "profundidad" decisiones de ramificación
+    Devuelve la lista de trails (listas de (node,state)) que definen cada subproblema, en el orden de BnB
+    '''
+    CurG = G.copy()
+    CurG.baldes.configurar(desempate, seed)
+    trail = []
+    subproblemas = []
+    # pila de (nivel, node, state); se explora primero state=1 como en BnB
+    pila = []
+    if CurG.number_of_edges() == 0:
+        return [[]]
+    v = find_maxdeg(CurG)[0]
+    pila.append((0, v, 0, 0))
+    pila.append((0, v, 1, 0))
+    while pila:
+        nivel, vi, state, mark = pila.pop()
+        undo(CurG, trail, mark)
+        aplicar(CurG, trail, vi, state, reducciones)
+        if nivel + 1 == profundidad or CurG.number_of_edges() == 0:
+            subproblemas.append(trail.copy())
+        else:
+            vj = find_maxdeg(CurG)[0]
+            pila.append((nivel + 1, vj, 0, len(trail)))
+            pila.append((nivel + 1, vj, 1, len(trail)))
+    return subproblemas
+
+
+# ESTADO DE CADA PROCESO DEL POOL (se inicializa una sola vez por proceso)
+_estado = {}
+
+
+def _inicializar(G, T, start_time, incumbente, opciones, configuracion):
+    _estado.update(G=G, T=T, start_time=start_time, incumbente=incumbente, opciones=opciones,
+                   configuracion=configuracion)
+
+
+def _resolver(trabajo):
+    '''
+    Resuelve un subproblema (prefijo, semilla) con el tiempo que queda hasta el cutoff global
+    '''
+    prefijo, semilla = trabajo
+    restante = _estado['T'] - (time.time() - _estado['start_time'])
+    estadisticas = {}
+    if restante <= 0:
+        return [], [], estadisticas
+    # cada subproblema acumula su propia instrumentación (profundidades relativas a la raíz del subproblema)
+    instrumentos = Instrumentos(**_estado['configuracion'])
+    OptVC, times = BnB(_estado['G'], restante, estadisticas, prefijo=prefijo, incumbente=_estado['incumbente'],
+                       start_time=_estado['start_time'], instrumentos=instrumentos, seed=semilla,
+                       **_estado['opciones'])
+    return OptVC, times, estadisticas
+
+
+def BnB_paralelo(G, T, workers, estadisticas=None, desempate='menor', seed=None, cotas='maxdeg', reducciones=(),
+                 profundidad=None, instrumentos=None, memoria=0):
+    '''
+    Funcion Branch and Bound en paralelo con "workers" procesos; devuelve (OptVC, times) como BnB()
+    Si no se indica profundidad, se usan suficientes subproblemas para repartir la carga (unos 4 por proceso)
+    La instrumentación se replica en cada subproblema (el flujo debe ser una ruta o '-') y se combina al final
+    Con memoria > 0 cada subproblema usa su propia tabla de transposición (ver memo.py) de ese tope en MiB
+    '''
+    if instrumentos is None:
+        instrumentos = Instrumentos()
+    start_time = time.time()
+    if profundidad is None:
+        profundidad = max(1, (4 * workers - 1).bit_length())
+    subproblemas = dividir(G, profundidad, reducciones, desempate, seed)
+    # cada subproblema tiene su propia secuencia aleatoria, sin importar qué proceso lo resuelva
+    trabajos = list(zip(subproblemas, azar.derivar(seed, len(subproblemas))))
+
+    ctx = multiprocessing.get_context()
+    incumbente = IncumbenteCompartido(G.number_of_nodes(), ctx)
+    opciones = dict(desempate=desempate, cotas=cotas, reducciones=reducciones, memoria=memoria)
+
+    OptVC = []
+    mejor = None
+    mejoras = []
+    total = {'nodos': 0, 'podas': {}}
+    configuracion = instrumentos.configuracion()
+    with ctx.Pool(workers, initializer=_inicializar,
+                  initargs=(G, T, start_time, incumbente, opciones, configuracion)) as pool:
+        for sub_VC, sub_times, sub_estadisticas in pool.imap(_resolver, trabajos):
+            # la menor cobertura; ante un empate, la del primer subproblema (se recogen en su orden)
+            if sub_times and (mejor is None or sub_times[-1][0] < mejor):
+                OptVC = sub_VC
+                mejor = sub_times[-1][0]
+            mejoras.extend(sub_times)
+            total['nodos'] += sub_estadisticas.get('nodos', 0)
+            for nombre, cantidad in sub_estadisticas.get('podas', {}).items():
+                total['podas'][nombre] = total['podas'].get(nombre, 0) + cantidad
+            combinar(total, sub_estadisticas)
+            combinar_memo(total, sub_estadisticas)
+
+    # SEGUIMIENTO EN ORDEN GLOBAL DE TIEMPO, CONSERVANDO SÓLO LAS MEJORAS ESTRICTAS
+    times = []
+    for size, t in sorted(mejoras, key=lambda mejora: mejora[1]):
+        if not times or size < times[-1][0]:
+            times.append((size, t))
+
+    if estadisticas is not None:
+        estadisticas.update(total)
+        estadisticas['tiempo'] = time.time() - start_time
+        estadisticas['subproblemas'] = len(subproblemas)
+    imprimir_resumen(total, instrumentos.verbosidad)
+    return OptVC, times
@@ -0,0 +1,281 @@
+'''
+Este archivo implementa las reglas de reducción (kernelización) de la cobertura mínima de vértices.
+
+Hay dos etapas:
+- kernelizar(): preprocesamiento previo a BnB sobre una copia mutable del Grafo (diccionario de conjuntos).
+  Reglas disponibles (REGLAS): grado1 (vértices aislados y colgantes), grado2 (triángulos y plegado de
+  vértices de grado 2), dominacion (si N[v] está contenido en N[u], u está en la cobertura) y lp
+  (kernel de Nemhauser-Trotter a partir de la relajación lineal semi-entera).
+  Las reducciones se registran en un objeto Kernel para reconstruir la cobertura con los ids originales.
+- reducir(): reducciones dentro de la búsqueda, en cada nodo de BnB. Sólo se aplican reglas que eliminan
+  vértices (grado1, triángulos de grado2 y componentes chicas resueltas en forma exacta, ver componentes.py),
+  porque se deshacen con el mismo trail de BnB. El plegado crea vértices nuevos y por eso sólo se aplica en
+  el preprocesamiento.
+
+Language: Python 3
+'''
+
+import time
+from collections import deque
+
+from componentes import separar_componentes
+from cotas import emparejamiento_bipartito
+from grafo import Grafo
+
+REGLAS = ('grado1', 'grado2', 'dominacion', 'lp')
+REGLAS_BUSQUEDA = ('grado1', 'grado2', 'componentes')
+
+
+def elegir_reglas(nombres, disponibles=REGLAS):
+    '''
+    Devuelve la tupla de reglas a partir de una lista separada por comas, p. ej. 'grado1,grado2'
+    '''
+    if isinstance(nombres, str):
+        nombres = [nombre.strip() for nombre in nombres.split(',') if nombre.strip()]
+    desconocidas = [nombre for nombre in nombres if nombre not in disponibles]
+    if desconocidas:
+        raise ValueError('Reglas desconocidas: %s (disponibles: %s)' % (','.join(desconocidas), ','.join(disponibles)))
+    return tuple(nombres)
+
+
+class Kernel:
+    '''
+    Resultado de la kernelización: el Grafo reducido (con vértices renumerados 1..k) y el registro
+    de reducciones necesario para llevar una cobertura del kernel a los ids originales
+    '''
+
+    def __init__(self, grafo, etiquetas, forzados, pliegues, n_original, m_original, tiempo):
+        self.grafo = grafo
+        # etiquetas[i] = id (original o de pliegue) del vértice i del kernel
+        self.etiquetas = etiquetas
+        # vértices que las reglas pusieron en la cobertura
+        self.forzados = forzados
+        # pliegues (v, u, w, z) en el orden en que se aplicaron: v de grado 2 con vecinos u, w plegados en z
+        self.pliegues = pliegues
+        self.n_original = n_original
+        self.m_original = m_original
+        self.tiempo = tiempo
+
+    def offset(self):
+        '''
+        Cantidad de vértices de la cobertura determinados por las reducciones
+        '''
+        return len(self.forzados) + len(self.pliegues)
+
+    def expandir(self, cobertura):
+        '''
+        Convierte una cobertura del kernel (ids 1..k) en una cobertura del Grafo original
+        '''
+        solucion = set(self.etiquetas[v] for v in cobertura)
+        solucion.update(self.forzados)
+        # los pliegues se deshacen en orden inverso: si z está en la cobertura se reemplaza por u y w,
+        # en caso contrario se agrega v
+        for v, u, w, z in reversed(self.pliegues):
+            if z in solucion:
+                solucion.discard(z)
+                solucion.add(u)
+                solucion.add(w)
+            else:
+                solucion.add(v)
+        return sorted(solucion)
+
+    def __str__(self):
+        return 'Kernel con %i vertices y %i aristas (original: %i y %i), %i forzados, %i pliegues, %.2f s' % (
+            self.grafo.number_of_nodes(), self.grafo.number_of_edges(), self.n_original, self.m_original,
+            len(self.forzados), len(self.pliegues), self.tiempo)
+
+
+def a_diccionario(g):
+    '''
+    Devuelve el Grafo restante como diccionario vértice -> conjunto de vecinos (sin vértices aislados)
+    '''
+    return dict((v, set(g.neighbors(v))) for v in g.nodes() if g.degree(v) > 0)
+
+
+def a_grafo(adj):
+    '''
+    Crea un Grafo compacto a partir de un diccionario de conjuntos; devuelve (Grafo, etiquetas)
+    '''
+    etiquetas = [0] + sorted(adj)
+    indice = dict((v, i) for i, v in enumerate(etiquetas))
+    filas = [sorted(indice[u] for u in adj[v]) for v in etiquetas[1:]]
+    return Grafo.desde_lista_adyacencia(filas), etiquetas
+
+
+def solucion_semientera(g):
+    '''
+    Solución óptima semi-entera de la relajación lineal, a partir del emparejamiento máximo del doble
+    cubrimiento bipartito y el teorema de König. Devuelve x2 con x2[v] = 2 * x_v, en {0, 1, 2}.
+    '''
+    pareja_izq, pareja_der = emparejamiento_bipartito(g)
+    eliminado = g.eliminado
+    offsets = g.offsets
+    vecinos = g.vecinos
+    # Z: vértices alcanzables por caminos alternantes desde los izquierdos libres
+    z_izq = bytearray(g.n + 1)
+    z_der = bytearray(g.n + 1)
+    cola = deque()
+    for v in range(1, g.n + 1):
+        if not eliminado[v] and g.grado[v] > 0 and not pareja_izq[v]:
+            z_izq[v] = 1
+            cola.append(v)
+    while cola:
+        v = cola.popleft()
+        for u in vecinos[offsets[v]:offsets[v + 1]]:
+            if not eliminado[u] and not z_der[u]:
+                z_der[u] = 1
+                w = pareja_der[u]
+                if w and not z_izq[w]:
+                    z_izq[w] = 1
+                    cola.append(w)
+    # cobertura bipartita mínima = (izquierda - Z) U (derecha ∩ Z)
+    x2 = [0] * (g.n + 1)
+    for v in range(1, g.n + 1):
+        if not eliminado[v] and g.grado[v] > 0:
+            x2[v] = (0 if z_izq[v] else 1) + (1 if z_der[v] else 0)
+    return x2
+
+
+def kernelizar(G, reglas=REGLAS):
+    '''
+    Aplica las reglas de reducción hasta que ninguna modifica el Grafo y devuelve el Kernel resultante
+    '''
+    inicio = time.time()
+    reglas = elegir_reglas(reglas)
+    adj = a_diccionario(G)
+    forzados = []
+    pliegues = []
+    siguiente_id = [G.n + 1]
+    # cola de vértices cuyo grado bajó y pueden ser candidatos para las reglas de grado 1 y 2
+    pendientes = deque(adj)
+
+    def quitar(v):
+        for u in adj.pop(v):
+            adj[u].discard(v)
+            pendientes.append(u)
+
+    def cubrir(v):
+        forzados.append(v)
+        quitar(v)
+
+    def reglas_grado():
+        cambio = False
+        while pendientes:
+            v = pendientes.popleft()
+            if v not in adj:
+                continue
+            d = len(adj[v])
+            if d == 0:
+                del adj[v]
+            elif d == 1 and 'grado1' in reglas:
+                (u,) = adj[v]
+                cubrir(u)
+                cambio = True
+            elif d == 2 and 'grado2' in reglas:
+                u, w = adj[v]
+                if w in adj[u]:
+                    # triángulo: existe una cobertura mínima con u y w
+                    cubrir(u)
+                    cubrir(w)
+                else:
+                    # plegado: v, u, w se reemplazan por z con vecindad N(u) U N(w) - {v}
+                    z = siguiente_id[0]
+                    siguiente_id[0] += 1
+                    vecindad = (adj[u] | adj[w]) - set((v, u, w))
+                    quitar(v)
+                    quitar(u)
+                    quitar(w)
+                    adj[z] = vecindad
+                    for x in vecindad:
+                        adj[x].add(z)
+                    pendientes.append(z)
+                    pliegues.append((v, u, w, z))
+                cambio = True
+        return cambio
+
+    def regla_dominacion():
+        cambio = False
+        for v in list(adj):
+            if v not in adj:
+                continue
+            for u in list(adj[v]):
+                if u in adj and len(adj[u]) >= len(adj[v]) and adj[v] - {u} <= adj[u]:
+                    # N[v] contenido en N[u]: u está en alguna cobertura mínima
+                    cubrir(u)
+                    cambio = True
+                    if v not in adj:
+                        break
+        return cambio
+
+    def regla_lp():
+        if not adj:
+            return False
+        g, etiquetas = a_grafo(adj)
+        x2 = solucion_semientera(g)
+        cambio = False
+        for i in range(1, g.n + 1):
+            if x2[i] == 2:
+                cubrir(etiquetas[i])
+                cambio = True
+        # los vértices con x = 0 quedan aislados al quitar los de x = 1
+        return cambio
+
+    cambio = True
+    while cambio:
+        cambio = reglas_grado()
+        if 'dominacion' in reglas:
+            cambio = regla_dominacion() or cambio
+        if 'lp' in reglas:
+            cambio = regla_lp() or cambio
+
+    g, etiquetas = a_grafo(adj)
+    return Kernel(g, etiquetas, forzados, pliegues, G.number_of_nodes(), G.number_of_edges(), time.time() - inicio)
+
+
+def reducir(g, trail, reglas=REGLAS_BUSQUEDA, desde=None):
+    '''
+    Aplica en el Grafo restante g las reglas que sólo eliminan vértices: colgantes (el vecino va a la
+    cobertura), vértices de grado 2 cuyos vecinos son adyacentes (ambos vecinos van a la cobertura) y
+    componentes chicas que quedaron separadas por los vértices eliminados desde la posición 'desde' del trail.
+    Cada vértice agregado se anota en el trail como (node, 1). Devuelve la cantidad de vértices agregados.
+    '''
+    baldes = g.baldes.baldes
+    eliminado = g.eliminado
+    offsets = g.offsets
+    vecinos = g.vecinos
+    agregados = 0
+    cambio = True
+    while cambio:
+        cambio = False
+        if 'grado1' in reglas:
+            while len(baldes) > 1 and baldes[1]:
+                v = baldes[1][-1]
+                for u in vecinos[offsets[v]:offsets[v + 1]]:
+                    if not eliminado[u]:
+                        break
+                trail.append((u, 1))
+                g.remove_node(u)
+                agregados += 1
+        if 'grado2' in reglas and len(baldes) > 2:
+            for v in list(baldes[2]):
+                if eliminado[v] or g.grado[v] != 2:
+                    continue
+                u, w = [x for x in vecinos[offsets[v]:offsets[v + 1]] if not eliminado[x]]
+                if g.grado[u] > g.grado[w]:
+                    u, w = w, u
+                if w in vecinos[offsets[u]:offsets[u + 1]]:
+                    trail.append((u, 1))
+                    g.remove_node(u)
+                    trail.append((w, 1))
+                    g.remove_node(w)
+                    agregados += 2
+                    cambio = True
+    if 'componentes' in reglas and desde is not None:
+        # las componentes nuevas sólo pueden contener vecinos de los vértices eliminados en este paso; al
+        # resolverlas quedan sin aristas, por lo que no generan trabajo para las reglas anteriores
+        semillas = []
+        for v, state in trail[desde:]:
+            if state == 1:
+                semillas.extend(u for u in vecinos[offsets[v]:offsets[v + 1]] if not eliminado[u])
+        agregados += separar_componentes(g, trail, semillas)
+    return agregados
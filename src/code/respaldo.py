@@ -0,0 +1,139 @@
+'''
+Este archivo implementa los checkpoints periódicos de las corridas largas de BnB.py y Approx.py.
+
+Con -checkpoint S, el solver guarda su estado cada S segundos en <salida>.ckpt (junto al .sol). Con -resume,
+una corrida con los mismos argumentos continúa desde el último checkpoint: el tiempo transcurrido se descuenta
+del cutoff y el seguimiento (.trace) sigue con los tiempos de la corrida original.
+- BnB(): la frontera, el trail (CurVC), la mejor cobertura y su tamaño, el seguimiento y los contadores. Al
+  reanudar, el Grafo restante se reconstruye rehaciendo el trail (el desempate aleatorio sólo depende de la
+  semilla, ver grafo.BaldesGrado).
+- algoritmo_genetico(): la población, su fitness, el estado del generador, la generación, la mejor cobertura
+  y el seguimiento; Approx.py agrega la corrida actual y el resultado de las corridas anteriores.
+
+El ciclo de búsqueda sólo copia las listas que cambian (la frontera y el trail, o la población) y entrega la
+copia con guardar(). Un hilo de fondo la serializa con pickle en un archivo temporal y lo renombra sobre el
+checkpoint (os.replace). Así la escritura a disco no detiene la búsqueda, y un corte durante la escritura
+nunca deja un checkpoint a medias. Si el hilo todavía está escribiendo, la copia nueva reemplaza a la
+pendiente, porque sólo importa la última. Cada checkpoint guarda una firma con los argumentos de la corrida, y
+cargar() rechaza un checkpoint de otra corrida. Al terminar la corrida (por el cutoff o porque completó la
+búsqueda) y escribir el .sol y el .trace, el checkpoint se borra: un -resume posterior empieza de cero.
+
+Language: Python 3
+### Running: python3 code/BnB.py -inst data/as-22july06.graph -time 3600 -checkpoint 60 -resume
+'''
+
+import os
+import pickle
+import threading
+import time
+
+EXTENSION = '.ckpt'
+
+
+class Respaldo:
+    '''
+    Escritor de checkpoints en un hilo de fondo
+    '''
+
+    def __init__(self, ruta, intervalo, firma, transcurrido=0.0):
+        self.ruta = ruta
+        directorio = os.path.dirname(ruta)
+        if directorio:
+            os.makedirs(directorio, exist_ok=True)
+        self.intervalo = intervalo
+        self.firma = firma
+        # próximo instante (segundos desde el inicio de la corrida) en el que corresponde guardar
+        self.proximo = transcurrido + intervalo
+        self.escritos = 0
+        self.bytes = 0
+        self.segundos = 0.0
+        self.maximo = 0.0
+        # datos que el llamador agrega a cada estado guardado (p. ej. la corrida actual de Approx.py)
+        self.contexto = {}
+        self._pendiente = None
+        self._cerrado = False
+        self._condicion = threading.Condition()
+        self._hilo = threading.Thread(target=self._escribir, daemon=True)
+        self._hilo.start()
+
+    def toca(self, t):
+        '''
+        True si en el instante t corresponde guardar un checkpoint
+        '''
+        return t >= self.proximo
+
+    def guardar(self, estado, t):
+        '''
+        Entrega al hilo de fondo el estado (ya copiado, no se vuelve a modificar) del instante t
+        '''
+        self.proximo = t + self.intervalo
+        if self.contexto:
+            estado = dict(estado, **self.contexto)
+        with self._condicion:
+            self._pendiente = estado
+            self._condicion.notify()
+
+    def _escribir(self):
+        while True:
+            with self._condicion:
+                while self._pendiente is None and not self._cerrado:
+                    self._condicion.wait()
+                if self._pendiente is None:
+                    return
+                estado, self._pendiente = self._pendiente, None
+            inicio = time.time()
+            temporal = self.ruta + '.tmp'
+            with open(temporal, 'wb') as f:
+                pickle.dump({'firma': self.firma, 'estado': estado}, f, pickle.HIGHEST_PROTOCOL)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temporal, self.ruta)
+            duracion = time.time() - inicio
+            self.escritos += 1
+            self.bytes = os.path.getsize(self.ruta)
+            self.segundos += duracion
+            self.maximo = max(self.maximo, duracion)
+
+    def cerrar(self):
+        '''
+        Espera a que se escriba el último checkpoint pendiente y termina el hilo
+        '''
+        with self._condicion:
+            self._cerrado = True
+            self._condicion.notify()
+        self._hilo.join()
+
+    def resumen(self):
+        if not self.escritos:
+            return 'Checkpoints: 0 escritos'
+        return 'Checkpoints: %i escritos, %.1f KiB el último, escritura %.1f ms en promedio (máximo %.1f ms)' % (
+            self.escritos, self.bytes / 1024, 1000 * self.segundos / self.escritos, 1000 * self.maximo)
+
+
+def ruta_respaldo(nombre):
+    '''
+    Ruta del checkpoint de la corrida cuyos archivos de salida son nombre.sol y nombre.trace
+    '''
+    return nombre + EXTENSION
+
+
+def cargar(ruta, firma):
+    '''
+    Estado guardado en el checkpoint (None si no existe); ValueError si es de una corrida con otros argumentos
+    '''
+    if not os.path.exists(ruta):
+        return None
+    with open(ruta, 'rb') as f:
+        datos = pickle.load(f)
+    if datos['firma'] != firma:
+        raise ValueError('El checkpoint %s es de una corrida con otros argumentos: %s' % (ruta, datos['firma']))
+    return datos['estado']
+
+
+def borrar(ruta):
+    '''
+    Borra el checkpoint (y su temporal, si quedó) de una corrida terminada, para que -resume no la repita
+    '''
+    for archivo in (ruta, ruta + '.tmp'):
+        if os.path.exists(archivo):
+            os.remove(archivo)
@@ -0,0 +1,86 @@
+'''
+Este archivo centraliza la escritura de los archivos de salida de todos los solvers.
+
+Los archivos se nombran <instancia>_<alg>_<cutoff>[_<seed>] y se escriben por defecto en la carpeta output del
+proyecto (src/output), sin importar el directorio desde el que se ejecute el script:
+*.sol --- tamaño de la cobertura en la primera fila y los vértices (ids desde 1) separados por coma en la segunda.
+*.trace --- una fila 'tiempo,tamaño' por cada mejora encontrada durante la búsqueda.
+leer_sol(), leer_trace() y partes_nombre() leen estos archivos para verificador.py y analisis.py. Aceptan
+también el formato de los archivos de versiones anteriores: trazas con espacio después de la coma
+('0.00, 34') o con el tiempo sin redondear ('0.0005130767822265625,30').
+
+Language: Python 3
+'''
+
+import os
+
+DIRECTORIO_SALIDA = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'output'))
+
+
+def nombre_salida(archivo, alg, cutoff, seed=None, directorio=DIRECTORIO_SALIDA):
+    '''
+    Ruta sin extensión de los archivos de salida de una ejecución
+    '''
+    inputdir, inputfile = os.path.split(archivo)
+    nombre = inputfile.split('.')[0] + '_' + alg + '_' + str(cutoff) + ('_' + str(seed) if seed is not None else '')
+    return os.path.join(directorio, nombre)
+
+
+def escribir_salida(nombre, cobertura, times):
+    '''
+    Escribe nombre.sol (cobertura con ids desde 1) y nombre.trace (times como lista de (tamaño, tiempo))
+    '''
+    directorio = os.path.dirname(nombre)
+    if directorio:
+        os.makedirs(directorio, exist_ok=True)
+
+    with open(nombre + '.sol', 'w') as f:
+        f.write('%i\n' % (len(cobertura)))
+        f.write(','.join([str(x) for x in cobertura]))
+
+    with open(nombre + '.trace', 'w') as f:
+        for t in times:
+            f.write('%.2f,%i\n' % ((t[1]), t[0]))
+
+
+def leer_sol(archivo):
+    '''
+    Devuelve (tamaño declarado en la primera fila, lista de vértices de la segunda fila)
+    '''
+    with open(archivo) as f:
+        tamano = int(f.readline())
+        vertices = [int(x) for x in f.read().replace(',', ' ').split()]
+    return tamano, vertices
+
+
+def leer_trace(archivo):
+    '''
+    Devuelve la lista de (tiempo, tamaño) de un .trace
+    '''
+    filas = []
+    with open(archivo) as f:
+        for linea in f:
+            if linea.strip():
+                t, tamano = linea.split(',')
+                filas.append((float(t), int(tamano)))
+    return filas
+
+
+def partes_nombre(archivo, instancias=()):
+    '''
+    Separa el nombre de un archivo de salida <instancia>_<alg>_<cutoff>[_<seed>] en (instancia, alg, cutoff, seed)
+    instancias son los nombres conocidos: se usa el más largo que sea prefijo del archivo, por si la instancia
+    tiene '_' en el nombre. Devuelve None si el nombre no tiene esa forma
+    '''
+    base = os.path.splitext(os.path.basename(archivo))[0]
+    for inst in sorted(instancias, key=len, reverse=True):
+        if base.startswith(inst + '_'):
+            resto = base[len(inst) + 1:].split('_')
+            break
+    else:
+        inst, _, resto = base.partition('_')
+        resto = resto.split('_')
+    if len(resto) not in (2, 3) or not inst:
+        return None
+    seed = resto[2] if len(resto) == 3 else None
+    return inst, resto[0], resto[1], seed
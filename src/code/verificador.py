@@ -0,0 +1,130 @@
+'''
+Este archivo implementa un verificador de los archivos de solución (.sol) de todos los solvers.
+
+Para cada .sol se carga su instancia (con la cache binaria de cargador.py) y se comprueba en O(|E|) que los
+vértices formen una cobertura: se marca la cobertura en una máscara booleana y se cuentan las aristas (u, v)
+con ~x[u] & ~x[v] sobre los arreglos de extremos de cargador.aristas(), sin ciclos de Python por arista.
+También se informa si el tamaño declarado en la primera fila no coincide con la cantidad de vértices, si hay
+vértices repetidos o fuera del rango 1..n.
+
+La instancia se deduce del nombre <instancia>_<alg>_<cutoff>[_<seed>] buscando <instancia>.graph en la
+carpeta data del proyecto (o en la indicada con -data), o se indica con -inst para todos los archivos.
+
+Language: Python 3
+### Running: python3 code/verificador.py output/*.sol
+### Running: python3 code/verificador.py -inst data/karate.graph output/karate_BnB_600.sol
+
+Sin archivos se verifican todos los .sol de la carpeta output. Termina con código 1 si alguna solución es
+inválida.
+
+### Help: python3 verificador.py --help
+'''
+
+import argparse
+import glob
+import os
+import sys
+import time
+
+import numpy
+
+import cargador
+from salida import DIRECTORIO_SALIDA, leer_sol, partes_nombre
+
+DIRECTORIO_DATOS = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'data'))
+
+
+def instancias(directorio=DIRECTORIO_DATOS):
+    '''
+    Diccionario nombre -> ruta de los archivos .graph del directorio
+    '''
+    return dict((os.path.basename(ruta)[:-len('.graph')], ruta)
+                for ruta in glob.glob(os.path.join(directorio, '*.graph')))
+
+
+def verificar_cobertura(grafo, tamano, vertices, u=None, v=None):
+    '''
+    Verifica la solución (tamaño declarado, vértices con ids desde 1) sobre el GrafoCSR; u, v son los extremos
+    de las aristas si ya se calcularon. Devuelve un diccionario con los errores encontrados (vacío si es válida)
+    '''
+    if u is None:
+        u, v = cargador.aristas(grafo)
+    ids = numpy.asarray(vertices, dtype=numpy.int64)
+    errores = {}
+    if tamano != len(ids):
+        errores['declarado'] = tamano
+    fuera = (ids < 1) | (ids > grafo.n)
+    if fuera.any():
+        errores['fuera_de_rango'] = int(fuera.sum())
+        ids = ids[~fuera]
+    cobertura = numpy.zeros(grafo.n, dtype=bool)
+    cobertura[ids - 1] = True
+    repetidos = len(ids) - int(cobertura.sum())
+    if repetidos:
+        errores['repetidos'] = repetidos
+    descubiertas = numpy.flatnonzero(~cobertura[u] & ~cobertura[v])
+    if len(descubiertas):
+        errores['descubiertas'] = len(descubiertas)
+        primera = descubiertas[0]
+        errores['ejemplo'] = (int(u[primera]) + 1, int(v[primera]) + 1)
+    return errores
+
+
+def describir(errores):
+    if not errores:
+        return 'ok'
+    partes = []
+    if 'descubiertas' in errores:
+        partes.append('%i aristas sin cubrir (p. ej. %i-%i)' % ((errores['descubiertas'],) + errores['ejemplo']))
+    if 'declarado' in errores:
+        partes.append('tamaño declarado %i' % errores['declarado'])
+    if 'fuera_de_rango' in errores:
+        partes.append('%i vértices fuera de rango' % errores['fuera_de_rango'])
+    if 'repetidos' in errores:
+        partes.append('%i vértices repetidos' % errores['repetidos'])
+    return ', '.join(partes)
+
+
+def main(archivos, instancia=None, datos=DIRECTORIO_DATOS):
+    conocidas = instancias(datos)
+    grafos = {}
+    invalidas = 0
+    print('%-40s %8s %9s  %s' % ('ARCHIVO', 'TAMAÑO', 'SEGUNDOS', 'RESULTADO'))
+    for archivo in archivos:
+        ruta = instancia
+        if ruta is None:
+            partes = partes_nombre(archivo, conocidas)
+            ruta = conocidas.get(partes[0]) if partes else None
+        if ruta is None:
+            print('%-40s %8s %9s  %s' % (os.path.basename(archivo), '-', '-', 'instancia desconocida'))
+            invalidas += 1
+            continue
+        inicio = time.time()
+        if ruta not in grafos:
+            grafo = cargador.cargar(ruta)
+            grafos[ruta] = (grafo,) + cargador.aristas(grafo)
+        grafo, u, v = grafos[ruta]
+        try:
+            tamano, vertices = leer_sol(archivo)
+        except (OSError, ValueError) as e:
+            print('%-40s %8s %9s  %s' % (os.path.basename(archivo), '-', '-', 'ilegible: %s' % e))
+            invalidas += 1
+            continue
+        errores = verificar_cobertura(grafo, tamano, vertices, u, v)
+        invalidas += bool(errores)
+        print('%-40s %8i %9.3f  %s' % (os.path.basename(archivo), len(vertices), time.time() - inicio,
+                                       describir(errores)))
+    return invalidas
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(prog='Verificador de soluciones',
+                                     description='Verifica que cada .sol sea una cobertura de vértices de su instancia')
+    parser.add_argument('sol', nargs='*', help='Archivos .sol (por defecto todos los de la carpeta output)')
+    parser.add_argument('-inst', action='store', default=None, type=str,
+                        help='Archivo de Grafo de todas las soluciones (por defecto se deduce del nombre)')
+    parser.add_argument('-data', action='store', default=DIRECTORIO_DATOS, type=str,
+                        help='Directorio de las instancias para deducirlas del nombre')
+    args = parser.parse_args()
+    archivos = args.sol or sorted(glob.glob(os.path.join(DIRECTORIO_SALIDA, '*.sol')))
+    sys.exit(1 if main(archivos, args.inst, args.data) else 0)